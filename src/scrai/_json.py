@@ -0,0 +1,66 @@
+"""JSON encoding shared across ScrAI, using orjson when it is installed.
+
+The standard-library fallback is configured to produce the same output as
+orjson: compact separators, ISO 8601 datetimes and UTF-8 text. Decode errors
+are ``json.JSONDecodeError`` either way (orjson's error subclasses it).
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    ORJSON_AVAILABLE = False
+
+
+def _default(value: Any) -> Any:
+    # Mirror the non-JSON types orjson serializes natively
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(value: Any, *, pretty: bool = False) -> bytes:
+    """Encode ``value`` to UTF-8 JSON bytes.
+
+    ``pretty`` indents by two spaces and sorts keys, matching
+    ``json.dump(indent=2, sort_keys=True)``.
+    """
+
+    if ORJSON_AVAILABLE:
+        if pretty:
+            return orjson.dumps(
+                value,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            )
+        return orjson.dumps(value)
+    if pretty:
+        text = json.dumps(value, default=_default, ensure_ascii=False, indent=2, sort_keys=True)
+    else:
+        text = json.dumps(value, default=_default, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+
+def dumps_text(value: Any) -> str:
+    """Encode ``value`` to a compact JSON string."""
+
+    return dumps(value).decode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode JSON from text or UTF-8 bytes."""
+
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+__all__ = ["ORJSON_AVAILABLE", "dumps", "dumps_text", "loads"]
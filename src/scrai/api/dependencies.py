@@ -14,8 +14,8 @@ from ..data.actor_repository import ActorRepository
 from ..data.event_repository import EventRepository
 from ..data.firestore_client import FirestoreClient
 from ..data.simulation_repository import SimulationRepository
-from ..engine import PhaseEngine
-from ..llm import LLMService, LLMServiceConfig
+from ..engine import PhaseEngine, PhaseEngineConfig
+from ..llm import BatchingLLMService, LLMService, LLMServiceConfig
 from ..scenarios import create_default_scenario_service
 from ..cli.memory import (
     MemoryActionRepository,
@@ -53,7 +53,17 @@ class RuntimeManager:
 
             try:
                 llm_config = LLMServiceConfig.from_env()
-                llm_service: Optional[LLMService] = LLMService(llm_config)
+                llm_service: Optional[LLMService]
+                if settings.llm.max_batch > 1:
+                    # Coalesce completions from concurrently running simulations
+                    llm_service = BatchingLLMService(
+                        llm_config,
+                        max_batch=settings.llm.max_batch,
+                        flush_ms=settings.llm.batch_flush_ms,
+                        coalesce_identical=settings.llm.coalesce_identical,
+                    )
+                else:
+                    llm_service = LLMService(llm_config, coalesce_identical=settings.llm.coalesce_identical)
             except Exception as exc:  # pragma: no cover - configuration edge cases
                 logger.warning("Failed to initialize LLM service: %s", exc)
                 llm_service = None
@@ -85,6 +95,7 @@ class RuntimeManager:
                 action_repository=action_repo,  # type: ignore
                 llm_service=llm_service,
                 scenario_service=scenario_service,
+                config=PhaseEngineConfig.from_settings(settings),
             )
             
             self._runtime = RuntimeContext(
@@ -71,10 +71,7 @@ async def build_simulation_detail(runtime, simulation: SimulationState) -> Simul
 
     pending_actions: List[ActionSummary] = []
     actor_ids: Set[str] = set(simulation.active_actor_ids)
-    for action_id in simulation.pending_action_ids:
-        action = await runtime.action_repository.get(action_id)
-        if not action:
-            continue
+    for action in await runtime.action_repository.get_many(simulation.pending_action_ids):
         actor_ids.add(action.actor_id)
         pending_actions.append(
             ActionSummary(
@@ -92,10 +89,8 @@ async def build_simulation_detail(runtime, simulation: SimulationState) -> Simul
     pending_actions.sort(key=lambda item: item.created_at)
 
     pending_events: List[EventSummary] = []
-    for event_id in simulation.pending_event_ids:
-        event = await runtime.event_repository.get(event_id)
-        if not event:
-            continue
+    for event in await runtime.event_repository.get_many(simulation.pending_event_ids):
+        actor_ids.update(event.affected_actors)
         pending_events.append(
             EventSummary(
                 id=event.id,
@@ -110,16 +105,8 @@ async def build_simulation_detail(runtime, simulation: SimulationState) -> Simul
 
     pending_events.sort(key=lambda item: item.created_at)
 
-    for summary in pending_events:
-        event = await runtime.event_repository.get(summary.id)
-        if event:
-            actor_ids.update(event.affected_actors)
-
     actors: List[ActorSummary] = []
-    for actor_id in actor_ids:
-        actor = await runtime.actor_repository.get(actor_id)
-        if not actor:
-            continue
+    for actor in await runtime.actor_repository.get_many(list(actor_ids)):
         actors.append(
             ActorSummary(
                 id=actor.id,
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from datetime import datetime, timezone
 
 from fastapi import APIRouter, HTTPException, status
 from sse_starlette.sse import EventSourceResponse
 
+from ..._json import dumps_text as _dumps
 from ..dependencies import get_runtime_manager
 from ..schemas import SimulationStreamEvent
 from .simulations import build_simulation_detail, build_simulation_summary
@@ -61,13 +61,13 @@ async def stream_simulation(simulation_id: str) -> EventSourceResponse:
                     }
                     yield {
                         "event": "heartbeat",
-                        "data": json.dumps(heartbeat_payload),
+                        "data": _dumps(heartbeat_payload),
                     }
                     continue
 
                 yield {
                     "event": event.get("event", "message"),
-                    "data": json.dumps(event),
+                    "data": _dumps(event),
                 }
         except asyncio.CancelledError:  # pragma: no cover - server shutdown
             raise
@@ -13,6 +13,7 @@ from ..models import Action, Actor, Event, SimulationState
 from ..models.action import ActionPriority, ActionType
 from ..models.simulation_state import SimulationPhase
 from ..models.actor import ActorType
+from ..scenarios.factory import write_scenario_manifest
 from .runtime import RuntimeContext, build_runtime
 from .store import DEFAULT_STATE_PATH
 
@@ -124,6 +125,14 @@ def cli(ctx: click.Context, backend: str, state_path: Path, project_id: Optional
         click.echo("Using Firestore backend", err=True)
 
 
+@cli.command("gen-scenario-manifest")
+def gen_scenario_manifest() -> None:
+    """Rebuild the scenes manifest used for scenario discovery (run after adding a scene)."""
+
+    entries = write_scenario_manifest()
+    click.echo(f"Wrote {len(entries)} scenario(s) to the scenes manifest: {', '.join(entries) or 'none'}")
+
+
 def main() -> None:  # pragma: no cover - console entrypoint
     cli(auto_envvar_prefix="SCRAI")
 
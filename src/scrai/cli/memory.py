@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Sequence, TypeVar, Generic, Callable
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, TypeVar, Generic, Callable
 
-from ..data.repository import Repository
+from ..data.repository import Repository, RepositoryError
 from ..models import Action, Actor, Event, SimulationState
 from ..models.action import ActionPriority, ActionStatus, ActionType
 from ..models.actor import ActorType
@@ -33,7 +33,7 @@ class MemoryRepository(Generic[T], Repository[T]):
 
     async def create(self, entity: T) -> str:
         payload = self._to_dict(entity)
-        entity_id = payload["id"]
+        entity_id: str = payload["id"]
         self._store.put(self._collection, entity_id, payload)
         return entity_id
 
@@ -41,6 +41,10 @@ class MemoryRepository(Generic[T], Repository[T]):
         payload = self._store.get(self._collection, entity_id)
         return self._from_dict(payload) if payload else None
 
+    async def get_many(self, entity_ids: Sequence[str]) -> List[T]:
+        payloads = (self._store.get(self._collection, entity_id) for entity_id in entity_ids)
+        return [self._from_dict(payload) for payload in payloads if payload]
+
     async def update(self, entity_id: str, updates: Dict[str, Any]) -> bool:
         payload = self._store.get(self._collection, entity_id)
         if payload is None:
@@ -49,6 +53,20 @@ class MemoryRepository(Generic[T], Repository[T]):
         self._store.put(self._collection, entity_id, merged)
         return True
 
+    async def upsert(self, entity: T, fields: Optional[Iterable[str]] = None) -> str:
+        payload = self._to_dict(entity)
+        entity_id: str = payload["id"]
+        existing = self._store.get(self._collection, entity_id)
+        if fields is not None:
+            # Like the Firestore repositories, a partial write never creates
+            if existing is None:
+                raise RepositoryError(
+                    "Entity not found for partial upsert", "upsert", self._collection, entity_id
+                )
+            payload = {key: payload[key] for key in fields if key in payload}
+        self._store.put(self._collection, entity_id, {**existing, **payload} if existing else payload)
+        return entity_id
+
     async def delete(self, entity_id: str) -> bool:
         return self._store.delete(self._collection, entity_id)
 
@@ -68,6 +86,9 @@ class MemoryRepository(Generic[T], Repository[T]):
     async def exists(self, entity_id: str) -> bool:
         return self._store.exists(self._collection, entity_id)
 
+    async def exists_many(self, entity_ids: Sequence[str]) -> Set[str]:
+        return {entity_id for entity_id in entity_ids if self._store.exists(self._collection, entity_id)}
+
 
 class MemoryActorRepository(MemoryRepository[Actor]):
     def __init__(self, store: LocalStateStore) -> None:
@@ -14,7 +14,7 @@ from ..data.event_repository import EventRepository
 from ..data.firestore_client import FirestoreClient
 from ..data.repository import Repository
 from ..data.simulation_repository import SimulationRepository
-from ..engine import PhaseEngine
+from ..engine import PhaseEngine, PhaseEngineConfig
 from ..llm import LLMService
 from ..models import Action, Actor, Event, SimulationState
 from ..scenarios import ScenarioService, create_default_scenario_service
@@ -27,7 +27,7 @@ from .memory import (
 from .store import DEFAULT_STATE_PATH, LocalStateStore
 
 
-@dataclass
+@dataclass(slots=True)
 class RuntimeContext:
     backend: str
     simulation_repository: Repository[SimulationState]
@@ -47,6 +47,7 @@ async def _build_firestore_runtime(
     credentials_path: Optional[str],
     scenario_service: ScenarioService,
     llm_service: Optional[LLMService],
+    engine_config: PhaseEngineConfig,
 ) -> tuple[
     SimulationRepository,
     ActorRepository,
@@ -69,6 +70,7 @@ async def _build_firestore_runtime(
         action_repository=action_repository,
         llm_service=llm_service,
         scenario_service=scenario_service,
+        config=engine_config,
     )
 
     return simulation_repository, actor_repository, event_repository, action_repository, phase_engine
@@ -79,6 +81,7 @@ async def _build_memory_runtime(
     state_path: Path,
     scenario_service: ScenarioService,
     llm_service: Optional[LLMService],
+    engine_config: PhaseEngineConfig,
 ) -> tuple[
     MemorySimulationRepository,
     MemoryActorRepository,
@@ -99,6 +102,7 @@ async def _build_memory_runtime(
         action_repository=action_repository,
         llm_service=llm_service,
         scenario_service=scenario_service,
+        config=engine_config,
     )
 
     return simulation_repository, actor_repository, event_repository, action_repository, phase_engine
@@ -118,6 +122,7 @@ def build_runtime(
     settings = load_settings(config_paths=config_paths)
     scenario_service = scenario_service or create_default_scenario_service()
     resolved_llm = llm_service
+    engine_config = PhaseEngineConfig.from_settings(settings)
 
     if backend == "firestore":
         resolved_project = project_id or settings.firestore.project_id
@@ -134,6 +139,7 @@ def build_runtime(
                 credentials_path=resolved_credentials,
                 scenario_service=scenario_service,
                 llm_service=resolved_llm,
+                engine_config=engine_config,
             )
         )
         state_path = state_path or DEFAULT_STATE_PATH
@@ -162,6 +168,7 @@ def build_runtime(
             state_path=state_path,
             scenario_service=scenario_service,
             llm_service=resolved_llm,
+            engine_config=engine_config,
         )
     )
 
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict, Iterable
 
+from .._json import dumps, loads
+
 DEFAULT_STATE_PATH = Path.home() / ".scrai" / "state.json"
 
 
@@ -24,21 +25,19 @@ class LocalStateStore:
         if not self.path.exists():
             return
         try:
-            with self.path.open("r", encoding="utf-8") as handle:
-                raw = json.load(handle)
-                if isinstance(raw, dict):
-                    for key in self._data:
-                        collection = raw.get(key, {})
-                        if isinstance(collection, dict):
-                            self._data[key] = collection
-        except json.JSONDecodeError:
+            raw = loads(self.path.read_bytes())
+        except ValueError:
             # Corrupted file; keep in-memory defaults
-            pass
+            return
+        if isinstance(raw, dict):
+            for key in self._data:
+                collection = raw.get(key, {})
+                if isinstance(collection, dict):
+                    self._data[key] = collection
 
     def _sync(self) -> None:
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        with self.path.open("w", encoding="utf-8") as handle:
-            json.dump(self._data, handle, indent=2, sort_keys=True)
+        self.path.write_bytes(dumps(self._data, pretty=True))
 
     def put(self, collection: str, entity_id: str, payload: Dict[str, Any]) -> None:
         self._data.setdefault(collection, {})[entity_id] = payload
@@ -36,6 +36,12 @@ class LLMSettings(BaseModel):
 
     primary_provider: str = Field(default="openrouter", description="Primary provider key")
     providers: Dict[str, LLMProviderSettings] = Field(default_factory=dict, description="Configured providers")
+    cache_responses: bool = Field(default=False, description="Reuse parsed responses for identical phase prompts")
+    response_cache_size: int = Field(default=1024, description="Maximum cached phase responses")
+    combine_phases: bool = Field(default=False, description="Plan each cycle's LLM phases with a single call")
+    max_batch: int = Field(default=1, description="Coalesce up to this many concurrent completions (1 disables)")
+    batch_flush_ms: float = Field(default=20.0, description="Window for gathering a completion batch")
+    coalesce_identical: bool = Field(default=False, description="Share one request between identical in-flight completions")
 
 
 class SimulationSettings(BaseModel):
@@ -100,6 +106,12 @@ _ENV_PATHS: dict[str, tuple[str, ...]] = {
     "SCRAI_SIMULATION_AUTO_APPROVE_ACTIONS": ("simulation", "auto_approve_actions"),
     "SCRAI_SIMULATION_RESEARCHER_MODE": ("simulation", "researcher_mode"),
     "SCRAI_LLM_PRIMARY_PROVIDER": ("llm", "primary_provider"),
+    "SCRAI_LLM_CACHE_RESPONSES": ("llm", "cache_responses"),
+    "SCRAI_LLM_RESPONSE_CACHE_SIZE": ("llm", "response_cache_size"),
+    "SCRAI_LLM_COMBINE_PHASES": ("llm", "combine_phases"),
+    "SCRAI_LLM_MAX_BATCH": ("llm", "max_batch"),
+    "SCRAI_LLM_BATCH_FLUSH_MS": ("llm", "batch_flush_ms"),
+    "SCRAI_LLM_COALESCE_IDENTICAL": ("llm", "coalesce_identical"),
 }
 
 
@@ -6,7 +6,7 @@ with Firestore backend and action-specific query methods.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence, Set
 from datetime import datetime
 
 from ..models.action import Action, ActionType, ActionStatus, ActionPriority
@@ -47,14 +47,27 @@ class ActionRepository(Repository[Action]):
     async def get(self, action_id: str) -> Optional[Action]:
         """Retrieve an action by ID."""
         try:
-            data = await self.firestore_client.get_document(self.COLLECTION_NAME, action_id)
-            if data:
-                return Action.from_dict(data)
+            record = await self.firestore_client.get_document(self.COLLECTION_NAME, action_id)
+            if record:
+                doc_id, data = record
+                return Action.from_firestore(doc_id, data)
             return None
         except Exception as e:
             logger.error(f"Failed to get action {action_id}: {e}")
             raise RepositoryError(f"Failed to get action: {e}", "get", "Action", action_id)
     
+    async def get_many(self, action_ids: Sequence[str]) -> List[Action]:
+        """Retrieve several actions by ID, skipping any that do not exist."""
+        try:
+            records = await self.firestore_client.get_documents(self.COLLECTION_NAME, action_ids)
+            return [
+                Action.from_firestore(doc_id, data)
+                for doc_id, data in filter(None, records)
+            ]
+        except Exception as e:
+            logger.error(f"Failed to get actions: {e}")
+            raise RepositoryError(f"Failed to get actions: {e}", "get_many", "Action")
+    
     async def update(self, action_id: str, updates: Dict[str, Any]) -> bool:
         """Update an existing action."""
         try:
@@ -93,7 +106,7 @@ class ActionRepository(Repository[Action]):
         """List all actions."""
         try:
             documents = await self.firestore_client.list_documents(self.COLLECTION_NAME, limit)
-            actions = [Action.from_dict(doc) for doc in documents]
+            actions = [Action.from_firestore(doc_id, data) for doc_id, data in documents]
             logger.debug(f"Listed {len(actions)} actions")
             return actions
         except Exception as e:
@@ -108,7 +121,7 @@ class ActionRepository(Repository[Action]):
                 filters, 
                 limit
             )
-            actions = [Action.from_dict(doc) for doc in documents]
+            actions = [Action.from_firestore(doc_id, data) for doc_id, data in documents]
             logger.debug(f"Queried {len(actions)} actions with filters {filters}")
             return actions
         except Exception as e:
@@ -123,6 +136,14 @@ class ActionRepository(Repository[Action]):
             logger.error(f"Failed to check action existence {action_id}: {e}")
             raise RepositoryError(f"Failed to check action existence: {e}", "exists", "Action", action_id)
     
+    async def exists_many(self, action_ids: Sequence[str]) -> Set[str]:
+        """Return the subset of action IDs that exist, using one batched read."""
+        try:
+            return await self.firestore_client.existing_document_ids(self.COLLECTION_NAME, action_ids)
+        except Exception as e:
+            logger.error(f"Failed to check action existence: {e}")
+            raise RepositoryError(f"Failed to check action existence: {e}", "exists_many", "Action")
+    
     # Action-specific methods
     
     async def find_by_actor(self, actor_id: str, limit: Optional[int] = None) -> List[Action]:
@@ -6,7 +6,7 @@ with Firestore backend and actor-specific query methods.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence, Set
 from datetime import datetime
 
 from ..models.actor import Actor, ActorType
@@ -47,14 +47,27 @@ class ActorRepository(Repository[Actor]):
     async def get(self, actor_id: str) -> Optional[Actor]:
         """Retrieve an actor by ID."""
         try:
-            data = await self.firestore_client.get_document(self.COLLECTION_NAME, actor_id)
-            if data:
-                return Actor.from_dict(data)
+            record = await self.firestore_client.get_document(self.COLLECTION_NAME, actor_id)
+            if record:
+                doc_id, data = record
+                return Actor.from_firestore(doc_id, data)
             return None
         except Exception as e:
             logger.error(f"Failed to get actor {actor_id}: {e}")
             raise RepositoryError(f"Failed to get actor: {e}", "get", "Actor", actor_id)
     
+    async def get_many(self, actor_ids: Sequence[str]) -> List[Actor]:
+        """Retrieve several actors by ID, skipping any that do not exist."""
+        try:
+            records = await self.firestore_client.get_documents(self.COLLECTION_NAME, actor_ids)
+            return [
+                Actor.from_firestore(doc_id, data)
+                for doc_id, data in filter(None, records)
+            ]
+        except Exception as e:
+            logger.error(f"Failed to get actors: {e}")
+            raise RepositoryError(f"Failed to get actors: {e}", "get_many", "Actor")
+    
     async def update(self, actor_id: str, updates: Dict[str, Any]) -> bool:
         """Update an existing actor."""
         try:
@@ -96,7 +109,7 @@ class ActorRepository(Repository[Actor]):
         """List all actors."""
         try:
             documents = await self.firestore_client.list_documents(self.COLLECTION_NAME, limit)
-            actors = [Actor.from_dict(doc) for doc in documents]
+            actors = [Actor.from_firestore(doc_id, data) for doc_id, data in documents]
             logger.debug(f"Listed {len(actors)} actors")
             return actors
         except Exception as e:
@@ -111,7 +124,7 @@ class ActorRepository(Repository[Actor]):
                 filters, 
                 limit
             )
-            actors = [Actor.from_dict(doc) for doc in documents]
+            actors = [Actor.from_firestore(doc_id, data) for doc_id, data in documents]
             logger.debug(f"Queried {len(actors)} actors with filters {filters}")
             return actors
         except Exception as e:
@@ -126,6 +139,14 @@ class ActorRepository(Repository[Actor]):
             logger.error(f"Failed to check actor existence {actor_id}: {e}")
             raise RepositoryError(f"Failed to check actor existence: {e}", "exists", "Actor", actor_id)
     
+    async def exists_many(self, actor_ids: Sequence[str]) -> Set[str]:
+        """Return the subset of actor IDs that exist, using one batched read."""
+        try:
+            return await self.firestore_client.existing_document_ids(self.COLLECTION_NAME, actor_ids)
+        except Exception as e:
+            logger.error(f"Failed to check actor existence: {e}")
+            raise RepositoryError(f"Failed to check actor existence: {e}", "exists_many", "Actor")
+    
     # Actor-specific methods
     
     async def find_by_type(self, actor_type: ActorType, limit: Optional[int] = None) -> List[Actor]:
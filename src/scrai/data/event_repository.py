@@ -6,7 +6,7 @@ with Firestore backend and event-specific query methods.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence, Set
 from datetime import datetime
 
 from ..models.event import Event, EventType, EventStatus
@@ -47,14 +47,27 @@ class EventRepository(Repository[Event]):
     async def get(self, event_id: str) -> Optional[Event]:
         """Retrieve an event by ID."""
         try:
-            data = await self.firestore_client.get_document(self.COLLECTION_NAME, event_id)
-            if data:
-                return Event.from_dict(data)
+            record = await self.firestore_client.get_document(self.COLLECTION_NAME, event_id)
+            if record:
+                doc_id, data = record
+                return Event.from_firestore(doc_id, data)
             return None
         except Exception as e:
             logger.error(f"Failed to get event {event_id}: {e}")
             raise RepositoryError(f"Failed to get event: {e}", "get", "Event", event_id)
     
+    async def get_many(self, event_ids: Sequence[str]) -> List[Event]:
+        """Retrieve several events by ID, skipping any that do not exist."""
+        try:
+            records = await self.firestore_client.get_documents(self.COLLECTION_NAME, event_ids)
+            return [
+                Event.from_firestore(doc_id, data)
+                for doc_id, data in filter(None, records)
+            ]
+        except Exception as e:
+            logger.error(f"Failed to get events: {e}")
+            raise RepositoryError(f"Failed to get events: {e}", "get_many", "Event")
+    
     async def update(self, event_id: str, updates: Dict[str, Any]) -> bool:
         """Update an existing event."""
         try:
@@ -93,7 +106,7 @@ class EventRepository(Repository[Event]):
         """List all events."""
         try:
             documents = await self.firestore_client.list_documents(self.COLLECTION_NAME, limit)
-            events = [Event.from_dict(doc) for doc in documents]
+            events = [Event.from_firestore(doc_id, data) for doc_id, data in documents]
             logger.debug(f"Listed {len(events)} events")
             return events
         except Exception as e:
@@ -108,7 +121,7 @@ class EventRepository(Repository[Event]):
                 filters, 
                 limit
             )
-            events = [Event.from_dict(doc) for doc in documents]
+            events = [Event.from_firestore(doc_id, data) for doc_id, data in documents]
             logger.debug(f"Queried {len(events)} events with filters {filters}")
             return events
         except Exception as e:
@@ -123,6 +136,14 @@ class EventRepository(Repository[Event]):
             logger.error(f"Failed to check event existence {event_id}: {e}")
             raise RepositoryError(f"Failed to check event existence: {e}", "exists", "Event", event_id)
     
+    async def exists_many(self, event_ids: Sequence[str]) -> Set[str]:
+        """Return the subset of event IDs that exist, using one batched read."""
+        try:
+            return await self.firestore_client.existing_document_ids(self.COLLECTION_NAME, event_ids)
+        except Exception as e:
+            logger.error(f"Failed to check event existence: {e}")
+            raise RepositoryError(f"Failed to check event existence: {e}", "exists_many", "Event")
+    
     # Event-specific methods
     
     async def find_by_status(self, status: EventStatus, limit: Optional[int] = None) -> List[Event]:
@@ -7,13 +7,14 @@ handling connection management, error handling, and Firestore-specific operation
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, AsyncIterator, Iterable, List, Optional, Set, Tuple
 from datetime import datetime
-import json
 
 try:
     from google.cloud import firestore
     from google.cloud.firestore import AsyncClient
+    from google.cloud.firestore_v1.base_query import FieldFilter
     from google.api_core import exceptions as firestore_exceptions
     FIRESTORE_AVAILABLE = True
 except ImportError:
@@ -25,6 +26,32 @@ from .repository import RepositoryError
 
 logger = logging.getLogger(__name__)
 
+# A document as returned by read methods: (document ID, document data).
+# The ID is kept separate so stored data is never mutated and a stored
+# ``id`` field cannot shadow the real document ID.
+DocumentRecord = Tuple[str, Dict[str, Any]]
+
+
+@lru_cache(maxsize=256, typed=True)
+def _cached_equality_filter(field: str, value: Any) -> Any:
+    return FieldFilter(field, "==", value)
+
+
+def _equality_filter(field: str, value: Any) -> Any:
+    """Return a reusable ``field == value`` filter, building it once per pair."""
+    try:
+        return _cached_equality_filter(field, value)
+    except TypeError:
+        # Unhashable values (lists, dicts) cannot be cached
+        return FieldFilter(field, "==", value)
+
+
+def _apply_filters(query: Any, filters: Dict[str, Any]) -> Any:
+    """Chain equality filters onto a query."""
+    for field, value in filters.items():
+        query = query.where(filter=_equality_filter(field, value))
+    return query
+
 
 class FirestoreClient:
     """
@@ -34,6 +61,10 @@ class FirestoreClient:
     functionality. Provides a clean interface for repository implementations.
     """
     
+    # Upper bound on concurrent per-document reads; the async client's
+    # throughput degrades beyond a handful of in-flight reads per process.
+    MAX_CONCURRENT_READS = 8
+    
     def __init__(self, project_id: Optional[str] = None, credentials_path: Optional[str] = None):
         """
         Initialize Firestore client.
@@ -51,10 +82,18 @@ class FirestoreClient:
         self.project_id = project_id
         self.credentials_path = credentials_path
         self._client: Optional[AsyncClient] = None
+        self._collections: Dict[str, Any] = {}
+        self._read_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_READS)
         self._initialized = False
     
-    async def initialize(self) -> None:
-        """Initialize the Firestore client."""
+    async def initialize(self, test_connection: bool = False) -> None:
+        """
+        Initialize the Firestore client.
+        
+        Args:
+            test_connection: Issue a listCollections round-trip to verify
+                connectivity. Off by default to keep startup cheap.
+        """
         if self._initialized:
             return
         
@@ -66,8 +105,8 @@ class FirestoreClient:
             
             self._client = firestore.AsyncClient(project=self.project_id)
             
-            # Test connection
-            await self._test_connection()
+            if test_connection:
+                await self._test_connection()
             
             self._initialized = True
             logger.info(f"Firestore client initialized for project: {self.project_id or 'default'}")
@@ -96,6 +135,14 @@ class FirestoreClient:
             raise RuntimeError("Firestore client not initialized. Call initialize() first.")
         return self._client
     
+    def _collection(self, name: str) -> Any:
+        """Return a cached collection reference for the given collection name."""
+        ref = self._collections.get(name)
+        if ref is None:
+            ref = self.client.collection(name)
+            self._collections[name] = ref
+        return ref
+    
     async def create_document(self, collection: str, document_id: str, data: Dict[str, Any]) -> None:
         """
         Create a document in Firestore.
@@ -117,7 +164,7 @@ class FirestoreClient:
             if 'updated_at' not in data:
                 data['updated_at'] = now
             
-            doc_ref = self.client.collection(collection).document(document_id)
+            doc_ref = self._collection(collection).document(document_id)
             await doc_ref.set(data)
             
             logger.debug(f"Created document {collection}/{document_id}")
@@ -125,11 +172,8 @@ class FirestoreClient:
         except firestore_exceptions.GoogleAPICallError as e:
             logger.error(f"Firestore API error creating document: {e}")
             raise RepositoryError(f"Failed to create document: {e}", "create", collection, document_id)
-        except Exception as e:
-            logger.error(f"Unexpected error creating document: {e}")
-            raise RepositoryError(f"Failed to create document: {e}", "create", collection, document_id)
     
-    async def get_document(self, collection: str, document_id: str) -> Optional[Dict[str, Any]]:
+    async def get_document(self, collection: str, document_id: str) -> Optional[DocumentRecord]:
         """
         Get a document from Firestore.
         
@@ -138,21 +182,19 @@ class FirestoreClient:
             document_id: Document ID
             
         Returns:
-            Optional[Dict[str, Any]]: Document data if found, None otherwise
+            Optional[DocumentRecord]: (document ID, data) if found, None otherwise
             
         Raises:
             RepositoryError: If retrieval fails
         """
         try:
-            doc_ref = self.client.collection(collection).document(document_id)
+            doc_ref = self._collection(collection).document(document_id)
             doc = await doc_ref.get()
             
             if doc.exists:
                 data = doc.to_dict()
-                # Add the document ID
-                data['id'] = document_id
                 logger.debug(f"Retrieved document {collection}/{document_id}")
-                return data
+                return document_id, data
             else:
                 logger.debug(f"Document {collection}/{document_id} not found")
                 return None
@@ -160,9 +202,46 @@ class FirestoreClient:
         except firestore_exceptions.GoogleAPICallError as e:
             logger.error(f"Firestore API error retrieving document: {e}")
             raise RepositoryError(f"Failed to retrieve document: {e}", "get", collection, document_id)
-        except Exception as e:
-            logger.error(f"Unexpected error retrieving document: {e}")
-            raise RepositoryError(f"Failed to retrieve document: {e}", "get", collection, document_id)
+    
+    async def get_documents(
+        self, collection: str, document_ids: Iterable[str]
+    ) -> List[Optional[DocumentRecord]]:
+        """
+        Fetch several documents in a single batched read.
+        
+        Args:
+            collection: Collection name
+            document_ids: Document IDs to fetch
+            
+        Returns:
+            List[Optional[DocumentRecord]]: (document ID, data) pairs in input
+            order, with None for documents that do not exist
+            
+        Raises:
+            RepositoryError: If retrieval fails
+        """
+        document_ids = list(document_ids)
+        if not document_ids:
+            return []
+        
+        collection_ref = self._collection(collection)
+        refs = [collection_ref.document(document_id) for document_id in dict.fromkeys(document_ids)]
+        found: Dict[str, Dict[str, Any]] = {}
+        try:
+            async with self._read_semaphore:
+                # get_all issues one BatchGetDocuments call; results arrive unordered
+                async for doc in self.client.get_all(refs):
+                    if doc.exists:
+                        found[doc.id] = doc.to_dict() or {}
+        except firestore_exceptions.GoogleAPICallError as e:
+            logger.error(f"Firestore API error retrieving documents: {e}")
+            raise RepositoryError(f"Failed to retrieve documents: {e}", "get_many", collection)
+        
+        logger.debug(f"Retrieved {len(found)}/{len(refs)} documents from {collection}")
+        return [
+            (document_id, found[document_id]) if document_id in found else None
+            for document_id in document_ids
+        ]
     
     async def update_document(self, collection: str, document_id: str, updates: Dict[str, Any]) -> bool:
         """
@@ -184,24 +263,50 @@ class FirestoreClient:
             updates = updates.copy()
             updates['updated_at'] = datetime.utcnow()
             
-            doc_ref = self.client.collection(collection).document(document_id)
+            doc_ref = self._collection(collection).document(document_id)
             
-            # Check if document exists first
-            doc = await doc_ref.get()
-            if not doc.exists:
+            # update() carries an exists precondition, so a missing document
+            # is rejected by the server without a separate read first
+            try:
+                await doc_ref.update(updates)
+            except firestore_exceptions.NotFound:
                 logger.debug(f"Document {collection}/{document_id} not found for update")
                 return False
-            
-            await doc_ref.update(updates)
             logger.debug(f"Updated document {collection}/{document_id}")
             return True
             
         except firestore_exceptions.GoogleAPICallError as e:
             logger.error(f"Firestore API error updating document: {e}")
             raise RepositoryError(f"Failed to update document: {e}", "update", collection, document_id)
-        except Exception as e:
-            logger.error(f"Unexpected error updating document: {e}")
-            raise RepositoryError(f"Failed to update document: {e}", "update", collection, document_id)
+    
+    async def upsert_document(self, collection: str, document_id: str, data: Dict[str, Any]) -> None:
+        """
+        Create or overwrite fields of a document in a single write.
+        
+        Uses ``set`` with the top-level field names as merge paths, so each
+        provided field is replaced wholesale (matching ``update`` semantics)
+        while untouched fields are preserved and missing documents are created.
+        
+        Args:
+            collection: Collection name
+            document_id: Document ID
+            data: Document data
+            
+        Raises:
+            RepositoryError: If the write fails
+        """
+        try:
+            data = data.copy()
+            data['updated_at'] = datetime.utcnow()
+            
+            doc_ref = self._collection(collection).document(document_id)
+            await doc_ref.set(data, merge=list(data.keys()))
+            
+            logger.debug(f"Upserted document {collection}/{document_id}")
+            
+        except firestore_exceptions.GoogleAPICallError as e:
+            logger.error(f"Firestore API error upserting document: {e}")
+            raise RepositoryError(f"Failed to upsert document: {e}", "upsert", collection, document_id)
     
     async def delete_document(self, collection: str, document_id: str) -> bool:
         """
@@ -218,7 +323,7 @@ class FirestoreClient:
             RepositoryError: If deletion fails
         """
         try:
-            doc_ref = self.client.collection(collection).document(document_id)
+            doc_ref = self._collection(collection).document(document_id)
             
             # Check if document exists first
             doc = await doc_ref.get()
@@ -233,80 +338,116 @@ class FirestoreClient:
         except firestore_exceptions.GoogleAPICallError as e:
             logger.error(f"Firestore API error deleting document: {e}")
             raise RepositoryError(f"Failed to delete document: {e}", "delete", collection, document_id)
-        except Exception as e:
-            logger.error(f"Unexpected error deleting document: {e}")
-            raise RepositoryError(f"Failed to delete document: {e}", "delete", collection, document_id)
     
-    async def list_documents(self, collection: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    async def _stream_query(
+        self, query: Any, early_stop: Optional[int] = None
+    ) -> AsyncIterator[DocumentRecord]:
+        """Yield (document ID, data) pairs from a query, closing the stream on early exit."""
+        stream = query.stream()
+        count = 0
+        try:
+            async for doc in stream:
+                data = doc.to_dict()
+                yield doc.id, data
+                count += 1
+                if early_stop is not None and count >= early_stop:
+                    break
+        finally:
+            # Release the underlying gRPC stream if we stopped before exhausting it
+            await stream.aclose()
+    
+    async def iter_documents(
+        self,
+        collection: str,
+        limit: Optional[int] = None,
+        early_stop: Optional[int] = None,
+    ) -> AsyncIterator[DocumentRecord]:
         """
-        List all documents in a collection.
+        Stream documents from a collection as they arrive.
+        
+        Documents are yielded one at a time so callers can start processing
+        before the full result set has been received.
         
         Args:
             collection: Collection name
-            limit: Optional limit on number of results
+            limit: Optional server-side limit on number of results
+            early_stop: Optional count after which the stream is closed
             
-        Returns:
-            List[Dict[str, Any]]: List of documents
+        Yields:
+            DocumentRecord: (document ID, data) pairs
             
         Raises:
             RepositoryError: If listing fails
         """
+        if limit is not None and limit <= 0:
+            return
+        
         try:
-            query = self.client.collection(collection)
-            if limit:
+            query = self._collection(collection)
+            if limit is not None:
                 query = query.limit(limit)
             
-            documents = []
-            async for doc in query.stream():
-                data = doc.to_dict()
-                data['id'] = doc.id
-                documents.append(data)
+            count = 0
+            async for record in self._stream_query(query, early_stop):
+                count += 1
+                yield record
             
-            logger.debug(f"Listed {len(documents)} documents from {collection}")
-            return documents
+            logger.debug(f"Streamed {count} documents from {collection}")
             
         except firestore_exceptions.GoogleAPICallError as e:
             logger.error(f"Firestore API error listing documents: {e}")
             raise RepositoryError(f"Failed to list documents: {e}", "list", collection)
-        except Exception as e:
-            logger.error(f"Unexpected error listing documents: {e}")
-            raise RepositoryError(f"Failed to list documents: {e}", "list", collection)
+    
+    async def list_documents(self, collection: str, limit: Optional[int] = None) -> List[DocumentRecord]:
+        """
+        List all documents in a collection.
+        
+        Args:
+            collection: Collection name
+            limit: Optional limit on number of results
+            
+        Returns:
+            List[DocumentRecord]: (document ID, data) pairs
+            
+        Raises:
+            RepositoryError: If listing fails
+        """
+        return [record async for record in self.iter_documents(collection, limit)]
     
     async def query_documents(
         self, 
         collection: str, 
         filters: Dict[str, Any], 
-        limit: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+        limit: Optional[int] = None,
+        early_stop: Optional[int] = None,
+    ) -> List[DocumentRecord]:
         """
         Query documents with filters.
         
         Args:
             collection: Collection name
             filters: Dictionary of field filters (field: value)
-            limit: Optional limit on number of results
+            limit: Optional server-side limit on number of results
+            early_stop: Optional count after which the stream is closed
             
         Returns:
-            List[Dict[str, Any]]: List of matching documents
+            List[DocumentRecord]: (document ID, data) pairs for matching documents
             
         Raises:
             RepositoryError: If query fails
         """
+        if limit is not None and limit <= 0:
+            return []
+        
         try:
-            query = self.client.collection(collection)
+            query = self._collection(collection)
             
-            # Apply filters
-            for field, value in filters.items():
-                query = query.where(field, "==", value)
+            query = _apply_filters(query, filters)
             
-            if limit:
+            if limit is not None:
                 query = query.limit(limit)
             
-            documents = []
-            async for doc in query.stream():
-                data = doc.to_dict()
-                data['id'] = doc.id
-                documents.append(data)
+            documents = [record async for record in self._stream_query(query, early_stop)]
             
             logger.debug(f"Queried {len(documents)} documents from {collection} with filters {filters}")
             return documents
@@ -314,9 +455,34 @@ class FirestoreClient:
         except firestore_exceptions.GoogleAPICallError as e:
             logger.error(f"Firestore API error querying documents: {e}")
             raise RepositoryError(f"Failed to query documents: {e}", "query", collection)
-        except Exception as e:
-            logger.error(f"Unexpected error querying documents: {e}")
-            raise RepositoryError(f"Failed to query documents: {e}", "query", collection)
+    
+    async def existing_document_ids(self, collection: str, document_ids: Iterable[str]) -> Set[str]:
+        """
+        Return which of the given documents exist, in a single batched read.
+        
+        Only document metadata is fetched (an empty field mask).
+        
+        Args:
+            collection: Collection name
+            document_ids: Document IDs to check
+            
+        Returns:
+            Set[str]: IDs of the documents that exist
+            
+        Raises:
+            RepositoryError: If the check fails
+        """
+        collection_ref = self._collection(collection)
+        refs = [collection_ref.document(document_id) for document_id in dict.fromkeys(document_ids)]
+        if not refs:
+            return set()
+        
+        try:
+            async with self._read_semaphore:
+                return {doc.id async for doc in self.client.get_all(refs, field_paths=[]) if doc.exists}
+        except firestore_exceptions.GoogleAPICallError as e:
+            logger.error(f"Firestore API error checking document existence: {e}")
+            raise RepositoryError(f"Failed to check document existence: {e}", "exists_many", collection)
     
     async def document_exists(self, collection: str, document_id: str) -> bool:
         """
@@ -333,9 +499,9 @@ class FirestoreClient:
             RepositoryError: If check fails
         """
         try:
-            doc_ref = self.client.collection(collection).document(document_id)
+            doc_ref = self._collection(collection).document(document_id)
             doc = await doc_ref.get()
-            exists = doc.exists
+            exists: bool = doc.exists
             
             logger.debug(f"Document {collection}/{document_id} exists: {exists}")
             return exists
@@ -343,14 +509,12 @@ class FirestoreClient:
         except firestore_exceptions.GoogleAPICallError as e:
             logger.error(f"Firestore API error checking document existence: {e}")
             raise RepositoryError(f"Failed to check document existence: {e}", "exists", collection, document_id)
-        except Exception as e:
-            logger.error(f"Unexpected error checking document existence: {e}")
-            raise RepositoryError(f"Failed to check document existence: {e}", "exists", collection, document_id)
     
     async def close(self) -> None:
         """Close the Firestore client."""
         if self._client:
             # AsyncClient doesn't have an explicit close method
             self._client = None
+        self._collections.clear()
         self._initialized = False
         logger.info("Firestore client closed")
\ No newline at end of file
@@ -5,8 +5,9 @@ This module defines the base repository interface that all concrete
 implementations must follow, enabling flexible backend switching.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, TypeVar, Generic
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Set, Tuple, TypeVar, Generic
 from datetime import datetime
 
 T = TypeVar('T')
@@ -53,6 +54,25 @@ class Repository(ABC, Generic[T]):
         """
         pass
     
+    async def get_many(self, entity_ids: Sequence[str]) -> List[T]:
+        """
+        Retrieve several entities by ID.
+        
+        The default implementation issues the lookups concurrently; backends
+        with a native batched read should override it.
+        
+        Args:
+            entity_ids: Unique identifiers of the entities
+            
+        Returns:
+            List[T]: The entities found, in input order; missing IDs are skipped
+            
+        Raises:
+            RepositoryError: If retrieval fails
+        """
+        entities = await asyncio.gather(*(self.get(entity_id) for entity_id in entity_ids))
+        return [entity for entity in entities if entity is not None]
+    
     @abstractmethod
     async def update(self, entity_id: str, updates: Dict[str, Any]) -> bool:
         """
@@ -70,6 +90,55 @@ class Repository(ABC, Generic[T]):
         """
         pass
     
+    async def update_many(self, updates: Sequence[Tuple[str, Dict[str, Any]]]) -> List[bool]:
+        """
+        Apply several independent updates.
+        
+        The default implementation issues the updates concurrently; backends
+        with a native batched write should override it.
+        
+        Args:
+            updates: (entity ID, field updates) pairs
+            
+        Returns:
+            List[bool]: Per-update results, in input order
+            
+        Raises:
+            RepositoryError: If any update fails
+        """
+        return list(await asyncio.gather(*(self.update(entity_id, data) for entity_id, data in updates)))
+    
+    async def upsert(self, entity: T, fields: Optional[Iterable[str]] = None) -> str:
+        """
+        Create the entity or overwrite its stored fields.
+        
+        The default implementation tries an update and falls back to create;
+        backends that support a native create-or-merge write should override it.
+        
+        Args:
+            entity: The entity to persist
+            fields: Optional top-level fields to write; other stored fields are
+                left untouched. A partial write requires the entity to exist
+            
+        Returns:
+            str: The ID of the persisted entity
+            
+        Raises:
+            RepositoryError: If the write fails, or ``fields`` is given and the
+                entity does not exist
+        """
+        entity_id: str = entity.id  # type: ignore[attr-defined]
+        data = entity.to_dict()  # type: ignore[attr-defined]
+        if fields is not None:
+            data = {key: data[key] for key in fields if key in data}
+        if await self.update(entity_id, data):
+            return entity_id
+        if fields is not None:
+            raise RepositoryError(
+                "Entity not found for partial upsert", "upsert", type(entity).__name__, entity_id
+            )
+        return await self.create(entity)
+    
     @abstractmethod
     async def delete(self, entity_id: str) -> bool:
         """
@@ -134,6 +203,25 @@ class Repository(ABC, Generic[T]):
             RepositoryError: If check fails
         """
         pass
+    
+    async def exists_many(self, entity_ids: Sequence[str]) -> Set[str]:
+        """
+        Check which of several entities exist.
+        
+        The default implementation issues the checks concurrently; backends
+        with a native batched read should override it.
+        
+        Args:
+            entity_ids: Unique identifiers of the entities
+            
+        Returns:
+            Set[str]: The IDs that exist
+            
+        Raises:
+            RepositoryError: If any check fails
+        """
+        flags = await asyncio.gather(*(self.exists(entity_id) for entity_id in entity_ids))
+        return {entity_id for entity_id, found in zip(entity_ids, flags) if found}
 
 
 class RepositoryError(Exception):
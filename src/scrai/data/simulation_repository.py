@@ -6,7 +6,8 @@ with Firestore backend and simulation-specific query methods.
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+import time
+from typing import Dict, Any, AsyncIterator, Iterable, List, Optional, Tuple
 from datetime import datetime
 
 from ..models.simulation_state import SimulationState, SimulationStatus, SimulationPhase
@@ -25,10 +26,16 @@ class SimulationRepository(Repository[SimulationState]):
     """
     
     COLLECTION_NAME = "simulations"
+    NAME_CACHE_TTL_SECONDS = 10.0
+    NAME_CACHE_MAX_ENTRIES = 1024
     
     def __init__(self, firestore_client: FirestoreClient):
         """Initialize the Simulation repository."""
         self.firestore_client = firestore_client
+        # name -> (expires_at, simulation_id) for short-lived find_by_name lookups,
+        # plus the reverse simulation_id -> name so writes invalidate in O(1)
+        self._name_index: Dict[str, Tuple[float, str]] = {}
+        self._name_by_id: Dict[str, str] = {}
     
     async def create(self, simulation: SimulationState) -> str:
         """Create a new simulation in Firestore."""
@@ -38,6 +45,7 @@ class SimulationRepository(Repository[SimulationState]):
                 simulation.id, 
                 simulation.to_dict()
             )
+            self._invalidate_name_index(simulation.id, simulation.name)
             logger.info(f"Created simulation: {simulation.id} ({simulation.name})")
             return simulation.id
         except Exception as e:
@@ -47,9 +55,9 @@ class SimulationRepository(Repository[SimulationState]):
     async def get(self, simulation_id: str) -> Optional[SimulationState]:
         """Retrieve a simulation by ID."""
         try:
-            data = await self.firestore_client.get_document(self.COLLECTION_NAME, simulation_id)
-            if data:
-                return SimulationState.from_dict(data)
+            record = await self.firestore_client.get_document(self.COLLECTION_NAME, simulation_id)
+            if record:
+                return SimulationState.from_firestore(*record)
             return None
         except Exception as e:
             logger.error(f"Failed to get simulation {simulation_id}: {e}")
@@ -63,6 +71,7 @@ class SimulationRepository(Repository[SimulationState]):
                 simulation_id, 
                 updates
             )
+            self._invalidate_name_index(simulation_id, updates.get("name"))
             
             if result:
                 logger.info(f"Updated simulation: {simulation_id}")
@@ -74,10 +83,37 @@ class SimulationRepository(Repository[SimulationState]):
             logger.error(f"Failed to update simulation {simulation_id}: {e}")
             raise RepositoryError(f"Failed to update simulation: {e}", "update", "SimulationState", simulation_id)
     
+    async def upsert(self, simulation: SimulationState, fields: Optional[Iterable[str]] = None) -> str:
+        """Create or overwrite a simulation in a single Firestore write.
+        
+        When ``fields`` is given only those top-level fields are serialized and
+        written as an update, which fails instead of creating a partial
+        document if the simulation no longer exists.
+        """
+        if fields is not None:
+            if not await self.update(simulation.id, simulation.to_patch(fields)):
+                raise RepositoryError(
+                    "Simulation not found for partial upsert", "upsert", "SimulationState", simulation.id
+                )
+            return simulation.id
+        try:
+            await self.firestore_client.upsert_document(
+                self.COLLECTION_NAME,
+                simulation.id,
+                simulation.to_dict()
+            )
+            self._invalidate_name_index(simulation.id, simulation.name)
+            logger.info(f"Upserted simulation: {simulation.id}")
+            return simulation.id
+        except Exception as e:
+            logger.error(f"Failed to upsert simulation {simulation.id}: {e}")
+            raise RepositoryError(f"Failed to upsert simulation: {e}", "upsert", "SimulationState", simulation.id)
+    
     async def delete(self, simulation_id: str) -> bool:
         """Delete a simulation by ID."""
         try:
             result = await self.firestore_client.delete_document(self.COLLECTION_NAME, simulation_id)
+            self._invalidate_name_index(simulation_id)
             
             if result:
                 logger.info(f"Deleted simulation: {simulation_id}")
@@ -91,11 +127,15 @@ class SimulationRepository(Repository[SimulationState]):
     
     async def list_all(self, limit: Optional[int] = None) -> List[SimulationState]:
         """List all simulations."""
+        simulations = [simulation async for simulation in self.iter_all(limit)]
+        logger.debug(f"Listed {len(simulations)} simulations")
+        return simulations
+    
+    async def iter_all(self, limit: Optional[int] = None) -> AsyncIterator[SimulationState]:
+        """Stream simulations as their documents arrive from Firestore."""
         try:
-            documents = await self.firestore_client.list_documents(self.COLLECTION_NAME, limit)
-            simulations = [SimulationState.from_dict(doc) for doc in documents]
-            logger.debug(f"Listed {len(simulations)} simulations")
-            return simulations
+            async for doc_id, data in self.firestore_client.iter_documents(self.COLLECTION_NAME, limit):
+                yield SimulationState.from_firestore(doc_id, data)
         except Exception as e:
             logger.error(f"Failed to list simulations: {e}")
             raise RepositoryError(f"Failed to list simulations: {e}", "list", "SimulationState")
@@ -108,7 +148,7 @@ class SimulationRepository(Repository[SimulationState]):
                 filters, 
                 limit
             )
-            simulations = [SimulationState.from_dict(doc) for doc in documents]
+            simulations = [SimulationState.from_firestore(doc_id, data) for doc_id, data in documents]
             logger.debug(f"Queried {len(simulations)} simulations with filters {filters}")
             return simulations
         except Exception as e:
@@ -142,6 +182,52 @@ class SimulationRepository(Repository[SimulationState]):
         return await self.find_by_status(SimulationStatus.COMPLETED, limit)
     
     async def find_by_name(self, name: str) -> Optional[SimulationState]:
-        """Find simulation by exact name match."""
+        """
+        Find simulation by exact name match.
+        
+        Recently resolved names are served from a short-lived name -> ID index,
+        turning the query into a single document read.
+        """
+        simulation_id = self._cached_name_lookup(name)
+        if simulation_id is not None:
+            simulation = await self.get(simulation_id)
+            if simulation is not None and simulation.name == name:
+                return simulation
+            self._invalidate_name_index(simulation_id, name)
+        
         simulations = await self.query({"name": name}, limit=1)
-        return simulations[0] if simulations else None
\ No newline at end of file
+        if not simulations:
+            return None
+        self._remember_name(name, simulations[0].id)
+        return simulations[0]
+    
+    def _cached_name_lookup(self, name: str) -> Optional[str]:
+        entry = self._name_index.get(name)
+        if entry is None:
+            return None
+        expires_at, simulation_id = entry
+        if expires_at < time.monotonic():
+            self._forget_name(name)
+            return None
+        return simulation_id
+    
+    def _remember_name(self, name: str, simulation_id: str) -> None:
+        # Keep the index one-to-one so the reverse map stays exact
+        self._invalidate_name_index(simulation_id, name)
+        if len(self._name_index) >= self.NAME_CACHE_MAX_ENTRIES:
+            # Drop the oldest entry (dicts preserve insertion order)
+            self._forget_name(next(iter(self._name_index)))
+        self._name_index[name] = (time.monotonic() + self.NAME_CACHE_TTL_SECONDS, simulation_id)
+        self._name_by_id[simulation_id] = name
+    
+    def _invalidate_name_index(self, simulation_id: str, name: Optional[str] = None) -> None:
+        if name is not None:
+            self._forget_name(name)
+        cached_name = self._name_by_id.get(simulation_id)
+        if cached_name is not None:
+            self._forget_name(cached_name)
+    
+    def _forget_name(self, name: str) -> None:
+        entry = self._name_index.pop(name, None)
+        if entry is not None:
+            self._name_by_id.pop(entry[1], None)
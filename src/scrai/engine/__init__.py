@@ -4,6 +4,7 @@ from .phase_engine import PhaseEngine, PhaseEngineConfig
 from .phase_handlers import PhaseHandlerRegistry
 from .context import PhaseContext, PhaseResult
 from .exceptions import PhaseEngineError, PhaseExecutionError
+from .response_cache import PhaseResponseCache
 
 __all__ = [
     "PhaseEngine",
@@ -13,4 +14,5 @@ __all__ = [
     "PhaseResult",
     "PhaseEngineError",
     "PhaseExecutionError",
+    "PhaseResponseCache",
 ]
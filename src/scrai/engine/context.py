@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from ..data import Repository
@@ -10,6 +11,7 @@ from ..llm import LLMService
 from ..scenarios import ScenarioService
 from ..models import Action, Actor, Event, SimulationState
 from ..models.simulation_state import SimulationPhase
+from .response_cache import PhaseResponseCache
 
 
 @dataclass(slots=True)
@@ -23,7 +25,12 @@ class PhaseContext:
     action_repository: Repository[Action]
     llm_service: Optional[LLMService] = None
     scenario_service: Optional[ScenarioService] = None
+    response_cache: Optional[PhaseResponseCache] = None
+    # Per-simulation slices of a combined cycle response, shared across phases
+    cycle_plan: Optional[Dict[str, Any]] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Single timestamp shared by everything a handler stamps during this step
+    now: datetime = field(default_factory=datetime.utcnow)
 
     @property
     def phase(self) -> SimulationPhase:
@@ -31,16 +38,7 @@ class PhaseContext:
 
     def with_simulation(self, simulation: SimulationState) -> "PhaseContext":
         """Return a new context with an updated simulation state."""
-        return PhaseContext(
-            simulation=simulation,
-            simulation_repository=self.simulation_repository,
-            actor_repository=self.actor_repository,
-            event_repository=self.event_repository,
-            action_repository=self.action_repository,
-            llm_service=self.llm_service,
-            scenario_service=self.scenario_service,
-            metadata=self.metadata,
-        )
+        return replace(self, simulation=simulation)
 
 
 @dataclass(slots=True)
@@ -3,9 +3,163 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Optional
-
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+try:
+    import json_repair
+    JSON_REPAIR_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    json_repair = None
+    JSON_REPAIR_AVAILABLE = False
+
+from .._json import loads as _json_loads
+from ..llm.base import LLMMessage
 from ..models import Action, Actor, Event, SimulationState
+from ..models.event import EventType
+
+logger = logging.getLogger(__name__)
+
+# Provider hint marking a message block as a cacheable prompt prefix.
+PROMPT_CACHE_CONTROL: Dict[str, str] = {"type": "ephemeral"}
+
+_STATIC_CONTEXT_CACHE_SIZE = 128
+_static_context_cache: "OrderedDict[Hashable, str]" = OrderedDict()
+
+# Rendered actor blocks keyed by (actor ID, updated_at), so a roster where only
+# some actors changed re-renders just those actors
+_ACTOR_BLOCK_CACHE_SIZE = 1024
+_actor_block_cache: "OrderedDict[Tuple[str, datetime], str]" = OrderedDict()
+
+
+def _static_context_key(simulation: SimulationState, actors: List[Actor]) -> Tuple[Hashable, ...]:
+    return (
+        simulation.id,
+        simulation.name,
+        simulation.scenario_module,
+        simulation.phase_number,
+        simulation.status.value,
+        tuple((actor.id, actor.updated_at) for actor in actors),
+    )
+
+
+def _format_actor_block(actor: Actor) -> str:
+    location_str = actor.location.get("name", "Unknown") if actor.location else "Unknown"
+    traits = actor.attributes.get("traits", {})
+    skills = actor.attributes.get("skills", [])
+    role = actor.metadata.get("role")
+    
+    lines = [
+        f"- **{actor.name}** (ID: {actor.id})\n  - Type: {actor.type.value}\n  - Location: {location_str}"
+    ]
+    if traits:
+        lines.append(f"  - Traits: {', '.join(f'{k}: {v}' for k, v in traits.items())}")
+    if skills:
+        lines.append(f"  - Skills: {', '.join(skills)}")
+    if role:
+        lines.append(f"  - Role: {role}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _cached_actor_block(actor: Actor) -> str:
+    key = (actor.id, actor.updated_at)
+    block = _actor_block_cache.get(key)
+    if block is None:
+        block = _format_actor_block(actor)
+        _actor_block_cache[key] = block
+        if len(_actor_block_cache) > _ACTOR_BLOCK_CACHE_SIZE:
+            _actor_block_cache.popitem(last=False)
+    else:
+        _actor_block_cache.move_to_end(key)
+    return block
+
+
+def _iter_static_blocks(simulation: SimulationState, actors: List[Actor]) -> Iterator[str]:
+    yield (
+        f"# Simulation: {simulation.name}\n"
+        f"Scenario: {simulation.scenario_module}\n"
+        f"Current Cycle: {simulation.phase_number}\n"
+        f"Status: {simulation.status.value}\n"
+        "\n"
+        "## Active Actors"
+    )
+    for actor in actors:
+        yield _cached_actor_block(actor)
+
+
+# Fetch all rendered fields of an item in one call instead of one lookup each
+_event_fields = attrgetter("title", "type", "description", "status")
+_action_fields = attrgetter("actor_id", "intent", "type", "priority", "status")
+
+
+def _iter_dynamic_blocks(
+    events: List[Event],
+    actions: List[Action],
+    actors: List[Actor],
+) -> Iterator[str]:
+    if events:
+        yield "## Recent Events"
+        for title, event_type, description, status in map(_event_fields, events):
+            yield (
+                f"- **{title}** ({event_type.value})\n"
+                f"  - {description}\n"
+                f"  - Status: {status.value}\n"
+            )
+    
+    if actions:
+        yield "## Pending Actions"
+        actor_names = {actor.id: actor.name for actor in actors}
+        for actor_id, intent, action_type, priority, status in map(_action_fields, actions):
+            yield (
+                f"- **{actor_names.get(actor_id, actor_id)}**: {intent}\n"
+                f"  - Type: {action_type.value}, Priority: {priority.value}\n"
+                f"  - Status: {status.value}\n"
+            )
+
+
+def build_static_context(simulation: SimulationState, actors: List[Actor]) -> str:
+    """Build the rarely-changing prompt prefix (simulation header and actors).
+    
+    The rendered text is memoized per simulation header and actor versions so
+    repeated phases reuse a byte-identical prefix, which providers can cache.
+    """
+    key = _static_context_key(simulation, actors)
+    cached = _static_context_cache.get(key)
+    if cached is not None:
+        _static_context_cache.move_to_end(key)
+        return cached
+    
+    static_context = "\n".join(_iter_static_blocks(simulation, actors))
+    _static_context_cache[key] = static_context
+    if len(_static_context_cache) > _STATIC_CONTEXT_CACHE_SIZE:
+        _static_context_cache.popitem(last=False)
+    return static_context
+
+
+def build_dynamic_context(
+    events: List[Event],
+    actions: List[Action],
+    actors: List[Actor],
+) -> str:
+    """Build the per-phase prompt suffix (recent events and pending actions)."""
+    return "\n".join(_iter_dynamic_blocks(events, actions, actors))
 
 
 def build_simulation_context(
@@ -16,50 +170,50 @@ def build_simulation_context(
 ) -> str:
     """Build a comprehensive context summary for LLM prompts."""
     
-    context_parts = [
-        f"# Simulation: {simulation.name}",
-        f"Scenario: {simulation.scenario_module}",
-        f"Current Cycle: {simulation.phase_number}",
-        f"Status: {simulation.status.value}",
-        "",
-        "## Active Actors",
-    ]
-    
-    for actor in actors:
-        location_str = actor.location.get("name", "Unknown") if actor.location else "Unknown"
-        traits = actor.attributes.get("traits", {})
-        skills = actor.attributes.get("skills", [])
-        
-        context_parts.append(f"- **{actor.name}** (ID: {actor.id})")
-        context_parts.append(f"  - Type: {actor.type.value}")
-        context_parts.append(f"  - Location: {location_str}")
-        if traits:
-            context_parts.append(f"  - Traits: {', '.join(f'{k}: {v}' for k, v in traits.items())}")
-        if skills:
-            context_parts.append(f"  - Skills: {', '.join(skills)}")
-        if actor.metadata.get("role"):
-            context_parts.append(f"  - Role: {actor.metadata['role']}")
-        context_parts.append("")
-    
-    if events:
-        context_parts.append("## Recent Events")
-        for event in events:
-            context_parts.append(f"- **{event.title}** ({event.type.value})")
-            context_parts.append(f"  - {event.description}")
-            context_parts.append(f"  - Status: {event.status.value}")
-            context_parts.append("")
-    
-    if actions:
-        context_parts.append("## Pending Actions")
-        for action in actions:
-            actor = next((a for a in actors if a.id == action.actor_id), None)
-            actor_name = actor.name if actor else action.actor_id
-            context_parts.append(f"- **{actor_name}**: {action.intent}")
-            context_parts.append(f"  - Type: {action.type.value}, Priority: {action.priority.value}")
-            context_parts.append(f"  - Status: {action.status.value}")
-            context_parts.append("")
+    static_context = build_static_context(simulation, actors)
+    dynamic_context = build_dynamic_context(events, actions, actors)
+    if not dynamic_context:
+        return static_context
+    return f"{static_context}\n{dynamic_context}"
+
+
+_CONTEXT_MARKER = "\x00context\x00"
+
+
+@lru_cache(maxsize=32)
+def _template_parts(template: str) -> Tuple[str, str]:
+    # Resolve escaped braces once and split around the single {context} field
+    prefix, suffix = template.format(context=_CONTEXT_MARKER).split(_CONTEXT_MARKER)
+    return prefix, suffix
+
+
+def render_prompt(template: str, context: str) -> str:
+    """Render a ``{context}`` prompt template without re-parsing it on each call."""
+    prefix, suffix = _template_parts(template)
+    return "".join((prefix, context, suffix))
+
+
+def build_phase_messages(
+    system_prompt: str,
+    template: str,
+    simulation: SimulationState,
+    actors: List[Actor],
+    events: List[Event],
+    actions: List[Action],
+) -> List[LLMMessage]:
+    """Assemble phase prompt messages with the static context first.
     
-    return "\n".join(context_parts)
+    The simulation header and actor roster go in their own block tagged for
+    provider prompt caching; the phase template is rendered with only the
+    volatile events/actions context.
+    """
+    static_context = build_static_context(simulation, actors)
+    dynamic_context = build_dynamic_context(events, actions, actors)
+    return [
+        LLMMessage(role="system", content=system_prompt),
+        LLMMessage(role="user", content=static_context, cache_control=PROMPT_CACHE_CONTROL),
+        LLMMessage(role="user", content=render_prompt(template, dynamic_context)),
+    ]
 
 
 EVENT_GENERATION_PROMPT = """You are a creative simulation engine analyzing the current state of a community simulation.
@@ -78,21 +232,8 @@ Generate 1-3 NEW events that feel natural and compelling. Each event should:
 - Include concrete details about what happens
 - Fit the scenario's tone and setting
 
-Respond with ONLY a valid JSON array of events in this exact format:
-[
-  {{
-    "title": "Brief event title",
-    "description": "Detailed description of what happens",
-    "type": "social|environmental|economic|political|system",
-    "affected_actors": ["actor-id-1", "actor-id-2"],
-    "location": {{"name": "Location Name"}},
-    "scope": "local|regional|global",
-    "source": "Description of what caused this event",
-    "trigger_action_id": "action-id or null",
-    "parameters": {{}},
-    "metadata": {{}}
-  }}
-]
+Respond with ONLY a valid JSON array of events in this exact format (aa=affected_actors, tid=trigger_action_id):
+[{{"title":"Brief event title","description":"Detailed description of what happens","type":"social|environmental|economic|political|system","aa":["actor-id"],"location":{{"name":"Location Name"}},"scope":"local|regional|global","source":"What caused this event","tid":"action-id or null"}}]
 
 Generate events now:"""
 
@@ -113,29 +254,8 @@ For each action, provide:
 3. Any effects on the actor (attribute changes, location changes, etc.)
 4. Any new events that should be generated as a result
 
-Respond with ONLY a valid JSON array in this exact format:
-[
-  {{
-    "action_id": "action-id",
-    "status": "completed|failed",
-    "outcome_description": "What happened when the actor attempted this",
-    "actor_effects": {{
-      "attribute_changes": {{"attribute_name": "new_value"}},
-      "location_change": {{"name": "New Location"}} or null,
-      "metadata_updates": {{}}
-    }},
-    "generated_events": [
-      {{
-        "title": "Event title",
-        "description": "What happens as a result",
-        "type": "social|environmental|economic|political",
-        "affected_actors": ["actor-id"],
-        "source": "Result of action: action-id",
-        "trigger_action_id": "action-id"
-      }}
-    ]
-  }}
-]
+Respond with ONLY a valid JSON array in this exact format (od=outcome_description, ae=actor_effects, ac=attribute_changes, lc=location_change, mu=metadata_updates, ge=generated_events, aa=affected_actors, tid=trigger_action_id):
+[{{"action_id":"action-id","status":"completed|failed","od":"What happened when the actor attempted this","ae":{{"ac":{{"attribute_name":"new_value"}},"lc":{{"name":"New Location"}} or null,"mu":{{}}}},"ge":[{{"title":"Event title","description":"What happens as a result","type":"social|environmental|economic|political","aa":["actor-id"],"source":"Result of action: action-id","tid":"action-id"}}]}}]
 
 Resolve actions now:"""
 
@@ -150,59 +270,295 @@ Your task is to determine how recent events affect actors and the environment. F
 - Update locations if actors moved
 - Record any lasting changes to the world state
 
-Respond with ONLY a valid JSON object in this exact format:
-{{
-  "actor_updates": [
-    {{
-      "actor_id": "actor-id",
-      "attribute_changes": {{"relationship_with_X": "+10", "stress": "high"}},
-      "location_change": {{"name": "New Location"}} or null,
-      "metadata_updates": {{"recent_events": ["event-id"]}}
-    }}
-  ],
-  "world_state_changes": {{
-    "environment": {{}},
-    "global_events": [],
-    "notes": ["Description of world changes"]
-  }}
-}}
+Respond with ONLY a valid JSON object in this exact format (au=actor_updates, ac=attribute_changes, lc=location_change, mu=metadata_updates, wsc=world_state_changes):
+{{"au":[{{"actor_id":"actor-id","ac":{{"relationship_with_X":"+10","stress":"high"}},"lc":{{"name":"New Location"}} or null,"mu":{{"recent_events":["event-id"]}}}}],"wsc":{{"environment":{{}},"global_events":[],"notes":["Description of world changes"]}}}}
 
 Apply event effects now:"""
 
 
+CYCLE_PLAN_PROMPT = """You are a simulation engine planning one full cycle of a community simulation.
+
+{context}
+
+Work through the cycle in three sections and answer all of them in a single response.
+
+## EVENTS
+Generate 1-3 NEW events that naturally emerge from the current state. Each event should have a clear cause, affect specific actors, include concrete details and fit the scenario's tone.
+
+## RESOLUTIONS
+Determine the outcome of each pending action: success or failure, a narrative description, effects on the actor and any new events that result.
+
+## WORLD_UPDATES
+Determine how the recent events (including the ones generated above) affect actors and the environment: attribute changes, location changes and lasting world state changes.
+
+Respond with ONLY a valid JSON object in this exact format (aa=affected_actors, tid=trigger_action_id, od=outcome_description, ae=actor_effects, ac=attribute_changes, lc=location_change, mu=metadata_updates, ge=generated_events, au=actor_updates, wsc=world_state_changes):
+{{"events":[{{"title":"Brief event title","description":"Detailed description of what happens","type":"social|environmental|economic|political|system","aa":["actor-id"],"location":{{"name":"Location Name"}},"scope":"local|regional|global","source":"What caused this event","tid":"action-id or null"}}],"resolutions":[{{"action_id":"action-id","status":"completed|failed","od":"What happened","ae":{{"ac":{{"attribute_name":"new_value"}},"lc":{{"name":"New Location"}} or null,"mu":{{}}}},"ge":[{{"title":"Event title","description":"What happens as a result","type":"social|environmental|economic|political","aa":["actor-id"],"source":"Result of action: action-id","tid":"action-id"}}]}}],"world_updates":{{"au":[{{"actor_id":"actor-id","ac":{{"stress":"high"}},"lc":{{"name":"New Location"}} or null,"mu":{{}}}}],"wsc":{{"environment":{{}},"global_events":[],"notes":["Description of world changes"]}}}}}}
+
+Plan the cycle now:"""
+
+
+# Short response keys used in the prompt examples, mapped back to schema names
+RESPONSE_KEY_ALIASES: Dict[str, str] = {
+    "aa": "affected_actors",
+    "tid": "trigger_action_id",
+    "od": "outcome_description",
+    "ae": "actor_effects",
+    "ac": "attribute_changes",
+    "lc": "location_change",
+    "mu": "metadata_updates",
+    "ge": "generated_events",
+    "au": "actor_updates",
+    "wsc": "world_state_changes",
+}
+
+# Maps whose keys are free-form data and must not be un-aliased
+_FREEFORM_KEYS = frozenset({
+    "attribute_changes",
+    "location",
+    "location_change",
+    "metadata",
+    "metadata_updates",
+    "parameters",
+    "world_state_changes",
+})
+
+
+def expand_response_keys(value: Any, aliases: Dict[str, str] = RESPONSE_KEY_ALIASES) -> Any:
+    """Rename aliased response keys back to their schema names."""
+    if isinstance(value, list):
+        return [expand_response_keys(item, aliases) for item in value]
+    if isinstance(value, dict):
+        expanded: Dict[str, Any] = {}
+        for key, item in value.items():
+            name = aliases.get(key) or key
+            expanded[name] = item if name in _FREEFORM_KEYS else expand_response_keys(item, aliases)
+        return expanded
+    return value
+
+
+def _strip_code_fence(content: str) -> str:
+    """Return the body of the first markdown code fence, or the content unchanged."""
+    _, fence, rest = content.partition("```json")
+    if not fence:
+        _, fence, rest = content.partition("```")
+    if not fence:
+        return content
+    return rest.partition("```")[0]
+
+
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+
+def _repair_json_text(text: str) -> str:
+    """Fix common LLM JSON slips: trailing commas, Python literals, unclosed brackets.
+    
+    Also closes a string cut off at the end of the text. This is the fallback
+    when the optional ``json_repair`` package is not installed and it handles
+    only those slips: single-quoted strings, prose before the JSON (outside a
+    code fence) and trailing text after it are left alone, so such replies
+    still fail to parse.
+    """
+    out: List[str] = []
+    closers: List[str] = []
+    in_string = False
+    escaped = False
+    i = 0
+    length = len(text)
+    while i < length:
+        char = text[i]
+        if in_string:
+            out.append(char)
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            i += 1
+            continue
+        if char == '"':
+            in_string = True
+        elif char in "[{":
+            closers.append("]" if char == "[" else "}")
+        elif char in "]}":
+            # Drop a trailing comma before the closing bracket
+            while out and out[-1].isspace():
+                out.pop()
+            if out and out[-1] == ",":
+                out.pop()
+            if closers:
+                closers.pop()
+        elif char.isalpha():
+            end = i
+            while end < length and text[end].isalpha():
+                end += 1
+            word = text[i:end]
+            out.append(_PYTHON_LITERALS.get(word, word))
+            i = end
+            continue
+        out.append(char)
+        i += 1
+    
+    if in_string:
+        out.append('"')
+    while out and (out[-1].isspace() or out[-1] == ","):
+        out.pop()
+    out.extend(reversed(closers))
+    return "".join(out)
+
+
+def _repair_json(text: str) -> Any:
+    """Best-effort parse of malformed JSON; raises ``ValueError`` if unrecoverable."""
+    if JSON_REPAIR_AVAILABLE:
+        return json_repair.loads(text)
+    return _json_loads(_repair_json_text(text))
+
+
 def parse_llm_json_response(content: str, expected_type: str = "array") -> Any:
     """Parse LLM JSON response with error handling."""
     
-    # Try to extract JSON from markdown code blocks if present
-    if "```json" in content:
-        start = content.find("```json") + 7
-        end = content.find("```", start)
-        if end > start:
-            content = content[start:end].strip()
-    elif "```" in content:
-        start = content.find("```") + 3
-        end = content.find("```", start)
-        if end > start:
-            content = content[start:end].strip()
+    try:
+        # Fast path: the response is already bare JSON
+        parsed = _json_loads(content)
+    except json.JSONDecodeError:
+        # Extract JSON from markdown code blocks if present
+        body = _strip_code_fence(content).strip()
+        try:
+            parsed = _json_loads(body)
+        except json.JSONDecodeError as e:
+            # Repair common syntax slips before discarding the whole response
+            try:
+                parsed = _repair_json(body)
+                logger.debug("Repaired malformed LLM JSON response: %s", e)
+            except ValueError:
+                # Log the error and return empty structure
+                logger.warning("Failed to parse LLM JSON response: %s; content: %s", e, body[:500])
+                return [] if expected_type == "array" else {}
     
-    # Clean up common issues
-    content = content.strip()
+    # Validate expected type
+    if expected_type == "array" and not isinstance(parsed, list):
+        return []
+    elif expected_type == "object" and not isinstance(parsed, dict):
+        return {}
     
+    return expand_response_keys(parsed)
+
+
+def _parse_array_item(text: str) -> Any:
     try:
-        parsed = json.loads(content)
-        
-        # Validate expected type
-        if expected_type == "array" and not isinstance(parsed, list):
-            return []
-        elif expected_type == "object" and not isinstance(parsed, dict):
-            return {}
-        
-        return parsed
-    except json.JSONDecodeError as e:
-        # Log the error and return empty structure
-        print(f"Failed to parse LLM JSON response: {e}")
-        print(f"Content: {content[:500]}")
-        return [] if expected_type == "array" else {}
+        item = _json_loads(text)
+    except json.JSONDecodeError:
+        item = _repair_json(text)
+    return expand_response_keys(item)
+
+
+async def iter_json_array_items(chunks: AsyncIterable[str]) -> AsyncIterator[Any]:
+    """Incrementally parse a streamed JSON array, yielding each element once it closes.
+    
+    Text before the opening ``[`` (prose, code fences) is ignored, and elements
+    that cannot be parsed or repaired are skipped.
+    """
+    item: List[str] = []
+    depth = 0
+    in_string = False
+    escaped = False
+    closed = False
+    
+    async for chunk in chunks:
+        if closed:
+            break
+        for char in chunk:
+            if depth == 0:
+                if char == "[":
+                    depth = 1
+                continue
+            if in_string:
+                item.append(char)
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+                continue
+            
+            if char == '"':
+                in_string = True
+            elif char in "[{":
+                depth += 1
+            elif char in "]}":
+                depth -= 1
+                if depth == 0:
+                    closed = True
+                    break
+            
+            if depth == 1 and char in ",]}":
+                # A closing bracket back at depth 1 ends a nested element
+                if char != ",":
+                    item.append(char)
+                text = "".join(item).strip()
+                item.clear()
+                if text:
+                    try:
+                        yield _parse_array_item(text)
+                    except ValueError as e:
+                        logger.warning("Skipping unparseable streamed JSON element: %s", e)
+            else:
+                item.append(char)
+    
+    # Salvage a trailing element from a truncated stream or the closing bracket
+    text = "".join(item).strip()
+    if text:
+        try:
+            yield _parse_array_item(text)
+        except ValueError as e:
+            logger.warning("Skipping unparseable streamed JSON element: %s", e)
+
+
+# Field checks for the items the phase prompts ask for. Each entry maps a field
+# to (accepted types, allowed values, list element types); absent fields fall
+# back to the handler defaults, so only fields that are present are checked.
+_FieldCheck = Tuple[Tuple[type, ...], Optional[FrozenSet[str]], Optional[type]]
+_ITEM_SCHEMAS: Dict[str, Dict[str, _FieldCheck]] = {
+    "event": {
+        "type": ((str,), frozenset(event_type.value for event_type in EventType), None),
+        "affected_actors": ((list,), None, str),
+        "trigger_action_id": ((str, type(None)), None, None),
+    },
+    "resolution": {
+        "action_id": ((str,), None, None),
+        "generated_events": ((list,), None, None),
+        "actor_effects": ((dict,), None, None),
+    },
+}
+_SCHEMA_CACHE: Dict[str, Callable[[Any], bool]] = {}
+
+
+def _compile_item_schema(fields: Dict[str, _FieldCheck]) -> Callable[[Any], bool]:
+    checks = tuple(fields.items())
+
+    def validate(item: Any) -> bool:
+        if not isinstance(item, dict):
+            return False
+        for key, (types, allowed, element_type) in checks:
+            if key not in item:
+                continue
+            value = item[key]
+            if not isinstance(value, types) or (allowed is not None and value not in allowed):
+                return False
+            if element_type is not None and not all(isinstance(v, element_type) for v in item[key]):
+                return False
+        return True
+
+    return validate
+
+
+def is_valid_item(schema: str, item: Any) -> bool:
+    """Check a parsed LLM item against a known response shape ("event", "resolution")."""
+    validator = _SCHEMA_CACHE.get(schema)
+    if validator is None:
+        validator = _SCHEMA_CACHE[schema] = _compile_item_schema(_ITEM_SCHEMAS[schema])
+    return validator(item)
 
 
 def safe_get_str(data: Dict[str, Any], key: str, default: str = "") -> str:
@@ -6,9 +6,11 @@ import asyncio
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Iterable, List, Optional, Sequence, TYPE_CHECKING
+from typing import Any, Dict, Iterable, List, Optional, Sequence, TYPE_CHECKING
+from weakref import WeakValueDictionary
 
 if TYPE_CHECKING:  # pragma: no cover - type checking only
+    from ..config import Settings
     from ..scenarios import ScenarioService
 
 from ..data import Repository
@@ -17,6 +19,7 @@ from ..models.simulation_state import SimulationPhase, SimulationStatus
 from ..models import Action, Actor, Event, SimulationState
 from .context import PhaseContext, PhaseResult
 from .exceptions import PhaseEngineError, PhaseExecutionError
+from .response_cache import PhaseResponseCache
 from .phase_handlers import (
     ActionCollectionPhaseHandler,
     ActionResolutionPhaseHandler,
@@ -37,6 +40,23 @@ class PhaseEngineConfig:
     persist_phase_notes: bool = True
     enforce_phase_sequence: bool = True
     max_consecutive_failures: int = 3
+    # Oldest phase_log entries are dropped beyond this many
+    max_phase_log_entries: int = 200
+    # Reuse parsed LLM responses for byte-identical phase prompts (replays)
+    cache_llm_responses: bool = False
+    response_cache_size: int = 1024
+    # Ask for events, resolutions and world updates in one LLM call per cycle
+    combine_llm_phases: bool = False
+
+    @classmethod
+    def from_settings(cls, settings: "Settings") -> "PhaseEngineConfig":
+        """Build engine options from the loaded application settings."""
+
+        return cls(
+            cache_llm_responses=settings.llm.cache_responses,
+            response_cache_size=settings.llm.response_cache_size,
+            combine_llm_phases=settings.llm.combine_phases,
+        )
 
 
 _DEFAULT_PHASE_ORDER: Sequence[SimulationPhase] = (
@@ -48,6 +68,10 @@ _DEFAULT_PHASE_ORDER: Sequence[SimulationPhase] = (
     SimulationPhase.SNAPSHOT,
 )
 
+_TERMINAL_STATUSES = frozenset({SimulationStatus.COMPLETED, SimulationStatus.ERROR})
+_STOP_PHASES = frozenset({SimulationPhase.COMPLETED, SimulationPhase.PAUSED})
+_TIMESTAMP_ONLY = frozenset({"updated_at"})
+
 
 class PhaseEngine:
     """Coordinates execution of simulation phases."""
@@ -75,7 +99,15 @@ class PhaseEngine:
         handler_instances = list(handlers) if handlers else self._default_handlers()
         self._registry = PhaseHandlerRegistry(handler_instances)
         self._phase_order = _DEFAULT_PHASE_ORDER
-        self._lock = asyncio.Lock()
+        self._response_cache = (
+            PhaseResponseCache(self._config.response_cache_size)
+            if self._config.cache_llm_responses
+            else None
+        )
+        # One lock per simulation so unrelated simulations can advance concurrently;
+        # entries disappear once no step holds or awaits them.
+        self._locks: WeakValueDictionary[str, asyncio.Lock] = WeakValueDictionary()
+        self._cycle_plans: Dict[str, Dict[str, Any]] = {}
 
     async def step(
         self,
@@ -85,11 +117,11 @@ class PhaseEngine:
     ) -> PhaseResult:
         """Execute a single phase for the specified simulation."""
 
-        async with self._lock:
+        async with self._simulation_lock(simulation_id):
             simulation = await self._load_simulation(simulation_id)
             phase_to_run = force_phase or simulation.current_phase
 
-            if simulation.status in {SimulationStatus.COMPLETED, SimulationStatus.ERROR}:
+            if simulation.status in _TERMINAL_STATUSES:
                 raise PhaseExecutionError(
                     f"Simulation is in terminal state '{simulation.status.value}'.",
                     simulation_id=simulation_id,
@@ -107,18 +139,26 @@ class PhaseEngine:
                 action_repository=self._action_repository,
                 llm_service=self._llm_service,
                 scenario_service=self._scenario_service,
+                response_cache=self._response_cache,
+                cycle_plan=(
+                    self._cycle_plans.setdefault(simulation_id, {})
+                    if self._config.combine_llm_phases
+                    else None
+                ),
             )
 
-            logger.debug("Running phase %s for simulation %s", phase_to_run.value, simulation_id)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Running phase %s for simulation %s", phase_to_run.value, simulation_id)
             result = await handler.run(context)
 
-            await self._apply_phase_result(simulation_id, result)
-            logger.info(
-                "Completed phase %s for simulation %s -> next phase %s",
-                result.executed_phase.value,
-                simulation_id,
-                result.next_phase.value,
-            )
+            await self._apply_phase_result(simulation_id, result, context.now)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Completed phase %s for simulation %s -> next phase %s",
+                    result.executed_phase.value,
+                    simulation_id,
+                    result.next_phase.value,
+                )
 
             return result
 
@@ -128,7 +168,7 @@ class PhaseEngine:
         results: List[PhaseResult] = []
         for _ in range(len(self._phase_order)):
             simulation = await self._load_simulation(simulation_id)
-            if simulation.status in {SimulationStatus.COMPLETED, SimulationStatus.ERROR}:
+            if simulation.status in _TERMINAL_STATUSES:
                 break
 
             phase = simulation.current_phase
@@ -143,13 +183,20 @@ class PhaseEngine:
             result = await self.step(simulation_id, force_phase=phase)
             results.append(result)
 
-            if result.next_phase in {SimulationPhase.COMPLETED, SimulationPhase.PAUSED}:
+            if result.next_phase in _STOP_PHASES:
                 break
             if result.executed_phase == SimulationPhase.SNAPSHOT:
                 break
 
         return results
 
+    def _simulation_lock(self, simulation_id: str) -> asyncio.Lock:
+        lock = self._locks.get(simulation_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[simulation_id] = lock
+        return lock
+
     async def _load_simulation(self, simulation_id: str) -> SimulationState:
         simulation = await self._simulation_repository.get(simulation_id)
         if simulation is None:
@@ -178,28 +225,36 @@ class PhaseEngine:
                 phase=phase.value,
             )
 
-    async def _apply_phase_result(self, simulation_id: str, result: PhaseResult) -> None:
+    async def _apply_phase_result(
+        self, simulation_id: str, result: PhaseResult, now: datetime
+    ) -> None:
         simulation = result.simulation
 
         if self._config.persist_phase_notes and result.notes:
             entry = {
                 "phase": result.executed_phase.value,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": now.isoformat(),
                 "notes": result.notes,
             }
-            history = simulation.metadata.get("phase_log", [])
+            history = simulation.metadata.setdefault("phase_log", [])
             history.append(entry)
-            simulation.metadata["phase_log"] = history
+            overflow = len(history) - self._config.max_phase_log_entries
+            if overflow > 0:
+                del history[:overflow]
+            simulation.mark_dirty("metadata")
 
-        self._update_cycle_progress(simulation, result)
+        self._update_cycle_progress(simulation, result, now)
         await self._persist_simulation(simulation_id, simulation)
 
-    def _update_cycle_progress(self, simulation: SimulationState, result: PhaseResult) -> None:
+    def _update_cycle_progress(
+        self, simulation: SimulationState, result: PhaseResult, now: datetime
+    ) -> None:
         executed_phase = result.executed_phase
         next_phase = result.next_phase
 
         if executed_phase == SimulationPhase.SNAPSHOT:
             simulation.phase_number += 1
+            self._cycle_plans.pop(simulation.id, None)
 
             if simulation.phase_number >= simulation.max_phases:
                 simulation.complete()
@@ -210,16 +265,30 @@ class PhaseEngine:
         elif simulation.status == SimulationStatus.COMPLETED:
             simulation.current_phase = SimulationPhase.COMPLETED
 
-        simulation.updated_at = datetime.utcnow()
+        simulation.updated_at = now
 
     async def _persist_simulation(self, simulation_id: str, simulation: SimulationState) -> None:
+        dirty_fields = simulation.dirty_fields
+        if dirty_fields <= _TIMESTAMP_ONLY:
+            # Nothing but the bookkeeping timestamp changed, so skip the write.
+            # The new updated_at is dropped: the next step reloads the
+            # simulation from the repository.
+            logger.debug("Skipping persistence for unchanged simulation %s", simulation_id)
+            return
+
         try:
-            updated = await self._simulation_repository.update(simulation_id, simulation.to_dict())
+            # Write only the fields changed during the phase. update() fails
+            # for a simulation deleted mid-step instead of re-creating it as
+            # a partial document.
+            updated = await self._simulation_repository.update(
+                simulation_id, simulation.to_patch(dirty_fields)
+            )
             if not updated:
                 raise PhaseEngineError(
                     "Simulation document was not updated (possibly missing).",
                     simulation_id=simulation_id,
                 )
+            simulation.clear_dirty()
         except Exception as exc:  # pragma: no cover - persistence failure path
             logger.error(
                 "Failed to persist simulation %s after phase execution: %s",
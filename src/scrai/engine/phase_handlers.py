@@ -2,32 +2,217 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import uuid
+import secrets
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Collection, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
+from ..data import Repository
+from ..llm import LLMMessage
 from ..models import Action, Actor, Event, SimulationState
 from ..models.action import ActionStatus, ActionType
 from ..models.event import EventStatus, EventType
 from ..models.simulation_state import SimulationPhase, SimulationStatus
-from ..scenarios import ScenarioContext
-from ..llm.base import LLMMessage
+from ..scenarios import Scenario, ScenarioContext, ScenarioService
 from .context import PhaseContext, PhaseResult
 from .llm_prompts import (
-    build_simulation_context,
+    build_phase_messages,
+    is_valid_item,
+    iter_json_array_items,
     parse_llm_json_response,
     safe_get_dict,
     safe_get_list,
     safe_get_str,
     ACTION_RESOLUTION_PROMPT,
+    CYCLE_PLAN_PROMPT,
     EVENT_GENERATION_PROMPT,
     WORLD_UPDATE_PROMPT,
 )
 
 logger = logging.getLogger(__name__)
 
+_FINISHED_ACTION_STATUSES = frozenset({ActionStatus.COMPLETED, ActionStatus.CANCELLED})
+# Below this many entities the thread hand-off costs more than the dumps it saves
+_OFFLOAD_SERIALIZATION_AT = 32
+
+
+def _short_id(prefix: str) -> str:
+    """Return ``<prefix>-<8 random hex chars>`` for a generated entity."""
+    return f"{prefix}-{secrets.token_hex(4)}"
+
+
+async def _create_missing(repository: Repository[Any], entities: Sequence[Any]) -> None:
+    """Create the entities that do not already exist in the repository."""
+    if not entities:
+        return
+    existing = await repository.exists_many([entity.id for entity in entities])
+    await asyncio.gather(
+        *(repository.create(entity) for entity in entities if entity.id not in existing)
+    )
+
+
+@lru_cache(maxsize=256)
+def _attribute_setter(path: str) -> Callable[[Dict[str, Any], Any], None]:
+    """Return a setter for a dotted attribute path like "traits.leadership"."""
+    *parents, leaf = path.split(".")
+
+    def set_nested(attributes: Dict[str, Any], value: Any) -> None:
+        current = attributes
+        for part in parents:
+            current = current.setdefault(part, {})
+        current[leaf] = value
+    return set_nested
+
+
+def _apply_actor_changes(actor: Actor, changes: Dict[str, Any], now: datetime) -> None:
+    """Apply LLM-described attribute, location and metadata changes to an actor in memory."""
+    attribute_changes = changes.get("attribute_changes", {})
+    if attribute_changes:
+        # Flat keys are the common case and go in with one update; only
+        # dotted paths need the per-key nested walk
+        nested = [key for key in attribute_changes if "." in key]
+        if not nested:
+            actor.attributes.update(attribute_changes)
+        else:
+            actor.attributes.update(
+                {key: value for key, value in attribute_changes.items() if "." not in key}
+            )
+            for key in nested:
+                _attribute_setter(key)(actor.attributes, attribute_changes[key])
+
+    location_change = changes.get("location_change")
+    if location_change:
+        actor.location = location_change
+
+    metadata_updates = changes.get("metadata_updates", {})
+    if metadata_updates:
+        actor.metadata.update(metadata_updates)
+
+    actor.updated_at = now
+
+
+async def _ensure_loaded(
+    repository: Repository[Any], index: Dict[str, Any], entity_ids: Iterable[str]
+) -> None:
+    """Fetch the given IDs that are not yet in ``index`` and add them to it."""
+    missing = [entity_id for entity_id in dict.fromkeys(entity_ids) if entity_id not in index]
+    if missing:
+        for entity in await repository.get_many(missing):
+            index[entity.id] = entity
+
+
+def _serialize(entities: Iterable[Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    return [(entity.id, entity.to_dict()) for entity in entities]
+
+
+async def _update_payloads(entities: Sequence[Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Serialize entities for ``update_many``, off the event loop for large batches."""
+    if len(entities) < _OFFLOAD_SERIALIZATION_AT:
+        return _serialize(entities)
+    return await asyncio.to_thread(_serialize, entities)
+
+
+async def _plan_cycle(
+    context: PhaseContext, cycle_plan: Dict[str, Any], messages: List[LLMMessage]
+) -> AsyncIterator[Dict[str, Any]]:
+    """Request the whole cycle in one call, keep the later phases' slices and yield its events."""
+    plan = await _complete_json(context, "cycle_plan", messages, expected_type="object")
+    resolutions = plan.get("resolutions")
+    if isinstance(resolutions, list):
+        cycle_plan["resolutions"] = resolutions
+    world_updates = plan.get("world_updates")
+    if isinstance(world_updates, dict):
+        cycle_plan["world_updates"] = world_updates
+    for item in plan.get("events") or []:
+        if isinstance(item, dict):
+            yield item
+
+
+def _take_planned(context: PhaseContext, key: str) -> Optional[Any]:
+    """Pop a phase's slice from the combined cycle response, if one was planned."""
+    if context.cycle_plan is None:
+        return None
+    return context.cycle_plan.pop(key, None)
+
+
+async def _gather_state(
+    context: PhaseContext, *, include_actions: bool = True
+) -> Tuple[List[Actor], List[Event], List[Action]]:
+    """Load active actors, pending events and pending actions in one concurrent wave.
+
+    A failing load cancels the others and its error is re-raised unwrapped.
+    """
+    simulation = context.simulation
+    try:
+        async with asyncio.TaskGroup() as group:
+            actors = group.create_task(context.actor_repository.get_many(simulation.active_actor_ids))
+            events = group.create_task(context.event_repository.get_many(simulation.pending_event_ids))
+            actions = (
+                group.create_task(context.action_repository.get_many(simulation.pending_action_ids))
+                if include_actions
+                else None
+            )
+    except ExceptionGroup as exc:
+        raise exc.exceptions[0] from None
+    return actors.result(), events.result(), actions.result() if actions is not None else []
+
+
+async def _complete_json(
+    context: PhaseContext,
+    prompt_id: str,
+    messages: List[LLMMessage],
+    expected_type: str,
+) -> Any:
+    """Call the LLM and parse its JSON reply, consulting the response cache first."""
+    assert context.llm_service is not None
+    cache = context.response_cache
+    key: Optional[str] = None
+    if cache is not None:
+        key = cache.key(prompt_id, messages)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    response = await context.llm_service.complete(messages)
+    parsed = parse_llm_json_response(response.content, expected_type=expected_type)
+    if cache is not None and key is not None and parsed:
+        cache.put(key, parsed)
+    return parsed
+
+
+async def _stream_json_items(
+    context: PhaseContext,
+    prompt_id: str,
+    messages: List[LLMMessage],
+) -> AsyncIterator[Any]:
+    """Yield streamed JSON array items, replaying cached items for identical prompts."""
+    assert context.llm_service is not None
+    cache = context.response_cache
+    key: Optional[str] = None
+    if cache is not None:
+        key = cache.key(prompt_id, messages)
+        cached = cache.get(key)
+        if cached is not None:
+            for item in cached:
+                yield item
+            return
+
+    items: List[Any] = []
+    async for item in iter_json_array_items(context.llm_service.stream(messages)):
+        items.append(item)
+        yield item
+    if cache is not None and key is not None and items:
+        cache.put(key, items)
+
+
+async def _replay(items: Iterable[Any]) -> AsyncIterator[Any]:
+    """Yield already-parsed items through the same interface as a streamed response."""
+    for item in items:
+        yield item
+
 
 class BasePhaseHandler(ABC):
     """Abstract base class for all phase handlers."""
@@ -56,10 +241,10 @@ class PhaseHandlerRegistry:
             self._handlers[handler.phase] = handler
 
     def get(self, phase: SimulationPhase) -> BasePhaseHandler:
-        try:
-            return self._handlers[phase]
-        except KeyError as exc:
-            raise KeyError(f"No handler registered for phase {phase}") from exc
+        handler = self._handlers.get(phase)
+        if handler is None:
+            raise KeyError(f"No handler registered for phase {phase}")
+        return handler
 
     def phases(self) -> List[SimulationPhase]:  # pragma: no cover - trivial
         return list(self._handlers.keys())
@@ -80,7 +265,7 @@ class InitializePhaseHandler(BasePhaseHandler):
             notes.append("Simulation resumed from paused state")
 
         simulation.current_phase = SimulationPhase.INITIALIZE
-        simulation.updated_at = datetime.utcnow()
+        simulation.updated_at = context.now
         notes.append("Initialization phase complete")
 
         return PhaseResult(
@@ -94,6 +279,18 @@ class InitializePhaseHandler(BasePhaseHandler):
 class EventGenerationPhaseHandler(BasePhaseHandler):
     phase = SimulationPhase.EVENT_GENERATION
 
+    def __init__(self, *, name: Optional[str] = None):
+        super().__init__(name=name)
+        self._scenario_cache: Dict[str, Scenario] = {}
+
+    def _select_scenario(self, scenario_service: ScenarioService, key: str) -> Optional[Scenario]:
+        scenario = self._scenario_cache.get(key)
+        if scenario is None:
+            scenario = scenario_service.select(key)
+            if scenario is not None:
+                self._scenario_cache[key] = scenario
+        return scenario
+
     async def run(self, context: PhaseContext) -> PhaseResult:
         simulation = context.simulation
         notes: List[str] = []
@@ -107,7 +304,7 @@ class EventGenerationPhaseHandler(BasePhaseHandler):
             )
         else:
             scenario_key = simulation.scenario_module
-            scenario = scenario_service.select(scenario_key)
+            scenario = self._select_scenario(scenario_service, scenario_key)
 
             if scenario is None:
                 notes.append(
@@ -119,10 +316,14 @@ class EventGenerationPhaseHandler(BasePhaseHandler):
 
                 if not seeded:
                     # First cycle: seed scenario
-                    scenario_context = ScenarioContext(state=simulation)
+                    # Seed against the phase's clock reading (tz-aware, as scenarios expect)
+                    scenario_context = ScenarioContext(
+                        state=simulation, now=context.now.replace(tzinfo=timezone.utc)
+                    )
                     scenario.seed(scenario_context)
                     scenario_metadata["seeded"] = True
-                    scenario_metadata["seeded_at"] = datetime.utcnow().isoformat()
+                    scenario_metadata["seeded_at"] = context.now.isoformat()
+                    simulation.mark_dirty("metadata")
 
                     event_ids, action_ids = await self._persist_generated_entities(
                         context,
@@ -141,17 +342,17 @@ class EventGenerationPhaseHandler(BasePhaseHandler):
                     )
                 else:
                     # Subsequent cycles: use LLM to generate new events
-                    new_events = await self._generate_events_with_llm(context)
+                    new_events, written_ids = await self._generate_events_with_llm(context)
                     if new_events:
                         event_ids, _ = await self._persist_generated_entities(
-                            context, simulation, [], new_events, []
+                            context, simulation, [], new_events, [], written_ids=written_ids
                         )
                         generated_event_ids.extend(event_ids)
                         notes.append(f"Generated {len(new_events)} new events via LLM.")
                     else:
                         notes.append("No new events generated this cycle.")
 
-        simulation.updated_at = datetime.utcnow()
+        simulation.updated_at = context.now
 
         return PhaseResult(
             simulation=simulation,
@@ -162,40 +363,44 @@ class EventGenerationPhaseHandler(BasePhaseHandler):
             generated_action_ids=generated_action_ids,
         )
 
-    async def _generate_events_with_llm(self, context: PhaseContext) -> List[Event]:
-        """Use LLM to generate new events based on current simulation state."""
+    async def _generate_events_with_llm(self, context: PhaseContext) -> Tuple[List[Event], Set[str]]:
+        """Use LLM to generate new events, returning them with the IDs already written."""
         
         if not context.llm_service:
             logger.info("No LLM service available; skipping AI-driven event generation")
-            return []
+            return [], set()
         
         simulation = context.simulation
         
         # Gather current state
-        actors = await self._load_actors(context)
-        events = await self._load_events(context)
-        actions = await self._load_actions(context)
+        actors, events, actions = await _gather_state(context)
         
-        # Build context for LLM
-        sim_context = build_simulation_context(simulation, actors, events, actions)
-        prompt = EVENT_GENERATION_PROMPT.format(context=sim_context)
+        # Build context for LLM (static actor roster first for prompt caching)
+        messages = build_phase_messages(
+            "You are a creative narrative simulation engine.",
+            CYCLE_PLAN_PROMPT if context.cycle_plan is not None else EVENT_GENERATION_PROMPT,
+            simulation,
+            actors,
+            events,
+            actions,
+        )
         
+        new_events: List[Event] = []
+        pending_writes: List["asyncio.Task[str]"] = []
         try:
-            # Call LLM
-            response = await context.llm_service.complete([
-                LLMMessage(role="system", content="You are a creative narrative simulation engine."),
-                LLMMessage(role="user", content=prompt)
-            ])
-            
-            # Parse response
-            events_data = parse_llm_json_response(response.content, expected_type="array")
-            
-            # Create Event objects
-            new_events: List[Event] = []
-            for event_data in events_data:
+            # Stream the response and persist each event as soon as its JSON
+            # element closes, overlapping writes with the rest of generation
+            if context.cycle_plan is not None:
+                events_data = _plan_cycle(context, context.cycle_plan, messages)
+            else:
+                events_data = _stream_json_items(context, "event_generation", messages)
+            async for event_data in events_data:
+                if not is_valid_item("event", event_data):
+                    logger.warning("Skipping malformed event from LLM data: %r", event_data)
+                    continue
                 try:
                     event = Event(
-                        id=f"event-{uuid.uuid4().hex[:8]}",
+                        id=_short_id("event"),
                         title=safe_get_str(event_data, "title", "Untitled Event"),
                         description=safe_get_str(event_data, "description", ""),
                         type=EventType(event_data.get("type", "social")),
@@ -207,67 +412,30 @@ class EventGenerationPhaseHandler(BasePhaseHandler):
                         trigger_action_id=event_data.get("trigger_action_id"),
                         parameters=safe_get_dict(event_data, "parameters"),
                         metadata=safe_get_dict(event_data, "metadata"),
-                        scheduled_for=datetime.utcnow(),
+                        scheduled_for=context.now,
                     )
                     new_events.append(event)
                 except Exception as e:
                     logger.warning(f"Failed to create event from LLM data: {e}")
                     continue
-            
-            logger.info(f"LLM generated {len(new_events)} events")
-            return new_events
+                pending_writes.append(asyncio.create_task(context.event_repository.create(event)))
             
         except Exception as e:
-            logger.error(f"Error generating events with LLM: {e}")
-            return []
-    
-    async def _load_actors(self, context: PhaseContext) -> List[Actor]:
-        """Load active actors from simulation."""
-        actors: List[Actor] = []
-        for actor_id in context.simulation.active_actor_ids:
-            actor = await context.actor_repository.get(actor_id)
-            if actor:
-                actors.append(actor)
-        return actors
-    
-    async def _load_events(self, context: PhaseContext) -> List[Event]:
-        """Load pending events from simulation."""
-        events: List[Event] = []
-        for event_id in context.simulation.pending_event_ids:
-            event = await context.event_repository.get(event_id)
-            if event:
-                events.append(event)
-        return events
+            # Events that arrived before the failure are still kept
+            logger.error(f"Error generating events with LLM after {len(new_events)} events: {e}")
+        
+        # Only events whose early write failed are left for _persist_generated_entities
+        outcomes = await asyncio.gather(*pending_writes, return_exceptions=True)
+        written_ids = {
+            event.id for event, outcome in zip(new_events, outcomes) if not isinstance(outcome, BaseException)
+        }
+        logger.info(f"LLM generated {len(new_events)} events")
+        return new_events, written_ids
     
-    async def _load_actions(self, context: PhaseContext) -> List[Action]:
-        """Load pending actions from simulation."""
-        actions: List[Action] = []
-        for action_id in context.simulation.pending_action_ids:
-            action = await context.action_repository.get(action_id)
-            if action:
-                actions.append(action)
-        return actions
-
     async def _build_context_from_state(self, context: PhaseContext) -> ScenarioContext:
         scenario_context = ScenarioContext(state=context.simulation)
 
-        actors: List[Actor] = []
-        for actor_id in context.simulation.active_actor_ids:
-            actor = await context.actor_repository.get(actor_id)
-            if actor:
-                actors.append(actor)
-
-        events: List[Event] = []
-        for event_id in context.simulation.pending_event_ids:
-            event = await context.event_repository.get(event_id)
-            if event:
-                events.append(event)
-
-        actions: List[Action] = []
-        for action_id in context.simulation.pending_action_ids:
-            action = await context.action_repository.get(action_id)
-            if action:
-                actions.append(action)
+        actors, events, actions = await _gather_state(context)
 
         scenario_context.extend(actors=actors, events=events, actions=actions)
         return scenario_context
@@ -279,34 +447,35 @@ class EventGenerationPhaseHandler(BasePhaseHandler):
         new_actors: Sequence[Actor],
         new_events: Sequence[Event],
         new_actions: Sequence[Action],
+        *,
+        written_ids: Collection[str] = (),
     ) -> tuple[List[str], List[str]]:
-        generated_event_ids: List[str] = []
-        generated_action_ids: List[str] = []
-
-        for actor in new_actors:
-            exists = await context.actor_repository.exists(actor.id)
-            if not exists:
-                await context.actor_repository.create(actor)
-            simulation.add_actor(actor.id)
-
-        for event in new_events:
-            exists = await context.event_repository.exists(event.id)
-            if not exists:
-                await context.event_repository.create(event)
-            simulation.add_pending_event(event.id)
-            generated_event_ids.append(event.id)
+        """Create whichever new entities are missing and register them on the simulation.
 
+        Events listed in ``written_ids`` were already created and are not checked again.
+        """
         for action in new_actions:
             # Ensure action has simulation_id set
             if not action.simulation_id:
                 action.simulation_id = simulation.id
-            
-            exists = await context.action_repository.exists(action.id)
-            if not exists:
-                await context.action_repository.create(action)
-            simulation.add_pending_action(action.id)
-            generated_action_ids.append(action.id)
 
+        # Existence checks and creates are independent round-trips; run each
+        # kind as an exists wave followed by a create wave, all kinds at once.
+        await asyncio.gather(
+            _create_missing(context.actor_repository, new_actors),
+            _create_missing(
+                context.event_repository,
+                [event for event in new_events if event.id not in written_ids] if written_ids else new_events,
+            ),
+            _create_missing(context.action_repository, new_actions),
+        )
+
+        generated_event_ids = [event.id for event in new_events]
+        generated_action_ids = [action.id for action in new_actions]
+        with simulation.bulk_update():
+            simulation.add_actors(actor.id for actor in new_actors)
+            simulation.add_pending_events(generated_event_ids)
+            simulation.add_pending_actions(generated_action_ids)
         return generated_event_ids, generated_action_ids
 
 
@@ -319,17 +488,14 @@ class ActionCollectionPhaseHandler(BasePhaseHandler):
 
         # Filter out completed/cancelled actions from the simulation's pending list
         # Don't pull ALL actions - only process the ones assigned to this simulation
-        active_action_ids = []
-        for action_id in simulation.pending_action_ids:
-            action = await context.action_repository.get(action_id)
-            if action and action.status not in {ActionStatus.COMPLETED, ActionStatus.CANCELLED}:
-                active_action_ids.append(action_id)
-        
-        simulation.pending_action_ids = active_action_ids
+        actions = await context.action_repository.get_many(simulation.pending_action_ids)
+        simulation.pending_action_ids = tuple(
+            action.id for action in actions if action.status not in _FINISHED_ACTION_STATUSES
+        )
         notes.append(
             f"Tracked {len(simulation.pending_action_ids)} pending actions for resolution."
         )
-        simulation.updated_at = datetime.utcnow()
+        simulation.updated_at = context.now
 
         return PhaseResult(
             simulation=simulation,
@@ -350,16 +516,32 @@ class ActionResolutionPhaseHandler(BasePhaseHandler):
         if not simulation.pending_action_ids:
             notes.append("No actions queued for resolution.")
         else:
-            # Resolve actions with LLM
-            resolutions, new_events = await self._resolve_actions_with_llm(context)
+            # One load feeds both the prompt and the changes applied afterwards
+            if context.llm_service:
+                actors, events, pending = await _gather_state(context)
+            else:
+                actors, events = [], []
+                pending = await context.action_repository.get_many(simulation.pending_action_ids)
+            resolutions, new_events = await self._resolve_actions_with_llm(
+                context, actors, events, pending
+            )
+            actions_by_id = {action.id: action for action in pending}
+            actors_by_id = {actor.id: actor for actor in actors}
             
-            # Update action statuses
+            resolved_ids = [r["action_id"] for r in resolutions if r.get("action_id")]
+            await _ensure_loaded(context.action_repository, actions_by_id, resolved_ids)
+            # Actors affected by resolutions are loaded once and written once,
+            # even when several actions touch the same actor
+            effect_actor_ids = [
+                actions_by_id[r["action_id"]].actor_id
+                for r in resolutions
+                if r.get("actor_effects") and r.get("action_id") in actions_by_id
+            ]
+            await _ensure_loaded(context.actor_repository, actors_by_id, effect_actor_ids)
+            touched_actors: Dict[str, Actor] = {}
+            resolved_actions: List[Action] = []
             for resolution in resolutions:
-                action_id = resolution.get("action_id")
-                if not action_id:
-                    continue
-                    
-                action = await context.action_repository.get(action_id)
+                action = actions_by_id.get(resolution.get("action_id", ""))
                 if not action:
                     continue
                 
@@ -373,21 +555,29 @@ class ActionResolutionPhaseHandler(BasePhaseHandler):
                 
                 # Apply actor effects
                 actor_effects = resolution.get("actor_effects", {})
-                if actor_effects:
-                    await self._apply_actor_effects(context, action.actor_id, actor_effects)
+                actor = actors_by_id.get(action.actor_id)
+                if actor_effects and actor:
+                    _apply_actor_changes(actor, actor_effects, context.now)
+                    touched_actors[actor.id] = actor
                 
-                await context.action_repository.update(action.id, action.to_dict())
+                resolved_actions.append(action)
             
-            # Persist generated events
-            if new_events:
-                for event in new_events:
-                    await context.event_repository.create(event)
-                    simulation.add_pending_event(event.id)
-                    generated_event_ids.append(event.id)
+            # Persist action, actor and generated event writes together
+            action_payloads, actor_payloads = await asyncio.gather(
+                _update_payloads(resolved_actions),
+                _update_payloads(list(touched_actors.values())),
+            )
+            await asyncio.gather(
+                context.action_repository.update_many(action_payloads),
+                context.actor_repository.update_many(actor_payloads),
+                *(context.event_repository.create(event) for event in new_events),
+            )
+            generated_event_ids.extend(event.id for event in new_events)
+            simulation.add_pending_events(generated_event_ids)
             
             notes.append(f"Resolved {len(resolutions)} actions, generated {len(new_events)} consequent events.")
 
-        simulation.updated_at = datetime.utcnow()
+        simulation.updated_at = context.now
 
         return PhaseResult(
             simulation=simulation,
@@ -397,18 +587,23 @@ class ActionResolutionPhaseHandler(BasePhaseHandler):
             generated_event_ids=generated_event_ids,
         )
     
-    async def _resolve_actions_with_llm(self, context: PhaseContext) -> tuple[List[Dict], List[Event]]:
+    async def _resolve_actions_with_llm(
+        self,
+        context: PhaseContext,
+        actors: List[Actor],
+        events: List[Event],
+        pending: List[Action],
+    ) -> tuple[List[Dict], List[Event]]:
         """Use LLM to resolve pending actions and generate consequence events."""
         
         if not context.llm_service:
             logger.info("No LLM service available; auto-completing actions")
             # Fallback: just mark actions as completed
             resolutions = []
-            for action_id in context.simulation.pending_action_ids:
-                action = await context.action_repository.get(action_id)
-                if action and action.status == ActionStatus.PENDING:
+            for action in pending:
+                if action.status == ActionStatus.PENDING:
                     resolutions.append({
-                        "action_id": action_id,
+                        "action_id": action.id,
                         "status": "completed",
                         "outcome_description": "Action completed (no LLM available)",
                         "actor_effects": {},
@@ -417,61 +612,54 @@ class ActionResolutionPhaseHandler(BasePhaseHandler):
             return resolutions, []
         
         simulation = context.simulation
-        
-        # Gather current state
-        actors = []
-        for actor_id in simulation.active_actor_ids:
-            actor = await context.actor_repository.get(actor_id)
-            if actor:
-                actors.append(actor)
-        
-        events = []
-        for event_id in simulation.pending_event_ids:
-            event = await context.event_repository.get(event_id)
-            if event:
-                events.append(event)
-        
-        actions = []
-        for action_id in simulation.pending_action_ids:
-            action = await context.action_repository.get(action_id)
-            if action and action.status == ActionStatus.PENDING:
-                actions.append(action)
+        actions = [action for action in pending if action.status == ActionStatus.PENDING]
         
         if not actions:
             return [], []
         
-        # Build context for LLM
-        sim_context = build_simulation_context(simulation, actors, events, actions)
-        prompt = ACTION_RESOLUTION_PROMPT.format(context=sim_context)
+        planned = _take_planned(context, "resolutions")
+        
+        # Build context for LLM (static actor roster first for prompt caching)
+        messages = build_phase_messages(
+            "You are a realistic simulation resolution engine.",
+            ACTION_RESOLUTION_PROMPT,
+            simulation,
+            actors,
+            events,
+            actions,
+        )
         
         try:
-            # Call LLM
-            response = await context.llm_service.complete([
-                LLMMessage(role="system", content="You are a realistic simulation resolution engine."),
-                LLMMessage(role="user", content=prompt)
-            ])
-            
-            # Parse response
-            resolutions_data = parse_llm_json_response(response.content, expected_type="array")
-            
-            # Create Event objects from generated events
+            # Build consequence events as each resolution arrives from the stream
+            if planned is not None:
+                source = _replay(planned)
+            else:
+                source = _stream_json_items(context, "action_resolution", messages)
+            resolutions_data: List[Dict] = []
             new_events: List[Event] = []
-            for resolution in resolutions_data:
+            async for resolution in source:
+                if not is_valid_item("resolution", resolution):
+                    continue
+                resolutions_data.append(resolution)
                 generated_events = resolution.get("generated_events", [])
                 for event_data in generated_events:
+                    if not is_valid_item("event", event_data):
+                        logger.warning("Skipping malformed event from resolution data: %r", event_data)
+                        continue
                     try:
-                        event = Event(
-                            id=f"event-{uuid.uuid4().hex[:8]}",
-                            title=safe_get_str(event_data, "title", "Action Consequence"),
-                            description=safe_get_str(event_data, "description", ""),
-                            type=EventType(event_data.get("type", "social")),
-                            status=EventStatus.PENDING,
-                            affected_actors=safe_get_list(event_data, "affected_actors"),
-                            source=safe_get_str(event_data, "source", "action_resolution"),
-                            trigger_action_id=resolution.get("action_id"),
-                            scheduled_for=datetime.utcnow(),
+                        new_events.append(
+                            Event(
+                                id=_short_id("event"),
+                                title=safe_get_str(event_data, "title", "Action Consequence"),
+                                description=safe_get_str(event_data, "description", ""),
+                                type=EventType(event_data.get("type", "social")),
+                                status=EventStatus.PENDING,
+                                affected_actors=safe_get_list(event_data, "affected_actors"),
+                                source=safe_get_str(event_data, "source", "action_resolution"),
+                                trigger_action_id=resolution.get("action_id"),
+                                scheduled_for=context.now,
+                            )
                         )
-                        new_events.append(event)
                     except Exception as e:
                         logger.warning(f"Failed to create event from resolution data: {e}")
             
@@ -491,40 +679,6 @@ class ActionResolutionPhaseHandler(BasePhaseHandler):
                     "generated_events": []
                 })
             return fallback_resolutions, []
-    
-    async def _apply_actor_effects(self, context: PhaseContext, actor_id: str, effects: Dict[str, Any]) -> None:
-        """Apply effects to an actor from action resolution."""
-        actor = await context.actor_repository.get(actor_id)
-        if not actor:
-            return
-        
-        # Apply attribute changes
-        attribute_changes = effects.get("attribute_changes", {})
-        if attribute_changes:
-            for key, value in attribute_changes.items():
-                # Handle nested attributes like "traits.leadership"
-                if "." in key:
-                    parts = key.split(".")
-                    current = actor.attributes
-                    for part in parts[:-1]:
-                        if part not in current:
-                            current[part] = {}
-                        current = current[part]
-                    current[parts[-1]] = value
-                else:
-                    actor.attributes[key] = value
-        
-        # Apply location change
-        location_change = effects.get("location_change")
-        if location_change:
-            actor.location = location_change
-        
-        # Apply metadata updates
-        metadata_updates = effects.get("metadata_updates", {})
-        if metadata_updates:
-            actor.metadata.update(metadata_updates)
-        
-        await context.actor_repository.update(actor_id, actor.to_dict())
 
 
 class WorldUpdatePhaseHandler(BasePhaseHandler):
@@ -537,64 +691,48 @@ class WorldUpdatePhaseHandler(BasePhaseHandler):
         if not simulation.pending_event_ids:
             notes.append("No pending events to apply to world state.")
         else:
-            # Apply event effects with LLM
-            updates = await self._apply_world_updates_with_llm(context)
+            # One load feeds both the prompt and the changes applied afterwards
+            actors, events, _ = await _gather_state(context, include_actions=False)
+            updates = await self._apply_world_updates_with_llm(context, actors, events)
             
             # Apply actor updates
             actor_updates = updates.get("actor_updates", [])
+            actors_by_id = {actor.id: actor for actor in actors}
+            await _ensure_loaded(
+                context.actor_repository,
+                actors_by_id,
+                [u.get("actor_id") for u in actor_updates if u.get("actor_id")],
+            )
+            touched_actors: Dict[str, Actor] = {}
             for update in actor_updates:
-                actor_id = update.get("actor_id")
-                if not actor_id:
-                    continue
-                
-                actor = await context.actor_repository.get(actor_id)
-                if not actor:
-                    continue
-                
-                # Apply attribute changes
-                attribute_changes = update.get("attribute_changes", {})
-                if attribute_changes:
-                    for key, value in attribute_changes.items():
-                        if "." in key:
-                            parts = key.split(".")
-                            current = actor.attributes
-                            for part in parts[:-1]:
-                                if part not in current:
-                                    current[part] = {}
-                                current = current[part]
-                            current[parts[-1]] = value
-                        else:
-                            actor.attributes[key] = value
-                
-                # Apply location change
-                location_change = update.get("location_change")
-                if location_change:
-                    actor.location = location_change
-                
-                # Apply metadata updates
-                metadata_updates = update.get("metadata_updates", {})
-                if metadata_updates:
-                    actor.metadata.update(metadata_updates)
-                
-                await context.actor_repository.update(actor_id, actor.to_dict())
+                actor = actors_by_id.get(update.get("actor_id"))
+                if actor:
+                    _apply_actor_changes(actor, update, context.now)
+                    touched_actors[actor.id] = actor
             
             # Update world state
             world_changes = updates.get("world_state_changes", {})
             if world_changes:
                 simulation.metadata.setdefault("world_state", {}).update(world_changes)
+                simulation.mark_dirty("metadata")
             
-            # Mark events as resolved
-            for event_id in simulation.pending_event_ids:
-                event = await context.event_repository.get(event_id)
-                if event:
-                    event.resolve()
-                    await context.event_repository.update(event_id, event.to_dict())
+            # Mark events as resolved and write every touched entity concurrently
+            for event in events:
+                event.resolve()
+            actor_payloads, event_payloads = await asyncio.gather(
+                _update_payloads(list(touched_actors.values())),
+                _update_payloads(events),
+            )
+            await asyncio.gather(
+                context.actor_repository.update_many(actor_payloads),
+                context.event_repository.update_many(event_payloads),
+            )
             
             notes.append(f"Applied effects of {len(simulation.pending_event_ids)} events to {len(actor_updates)} actors.")
         
         # Clear pending events after processing
-        simulation.pending_event_ids = []
-        simulation.updated_at = datetime.utcnow()
+        simulation.pending_event_ids = ()
+        simulation.updated_at = context.now
 
         return PhaseResult(
             simulation=simulation,
@@ -603,7 +741,9 @@ class WorldUpdatePhaseHandler(BasePhaseHandler):
             notes=notes,
         )
     
-    async def _apply_world_updates_with_llm(self, context: PhaseContext) -> Dict[str, Any]:
+    async def _apply_world_updates_with_llm(
+        self, context: PhaseContext, actors: List[Actor], events: List[Event]
+    ) -> Dict[str, Any]:
         """Use LLM to determine how events affect actors and the world."""
         
         if not context.llm_service:
@@ -612,35 +752,29 @@ class WorldUpdatePhaseHandler(BasePhaseHandler):
         
         simulation = context.simulation
         
-        # Gather current state
-        actors = []
-        for actor_id in simulation.active_actor_ids:
-            actor = await context.actor_repository.get(actor_id)
-            if actor:
-                actors.append(actor)
-        
-        events = []
-        for event_id in simulation.pending_event_ids:
-            event = await context.event_repository.get(event_id)
-            if event:
-                events.append(event)
-        
         if not events:
             return {"actor_updates": [], "world_state_changes": {}}
         
-        # Build context for LLM
-        sim_context = build_simulation_context(simulation, actors, events, [])
-        prompt = WORLD_UPDATE_PROMPT.format(context=sim_context)
+        planned: Optional[Dict[str, Any]] = _take_planned(context, "world_updates")
+        if planned is not None:
+            logger.info(f"Applying planned world updates for {len(events)} events")
+            return planned
+        
+        # Build context for LLM (static actor roster first for prompt caching)
+        messages = build_phase_messages(
+            "You are a simulation world state manager.",
+            WORLD_UPDATE_PROMPT,
+            simulation,
+            actors,
+            events,
+            [],
+        )
         
         try:
             # Call LLM
-            response = await context.llm_service.complete([
-                LLMMessage(role="system", content="You are a simulation world state manager."),
-                LLMMessage(role="user", content=prompt)
-            ])
-            
-            # Parse response
-            updates = parse_llm_json_response(response.content, expected_type="object")
+            updates: Dict[str, Any] = await _complete_json(
+                context, "world_update", messages, expected_type="object"
+            )
             
             logger.info(f"LLM generated world updates for {len(events)} events")
             return updates
@@ -657,21 +791,22 @@ class SnapshotPhaseHandler(BasePhaseHandler):
         simulation = context.simulation
         notes: List[str] = []
 
-        # Record comprehensive snapshot
-        snapshot_data = await self._create_snapshot(context)
+        # Only the summary is persisted, so skip loading and copying actor state
+        snapshot_data = await self._create_snapshot(context, include_actors=False)
         simulation.record_snapshot()
         simulation.metadata.setdefault("snapshots", []).append({
             "cycle": simulation.phase_number,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": context.now.isoformat(),
             "actor_count": len(simulation.active_actor_ids),
             "pending_events": len(simulation.pending_event_ids),
             "pending_actions": len(simulation.pending_action_ids),
             "summary": snapshot_data.get("summary", "")
         })
+        simulation.mark_dirty("metadata")
         
         notes.append(f"Snapshot recorded for cycle {simulation.phase_number}.")
         notes.append(f"Actors: {len(simulation.active_actor_ids)}, Events: {len(simulation.pending_event_ids)}, Actions: {len(simulation.pending_action_ids)}")
-        simulation.updated_at = datetime.utcnow()
+        simulation.updated_at = context.now
 
         return PhaseResult(
             simulation=simulation,
@@ -680,25 +815,27 @@ class SnapshotPhaseHandler(BasePhaseHandler):
             notes=notes,
         )
     
-    async def _create_snapshot(self, context: PhaseContext) -> Dict[str, Any]:
-        """Create a comprehensive snapshot of the current simulation state."""
-        simulation = context.simulation
+    async def _create_snapshot(
+        self, context: PhaseContext, *, include_actors: bool = True
+    ) -> Dict[str, Any]:
+        """Create a snapshot of the current simulation state.
         
-        # Gather actor states
-        actor_snapshots = []
-        for actor_id in simulation.active_actor_ids:
-            actor = await context.actor_repository.get(actor_id)
-            if actor:
-                actor_snapshots.append({
+        Actor states are loaded only when ``include_actors`` is set.
+        """
+        simulation = context.simulation
+        snapshot: Dict[str, Any] = {
+            "cycle": simulation.phase_number,
+            "status": simulation.status.value,
+            "summary": f"Cycle {simulation.phase_number} complete",
+        }
+        if include_actors:
+            snapshot["actors"] = [
+                {
                     "id": actor.id,
                     "name": actor.name,
                     "location": actor.location,
                     "attributes": actor.attributes,
-                })
-        
-        return {
-            "cycle": simulation.phase_number,
-            "status": simulation.status.value,
-            "actors": actor_snapshots,
-            "summary": f"Cycle {simulation.phase_number} complete"
-        }
+                }
+                for actor in await context.actor_repository.get_many(simulation.active_actor_ids)
+            ]
+        return snapshot
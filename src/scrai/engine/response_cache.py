@@ -0,0 +1,55 @@
+"""Exact-match cache for parsed LLM phase responses."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+from collections import OrderedDict
+from typing import Any, Optional, Sequence
+
+from ..llm.base import LLMMessage
+
+
+class PhaseResponseCache:
+    """LRU cache of parsed LLM responses keyed by prompt ID and rendered messages.
+
+    Replaying a phase with an identical prompt (e.g. after a stall or a restore
+    from snapshot) reuses the earlier parsed response instead of calling the LLM.
+    Values are deep-copied in and out so callers may mutate what they receive.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+
+    @staticmethod
+    def key(prompt_id: str, messages: Sequence[LLMMessage]) -> str:
+        digest = hashlib.blake2b(prompt_id.encode("utf-8"), digest_size=32)
+        for message in messages:
+            digest.update(b"\x00")
+            digest.update(message.role.encode("utf-8"))
+            digest.update(b"\x00")
+            digest.update(message.content.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self._entries.get(key)
+        if value is None:
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def put(self, key: str, value: Any) -> None:
+        self._entries[key] = copy.deepcopy(value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+__all__ = ["PhaseResponseCache"]
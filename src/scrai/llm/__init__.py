@@ -9,6 +9,7 @@ from .base import (
     LLMRateLimitError,
 )
 from .service import LLMService, LLMServiceConfig
+from .batching import BatchingLLMService
 from .providers import OpenAICompatibleClient
 
 __all__ = [
@@ -19,6 +20,7 @@ __all__ = [
     "LLMClientError",
     "LLMRateLimitError",
     "LLMService",
+    "BatchingLLMService",
     "LLMServiceConfig",
     "OpenAICompatibleClient",
 ]
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import abc
-import dataclasses
+import sys
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Mapping, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, List, Mapping, Optional, Sequence
 
 
 @dataclass(slots=True)
@@ -24,6 +24,8 @@ class LLMMessage:
 
     role: str
     content: str
+    # Optional provider prompt-caching hint, e.g. {"type": "ephemeral"}
+    cache_control: Optional[Dict[str, Any]] = None
 
 
 @dataclass(slots=True)
@@ -74,6 +76,30 @@ class LLMClient(abc.ABC):
     ) -> LLMResponse:
         """Generate a response from the provider."""
 
+    async def stream_response(
+        self,
+        messages: Iterable[LLMMessage],
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Yield response content incrementally.
+
+        Providers without native streaming emit the full response as one chunk.
+        """
+        response = await self.generate_response(messages, **kwargs)
+        yield response.content
+
+    async def generate_batched_response(
+        self,
+        message_groups: Sequence[Iterable[LLMMessage]],
+        **kwargs: Any,
+    ) -> List[LLMResponse]:
+        """Answer several independent prompts, one response per group.
+
+        Providers that cannot marshal prompts into one request answer each
+        group separately.
+        """
+        return [await self.generate_response(messages, **kwargs) for messages in message_groups]
+
     @abc.abstractmethod
     async def validate_connection(self) -> bool:
         """Validate connectivity and credentials for the provider."""
@@ -99,5 +125,6 @@ def ensure_messages(payload: Iterable[Mapping[str, str] | LLMMessage]) -> List[L
             content = item.get("content")
             if role is None or content is None:
                 raise ValueError("Messages must include 'role' and 'content'.")
-            normalized.append(LLMMessage(role=role, content=content))
+            # Roles come from a tiny set; share one string object per role
+            normalized.append(LLMMessage(role=sys.intern(role), content=content))
     return normalized
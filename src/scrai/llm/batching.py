@@ -0,0 +1,179 @@
+"""Coalescing wrapper that batches concurrent completion requests."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from .base import LLMMessage, LLMResponse, ensure_messages
+from .providers.openai_compatible_client import MAX_MARSHALLED_PROMPTS
+from .service import LLMService, LLMServiceConfig, _request_key
+
+_PendingRequest = Tuple[List[LLMMessage], Optional[str], Dict[str, Any], "asyncio.Future[LLMResponse]"]
+
+
+def _fail_closed(future: "asyncio.Future[LLMResponse]") -> None:
+    if not future.done():
+        future.set_exception(RuntimeError("LLM service closed"))
+
+
+class BatchingLLMService(LLMService):
+    """LLM service that gathers concurrent ``complete`` calls into dispatch batches.
+
+    Calls are queued and a background task drains up to ``max_batch`` requests
+    per ``flush_ms`` window, handing each batch to its own task so a slow
+    completion never holds up the batches behind it. Requests in a batch that
+    share a provider and options are marshalled into one provider request (up
+    to ``MAX_MARSHALLED_PROMPTS`` each) through ``generate_batched_response``,
+    falling back to one request per prompt when the marshalled reply is
+    unusable; the rest are sent on their own. Callers still receive their own
+    response (or exception) through a future. At most ``max_concurrency``
+    provider requests are in flight at once, across all batches.
+    """
+
+    def __init__(
+        self,
+        config: LLMServiceConfig,
+        *,
+        max_batch: int = 8,
+        flush_ms: float = 20.0,
+        max_concurrency: int = 32,
+        coalesce_identical: bool = False,
+    ) -> None:
+        super().__init__(config, coalesce_identical=coalesce_identical)
+        self._max_batch = max(1, max_batch)
+        self._flush_interval = max(0.0, flush_ms) / 1000.0
+        self._max_concurrency = max(1, max_concurrency)
+        self._queue: Optional[asyncio.Queue[_PendingRequest]] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._drain_task: Optional[asyncio.Task[None]] = None
+        self._batch_tasks: Set[asyncio.Task[None]] = set()
+
+    async def complete(
+        self,
+        messages: Iterable[LLMMessage | Mapping[str, str]],
+        *,
+        provider: Optional[str] = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Queue a completion and wait for its batch to be dispatched."""
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[LLMResponse] = loop.create_future()
+        self._ensure_drain_task().put_nowait((ensure_messages(messages), provider, kwargs, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop draining, fail queued and in-flight requests and close client sessions."""
+
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+            self._drain_task = None
+        if self._batch_tasks:
+            batch_tasks = list(self._batch_tasks)
+            for task in batch_tasks:
+                task.cancel()
+            await asyncio.gather(*batch_tasks, return_exceptions=True)
+        if self._queue is not None:
+            while not self._queue.empty():
+                _fail_closed(self._queue.get_nowait()[3])
+            self._queue = None
+        self._semaphore = None
+        await super().close()
+
+    def _ensure_drain_task(self) -> asyncio.Queue[_PendingRequest]:
+        if self._queue is None or self._semaphore is None:
+            self._queue = asyncio.Queue()
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.get_running_loop().create_task(
+                self._drain(self._queue, self._semaphore)
+            )
+        return self._queue
+
+    async def _drain(self, queue: asyncio.Queue[_PendingRequest], semaphore: asyncio.Semaphore) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            try:
+                deadline = loop.time() + self._flush_interval
+                while len(batch) < self._max_batch:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except BaseException:
+                # Requests already taken off the queue would otherwise never resolve
+                for request in batch:
+                    _fail_closed(request[3])
+                raise
+            task = loop.create_task(self._dispatch_batch(batch, semaphore))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _dispatch_batch(self, batch: List[_PendingRequest], semaphore: asyncio.Semaphore) -> None:
+        # Requests with the same provider and options can share one marshalled request
+        groups: Dict[bytes, List[_PendingRequest]] = {}
+        chunks: List[List[_PendingRequest]] = []
+        for request in batch:
+            key = _request_key(request[1], [], request[2])
+            if key is None:
+                chunks.append([request])
+            else:
+                groups.setdefault(key, []).append(request)
+        for group in groups.values():
+            chunks.extend(
+                group[start:start + MAX_MARSHALLED_PROMPTS] for start in range(0, len(group), MAX_MARSHALLED_PROMPTS)
+            )
+        await asyncio.gather(*(self._dispatch(chunk, semaphore) for chunk in chunks))
+
+    async def _dispatch(self, requests: List[_PendingRequest], semaphore: asyncio.Semaphore) -> None:
+        try:
+            async with semaphore:
+                pending = [request for request in requests if not request[3].done()]
+                if not pending:  # every caller was cancelled while queued
+                    return
+                _, provider, kwargs, _ = pending[0]
+                responses = None
+                if len(pending) > 1:
+                    responses = await self._complete_marshalled(
+                        [request[0] for request in pending], provider, kwargs
+                    )
+                if responses is None:
+                    # Sent one by one so a failing prompt only fails its own caller
+                    await asyncio.gather(*(self._dispatch_one(request) for request in pending))
+                    return
+        except Exception as exc:
+            for request in requests:
+                if not request[3].done():
+                    request[3].set_exception(exc)
+        except BaseException:
+            # Cancelled by close(); the callers must not be left waiting
+            for request in requests:
+                _fail_closed(request[3])
+            raise
+        else:
+            for request, response in zip(pending, responses):
+                if not request[3].done():
+                    request[3].set_result(response)
+
+    async def _dispatch_one(self, request: _PendingRequest) -> None:
+        messages, provider, kwargs, future = request
+        try:
+            response = await self._complete_coalesced(messages, provider, kwargs)
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+        else:
+            if not future.done():
+                future.set_result(response)
+
+
+__all__ = ["BatchingLLMService"]
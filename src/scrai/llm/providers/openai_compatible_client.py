@@ -3,13 +3,22 @@
 from __future__ import annotations
 
 import asyncio
-import dataclasses
 import logging
 import os
-from typing import Any, Dict, Iterable, List, Mapping, Optional
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
 
-import requests
+import httpx
 
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    HTTP2_AVAILABLE = False
+
+from ..._json import dumps as _json_dumps, loads as _json_loads
 from ..base import (
     LLMClient,
     LLMClientError,
@@ -27,6 +36,60 @@ DEFAULT_OPENROUTER_MODEL = "openrouter/gpt-4.1-mini"
 DEFAULT_OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 DEFAULT_LM_STUDIO_BASE_URL = "http://localhost:1234/v1"
 
+# Beyond this many prompts per marshalled request the reply quality and latency
+# gains fall off, so larger groups are split by the caller
+MAX_MARSHALLED_PROMPTS = 16
+
+_MARSHAL_INSTRUCTIONS = (
+    "You will receive {count} independent requests, numbered from 0. Answer each one "
+    "on its own, exactly as if it had been sent alone, following any instructions it "
+    'contains. Respond with ONLY a JSON object of the form {{"responses": [{{"index": '
+    '<request number>, "content": "<your complete answer as a string>"}}, ...]}} with '
+    "exactly one entry per request."
+)
+
+# Keep TCP/TLS connections warm across the many concurrent phase calls
+DEFAULT_CONNECTION_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+_RETRY_BACKOFF_BASE = 0.25
+_RETRY_BACKOFF_MAX = 8.0
+# Upper bound on a server-requested Retry-After wait
+_RETRY_AFTER_MAX = 60.0
+
+
+# Set while a caller with its own rate-limit backoff (LLMService.batch_complete)
+# drives requests, so a 429 is raised at once instead of also being retried here
+_rate_limit_retries_deferred: ContextVar[bool] = ContextVar("scrai_rate_limit_retries_deferred", default=False)
+
+
+@contextmanager
+def defer_rate_limit_retries() -> Iterator[None]:
+    """Raise ``LLMRateLimitError`` on the first 429 for requests made in this context.
+
+    Connection errors, timeouts and 5xx responses are still retried.
+    """
+    token = _rate_limit_retries_deferred.set(True)
+    try:
+        yield
+    finally:
+        _rate_limit_retries_deferred.reset(token)
+
+
+def _backoff_delay(attempt: int) -> float:
+    return min(_RETRY_BACKOFF_MAX, _RETRY_BACKOFF_BASE * 2.0 ** (attempt - 1)) * (0.5 + random.random())
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return min(_RETRY_AFTER_MAX, max(0.0, float(value)))
+    except ValueError:
+        # HTTP-date form; fall back to the regular backoff
+        return None
+
 
 class OpenAICompatibleClient(LLMClient):
     """Async-friendly wrapper around any OpenAI-compatible HTTP API."""
@@ -45,6 +108,7 @@ class OpenAICompatibleClient(LLMClient):
         provider_label: str = "openrouter",
         api_key_header: str = "Authorization",
         extra_headers: Optional[Mapping[str, str]] = None,
+        prompt_caching: bool = False,
     ) -> None:
         resolved_base_url = base_url or DEFAULT_OPENROUTER_BASE_URL
         resolved_model = model or DEFAULT_OPENROUTER_MODEL
@@ -64,7 +128,16 @@ class OpenAICompatibleClient(LLMClient):
         self._max_retries = max_retries
         self._api_key_header = api_key_header
         self._extra_headers = dict(extra_headers or {})
-        self._session = requests.Session()
+        self._prompt_caching = prompt_caching
+        # Request fields that never change for this client, copied per request
+        self._base_payload: Dict[str, Any] = {"model": resolved_model}
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            headers=self._build_headers(),
+            timeout=timeout,
+            limits=DEFAULT_CONNECTION_LIMITS,
+            http2=HTTP2_AVAILABLE,
+        )
 
     async def generate_response(
         self,
@@ -76,31 +149,30 @@ class OpenAICompatibleClient(LLMClient):
         frequency_penalty: Optional[float] = None,
         presence_penalty: Optional[float] = None,
         response_format: Optional[Dict[str, Any]] = None,
+        include_raw: bool = False,
         **kwargs: Any,
     ) -> LLMResponse:
-        """Generate a chat completion using an OpenAI-compatible API."""
-
-        normalized = ensure_messages(messages)
-        payload: Dict[str, Any] = {
-            "model": self.model,
-            "messages": [dataclasses.asdict(msg) for msg in normalized],
-            "temperature": temperature,
-        }
-
-        if max_tokens is not None:
-            payload["max_tokens"] = max_tokens
-        if top_p is not None:
-            payload["top_p"] = top_p
-        if frequency_penalty is not None:
-            payload["frequency_penalty"] = frequency_penalty
-        if presence_penalty is not None:
-            payload["presence_penalty"] = presence_penalty
-        if response_format is not None:
-            payload["response_format"] = response_format
-
-        payload.update(kwargs)
+        """Generate a chat completion using an OpenAI-compatible API.
+
+        The parsed response body is only kept on ``LLMResponse.raw`` when
+        ``include_raw`` is set, so it can be freed as soon as the content,
+        finish reason and usage have been extracted.
+        """
+
+        payload = self._build_payload(
+            messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            frequency_penalty=frequency_penalty,
+            presence_penalty=presence_penalty,
+            response_format=response_format,
+            **kwargs,
+        )
 
-        response_data = await self._request("POST", self.CHAT_COMPLETIONS_ENDPOINT, json=payload)
+        response_data = await self._request(
+            "POST", self.CHAT_COMPLETIONS_ENDPOINT, content=_json_dumps(payload)
+        )
 
         try:
             choice = response_data["choices"][0]
@@ -131,8 +203,174 @@ class OpenAICompatibleClient(LLMClient):
             provider=self.provider,
             finish_reason=finish_reason,
             usage=usage,
-            raw=response_data,
+            raw=response_data if include_raw else None,
+        )
+
+    async def generate_batched_response(
+        self,
+        message_groups: Sequence[Iterable[LLMMessage | Mapping[str, str]]],
+        **kwargs: Any,
+    ) -> List[LLMResponse]:
+        """Marshal several independent prompts into one chat completion.
+
+        The prompts are numbered in a single user message and the model is asked
+        for a JSON object with one ``{index, content}`` entry per prompt, which is
+        split back into one ``LLMResponse`` per group. Token usage is attached to
+        the first response. Raises ``LLMClientError`` when the reply does not
+        contain an answer for every prompt.
+        """
+
+        groups = [ensure_messages(messages) for messages in message_groups]
+        if len(groups) > MAX_MARSHALLED_PROMPTS:
+            raise ValueError(f"At most {MAX_MARSHALLED_PROMPTS} prompts can be marshalled per request")
+        if len(groups) == 1:
+            return [await self.generate_response(groups[0], **kwargs)]
+
+        sections = []
+        for index, messages in enumerate(groups):
+            body = "\n\n".join(f"[{message.role}]\n{message.content}" for message in messages)
+            sections.append(f"### Request {index}\n{body}")
+        kwargs.setdefault("response_format", {"type": "json_object"})
+        combined = await self.generate_response(
+            [
+                LLMMessage(role="system", content=_MARSHAL_INSTRUCTIONS.format(count=len(groups))),
+                LLMMessage(role="user", content="\n\n".join(sections)),
+            ],
+            **kwargs,
+        )
+
+        try:
+            entries = _json_loads(combined.content)["responses"]
+            contents = {int(entry["index"]): str(entry["content"]) for entry in entries}
+        except (ValueError, KeyError, TypeError) as exc:
+            raise LLMClientError(
+                f"Unexpected marshalled response received from provider '{self.provider}'",
+                provider=self.provider,
+                model=self.model,
+            ) from exc
+        missing = [index for index in range(len(groups)) if index not in contents]
+        if missing:
+            raise LLMClientError(
+                f"Marshalled response from provider '{self.provider}' is missing requests {missing}",
+                provider=self.provider,
+                model=self.model,
+            )
+
+        return [
+            LLMResponse(
+                content=contents[index],
+                model=combined.model,
+                provider=combined.provider,
+                usage=combined.usage if index == 0 else None,
+                finish_reason=combined.finish_reason,
+                raw=combined.raw if index == 0 else None,
+            )
+            for index in range(len(groups))
+        ]
+
+    async def stream_response(
+        self,
+        messages: Iterable[LLMMessage | Mapping[str, str]],
+        *,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        top_p: Optional[float] = None,
+        frequency_penalty: Optional[float] = None,
+        presence_penalty: Optional[float] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Stream content deltas from a chat completion (server-sent events)."""
+
+        payload = self._build_payload(
+            messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            frequency_penalty=frequency_penalty,
+            presence_penalty=presence_penalty,
+            response_format=response_format,
+            **kwargs,
         )
+        payload["stream"] = True
+
+        try:
+            async with self._client.stream(
+                "POST", self.CHAT_COMPLETIONS_ENDPOINT, content=_json_dumps(payload)
+            ) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                self._raise_for_status(response)
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    try:
+                        delta = _json_loads(data)["choices"][0].get("delta") or {}
+                    except (ValueError, KeyError, IndexError, TypeError) as exc:
+                        raise LLMClientError(
+                            f"Unexpected stream chunk received from provider '{self.provider}': {data}",
+                            provider=self.provider,
+                            model=self.model,
+                        ) from exc
+                    content = delta.get("content")
+                    if content:
+                        yield content
+        except httpx.HTTPError as exc:  # pragma: no cover - network errors
+            raise LLMClientError(
+                f"{self.provider} streaming request failed: {exc}",
+                provider=self.provider,
+                model=self.model,
+            ) from exc
+
+    def _build_payload(
+        self,
+        messages: Iterable[LLMMessage | Mapping[str, str]],
+        *,
+        temperature: float,
+        max_tokens: Optional[int],
+        top_p: Optional[float],
+        frequency_penalty: Optional[float],
+        presence_penalty: Optional[float],
+        response_format: Optional[Dict[str, Any]],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        normalized = ensure_messages(messages)
+        payload = self._base_payload.copy()
+        payload["messages"] = [self._message_payload(msg) for msg in normalized]
+        payload["temperature"] = temperature
+
+        if max_tokens is not None:
+            payload["max_tokens"] = max_tokens
+        if top_p is not None:
+            payload["top_p"] = top_p
+        if frequency_penalty is not None:
+            payload["frequency_penalty"] = frequency_penalty
+        if presence_penalty is not None:
+            payload["presence_penalty"] = presence_penalty
+        if response_format is not None:
+            payload["response_format"] = response_format
+
+        payload.update(kwargs)
+        return payload
+
+    def _message_payload(self, message: LLMMessage) -> Dict[str, Any]:
+        """Serialize a message, emitting cache hints as content parts when enabled."""
+
+        if self._prompt_caching and message.cache_control:
+            return {
+                "role": message.role,
+                "content": [
+                    {
+                        "type": "text",
+                        "text": message.content,
+                        "cache_control": message.cache_control,
+                    }
+                ],
+            }
+        return {"role": message.role, "content": message.content}
 
     async def validate_connection(self) -> bool:
         try:
@@ -148,61 +386,80 @@ class OpenAICompatibleClient(LLMClient):
         return models
 
     async def close(self) -> None:
-        self._session.close()
-
-    async def _request(self, method: str, endpoint: str, **kwargs: Any) -> Dict[str, Any]:
-        """Execute an HTTP request in an async-friendly manner with retries."""
+        await self._client.aclose()
 
-        url = f"{self._base_url}{endpoint}"
+    def _build_headers(self) -> Dict[str, str]:
         headers = {
             "Content-Type": "application/json",
             **self._extra_headers,
         }
         if self._api_key:
             headers[self._api_key_header] = f"Bearer {self._api_key}" if self._api_key_header.lower() == "authorization" else self._api_key
+        return headers
 
-        loop = asyncio.get_running_loop()
+    def _raise_for_status(self, response: httpx.Response) -> None:
+        if response.status_code == 429:
+            raise LLMRateLimitError(
+                f"{self.provider} rate limit exceeded",
+                provider=self.provider,
+                model=self.model,
+            )
 
-        for attempt in range(1, self._max_retries + 1):
-            try:
-                response = await loop.run_in_executor(
-                    None,
-                    lambda: self._session.request(
-                        method,
-                        url,
-                        headers=headers,
-                        timeout=self._timeout,
-                        **kwargs,
-                    ),
-                )
+        if response.status_code >= 400:
+            raise LLMClientError(
+                f"{self.provider} request failed with status {response.status_code}: {response.text}",
+                provider=self.provider,
+                model=self.model,
+            )
 
-                if response.status_code == 429:
-                    raise LLMRateLimitError(
-                        f"{self.provider} rate limit exceeded",
-                        provider=self.provider,
-                        model=self.model,
-                    )
+    async def _request(self, method: str, endpoint: str, **kwargs: Any) -> Dict[str, Any]:
+        """Execute an HTTP request on the shared async client, retrying transient failures.
 
-                if response.status_code >= 400:
-                    raise LLMClientError(
-                        f"{self.provider} request failed with status {response.status_code}: {response.text}",
-                        provider=self.provider,
-                        model=self.model,
-                    )
-
-                return response.json()
-
-            except (LLMClientError, LLMRateLimitError):
-                raise
-            except Exception as exc:  # pragma: no cover - network errors
-                logger.warning(
-                    "%s request attempt %s failed: %s", self.provider, attempt, exc, exc_info=exc
-                )
-                if attempt == self._max_retries:
-                    raise LLMClientError(
-                        f"{self.provider} request failed after {self._max_retries} attempts: {exc}",
-                        provider=self.provider,
-                        model=self.model,
-                    ) from exc
+        Connection errors, timeouts, 429 and 5xx responses are retried with
+        jittered exponential backoff (or the server's ``Retry-After``); other
+        4xx responses fail immediately, as do 429s inside
+        ``defer_rate_limit_retries``.
+        """
+
+        for attempt in range(1, self._max_retries + 1):
+            retry_after: Optional[float] = None
+            try:
+                response = await self._client.request(method, endpoint, **kwargs)
+            except (httpx.TransportError, asyncio.TimeoutError) as exc:
+                failure: Exception = exc
+            else:
+                if response.status_code != 429 and response.status_code < 500:
+                    self._raise_for_status(response)
+                    try:
+                        data: Dict[str, Any] = _json_loads(response.content)
+                        return data
+                    except ValueError as exc:
+                        raise LLMClientError(
+                            f"{self.provider} returned a response that is not valid JSON",
+                            provider=self.provider,
+                            model=self.model,
+                        ) from exc
+                if response.status_code == 429 and _rate_limit_retries_deferred.get():
+                    self._raise_for_status(response)
+                retry_after = _retry_after_seconds(response)
+                try:
+                    self._raise_for_status(response)
+                except LLMClientError as exc:
+                    failure = exc
+
+            if attempt == self._max_retries:
+                if isinstance(failure, LLMClientError):
+                    raise failure
+                raise LLMClientError(
+                    f"{self.provider} request failed after {self._max_retries} attempts: {failure}",
+                    provider=self.provider,
+                    model=self.model,
+                ) from failure
+
+            delay = retry_after if retry_after is not None else _backoff_delay(attempt)
+            logger.warning(
+                "%s request attempt %s failed: %s; retrying in %.2fs", self.provider, attempt, failure, delay
+            )
+            await asyncio.sleep(delay)
 
         raise LLMClientError("LLM request failed unexpectedly", provider=self.provider, model=self.model)
@@ -3,15 +3,31 @@
 from __future__ import annotations
 
 import asyncio
-import dataclasses
+import hashlib
+import json
+import logging
 import os
+import random
+import time
+import weakref
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
 from .base import LLMClient, LLMClientError, LLMMessage, LLMRateLimitError, LLMResponse, ensure_messages
 from .providers import OpenAICompatibleClient
+from .providers.openai_compatible_client import MAX_MARSHALLED_PROMPTS, defer_rate_limit_retries
+
+logger = logging.getLogger(__name__)
 
 _DEFAULT_LM_PROXY_BASE_URL = "http://localhost:11434/v1"
+# Provider model catalogs change over hours or days; refresh them at most daily
+# and keep a copy on disk so restarts and offline runs can reuse it
+_MODELS_CACHE_TTL = 24 * 60 * 60
+DEFAULT_MODELS_CACHE_DIR = Path.home() / ".scrai" / "cache"
+# Exponential backoff (with full jitter) after a provider rate-limits a batch item
+_RATE_LIMIT_BACKOFF_BASE = 1.0
+_RATE_LIMIT_BACKOFF_MAX = 30.0
 
 
 @dataclass(slots=True)
@@ -27,6 +43,7 @@ class ProviderConfig:
     max_retries: int = 3
     extra_headers: Dict[str, str] = field(default_factory=dict)
     provider_label: Optional[str] = None
+    prompt_caching: Optional[bool] = None
 
 
 @dataclass(slots=True)
@@ -59,24 +76,128 @@ class LLMServiceConfig:
         return cls(primary=primary)
 
 
+# Provider name -> client, plus the lock guarding first creation, for one event loop
+_LoopClients = Tuple[Dict[str, LLMClient], asyncio.Lock]
+
+
+def _request_key(
+    provider: Optional[str], messages: List[LLMMessage], kwargs: Mapping[str, Any]
+) -> Optional[bytes]:
+    """Digest identifying a completion request, or None if its options are not JSON-encodable."""
+    try:
+        encoded = json.dumps(
+            [provider, [[m.role, m.content, m.cache_control] for m in messages], kwargs],
+            sort_keys=True,
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).digest()
+
+
+def _remote_models_disabled() -> bool:
+    return os.getenv("SCRAI_DISABLE_REMOTE_MODELS", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+class _TokenBucket:
+    """Token bucket that lets at most ``rpm`` requests start per minute."""
+
+    def __init__(self, rpm: int, capacity: int) -> None:
+        self._rate = rpm / 60.0
+        self._capacity = float(max(1, capacity))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
+
+
 class LLMService:
     """Facade that provides easy access to configured LLM providers."""
 
-    def __init__(self, config: LLMServiceConfig) -> None:
+    def __init__(
+        self,
+        config: LLMServiceConfig,
+        *,
+        models_cache_dir: Optional[Path] = None,
+        coalesce_identical: bool = False,
+    ) -> None:
         self._config = config
-        self._clients: Dict[str, LLMClient] = {}
-        self._lock = asyncio.Lock()
+        # Opt-in: identical in-flight completions share one request (see
+        # ``complete``), which also shares one sample at temperature > 0
+        self._coalesce_identical = coalesce_identical
+        self._inflight: Dict[bytes, "asyncio.Task[LLMResponse]"] = {}
+        self._provider_order: Tuple[ProviderConfig, ...] = (config.primary, *config.fallbacks)
+        # Earlier entries win on duplicate names, matching the old first-match scan
+        self._providers_by_name: Dict[str, ProviderConfig] = {}
+        for provider_config in self._provider_order:
+            self._providers_by_name.setdefault(provider_config.name, provider_config)
+        # Clients are kept per event loop: an httpx.AsyncClient's connections
+        # belong to the loop that opened them, so one service can serve several
+        # loops (e.g. per-thread workers) without cross-loop reuse or locking
+        self._clients_by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClients]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._models_cache_dir = models_cache_dir or DEFAULT_MODELS_CACHE_DIR
+        # provider name -> (last sync as a Unix timestamp, model IDs)
+        self._models_cache: Dict[str, Tuple[float, List[str]]] = {}
 
     async def complete(
         self,
         messages: Iterable[LLMMessage | Mapping[str, str]],
         *,
         provider: Optional[str] = None,
-        **kwargs,
+        **kwargs: Any,
     ) -> LLMResponse:
-        """Generate a completion using the configured providers with fallbacks."""
+        """Generate a completion using the configured providers with fallbacks.
 
-        normalized = ensure_messages(messages)
+        With ``coalesce_identical`` enabled, a call identical to one still in
+        flight (same provider, messages and options) awaits that request
+        instead of sending another.
+        """
+
+        return await self._complete_coalesced(ensure_messages(messages), provider, kwargs)
+
+    async def _complete_coalesced(
+        self,
+        normalized: List[LLMMessage],
+        provider: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> LLMResponse:
+        key = _request_key(provider, normalized, kwargs) if self._coalesce_identical else None
+        if key is None:
+            return await self._complete(normalized, provider, kwargs)
+
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(self._complete(normalized, provider, kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(key, done))
+        # Shielded so one caller's cancellation does not fail the others
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, key: bytes, task: "asyncio.Task[LLMResponse]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the outcome retrieved even if every caller was cancelled
+            task.exception()
+
+    async def _complete(
+        self,
+        normalized: List[LLMMessage],
+        provider: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> LLMResponse:
         providers = self._provider_sequence(provider)
         last_error: Optional[Exception] = None
 
@@ -92,12 +213,177 @@ class LLMService:
             raise last_error
         raise RuntimeError("No LLM providers are configured")
 
+    async def batch_complete(
+        self,
+        batches: Sequence[Iterable[LLMMessage | Mapping[str, str]]],
+        *,
+        max_concurrency: int = 8,
+        rpm: Optional[int] = None,
+        max_rate_limit_retries: int = 3,
+        row_marshal_size: int = 1,
+        progress_cb: Optional[Callable[[int, int], None]] = None,
+        provider: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[Union[LLMResponse, Exception]]:
+        """Complete many independent prompts with bounded concurrency.
+
+        At most ``max_concurrency`` requests are in flight and, when ``rpm`` is
+        given, request starts are spaced by a token bucket so the provider's
+        requests-per-minute budget is used without being exceeded. Rate-limited
+        items are retried with jittered exponential backoff, at most
+        ``max_rate_limit_retries`` times; the provider client does not retry
+        429s on top of that. With
+        ``row_marshal_size`` above one, up to that many prompts (capped at
+        ``MAX_MARSHALLED_PROMPTS``) share a single request, which helps against
+        RPM-capped providers. Results keep the order of ``batches``; a prompt
+        that still fails yields its exception in place. ``progress_cb(done,
+        total)`` is called as prompts finish.
+        """
+
+        total = len(batches)
+        rows = max(1, min(row_marshal_size, MAX_MARSHALLED_PROMPTS))
+        groups = [ensure_messages(messages) for messages in batches]
+        chunks = [groups[start:start + rows] for start in range(0, total, rows)]
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        bucket = _TokenBucket(rpm, capacity=max_concurrency) if rpm else None
+        done = 0
+
+        async def run_chunk(chunk: List[List[LLMMessage]]) -> List[LLMResponse]:
+            nonlocal done
+            attempt = 0
+            try:
+                while True:
+                    async with semaphore:
+                        if bucket is not None:
+                            await bucket.acquire()
+                        try:
+                            return await self._complete_rows(chunk, provider=provider, **kwargs)
+                        except LLMRateLimitError:
+                            if attempt >= max_rate_limit_retries:
+                                raise
+                    # Back off outside the semaphore so other prompts keep flowing
+                    delay = min(_RATE_LIMIT_BACKOFF_MAX, _RATE_LIMIT_BACKOFF_BASE * 2**attempt)
+                    await asyncio.sleep(random.uniform(0, delay))
+                    attempt += 1
+            finally:
+                done += len(chunk)
+                if progress_cb is not None:
+                    progress_cb(done, total)
+
+        # Rate limits are retried only by run_chunk above, not again inside the client
+        with defer_rate_limit_retries():
+            outcomes = await asyncio.gather(*(run_chunk(chunk) for chunk in chunks), return_exceptions=True)
+        results: List[Union[LLMResponse, Exception]] = []
+        for chunk, outcome in zip(chunks, outcomes):
+            if isinstance(outcome, Exception):
+                results.extend([outcome] * len(chunk))
+            elif isinstance(outcome, BaseException):
+                # Cancellation and interpreter exits are not per-prompt failures
+                raise outcome
+            else:
+                results.extend(outcome)
+        return results
+
+    async def _complete_rows(
+        self,
+        groups: List[List[LLMMessage]],
+        *,
+        provider: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[LLMResponse]:
+        if len(groups) == 1:
+            return [await self._complete_coalesced(groups[0], provider, kwargs)]
+
+        responses = await self._complete_marshalled(groups, provider, kwargs)
+        if responses is None:
+            # The marshalled reply was unusable; answer the prompts one by one
+            responses = list(
+                await asyncio.gather(*(self._complete_coalesced(messages, provider, kwargs) for messages in groups))
+            )
+        return responses
+
+    async def _complete_marshalled(
+        self,
+        groups: List[List[LLMMessage]],
+        provider: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> Optional[List[LLMResponse]]:
+        """Send ``groups`` as one marshalled request, or return None if the reply is unusable."""
+
+        last_error: Optional[Exception] = None
+        for provider_config in self._provider_sequence(provider):
+            client = await self._get_or_create_client(provider_config)
+            try:
+                return await client.generate_batched_response(groups, **kwargs)
+            except LLMRateLimitError as exc:
+                last_error = exc
+                continue
+            except LLMClientError:
+                return None
+
+        if last_error:
+            raise last_error
+        raise RuntimeError("No LLM providers are configured")
+
+    async def stream(
+        self,
+        messages: Iterable[LLMMessage | Mapping[str, str]],
+        *,
+        provider: Optional[str] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Stream a completion, falling back to the next provider until output starts."""
+
+        normalized = ensure_messages(messages)
+        providers = self._provider_sequence(provider)
+        last_error: Optional[Exception] = None
+
+        for provider_config in providers:
+            client = await self._get_or_create_client(provider_config)
+            started = False
+            try:
+                async for chunk in client.stream_response(normalized, **kwargs):
+                    started = True
+                    yield chunk
+                return
+            except (LLMRateLimitError, LLMClientError) as exc:
+                # Partial output cannot be retried transparently on another provider
+                if started:
+                    raise
+                last_error = exc
+                continue
+
+        if last_error:
+            raise last_error
+        raise RuntimeError("No LLM providers are configured")
+
     async def list_models(self, provider: Optional[str] = None) -> List[str]:
-        """List models from the specified provider (or primary by default)."""
+        """List models from the specified provider (or primary by default).
+
+        Catalogs are cached in memory and on disk for a day. When a refresh
+        fails, the stale list is returned instead; setting
+        ``SCRAI_DISABLE_REMOTE_MODELS`` skips the network entirely.
+        """
 
         provider_config = self._select_provider(provider)
+        name = provider_config.name
+        cached = self._cached_models(name)
+        if cached is not None and time.time() - cached[0] < _MODELS_CACHE_TTL:
+            return list(cached[1])
+        if _remote_models_disabled():
+            return list(cached[1]) if cached is not None else []
+
         client = await self._get_or_create_client(provider_config)
-        return await client.list_models()
+        try:
+            models = await client.list_models()
+        except (LLMClientError, LLMRateLimitError) as exc:
+            if cached is None:
+                raise
+            logger.warning("Using cached model list for provider '%s' after refresh failed: %s", name, exc)
+            return list(cached[1])
+
+        self._store_models(name, models)
+        return list(models)
 
     def provider_names(self) -> List[str]:
         """Return the configured provider names in priority order."""
@@ -108,6 +394,8 @@ class LLMService:
         """Validate all configured providers."""
 
         is_valid = True
+        # Always probe: a cached model catalog (possibly read from disk) says
+        # nothing about whether the provider is reachable right now
         for provider_config in self._provider_sequence():
             try:
                 client = await self._get_or_create_client(provider_config)
@@ -118,28 +406,72 @@ class LLMService:
         return is_valid
 
     async def close(self) -> None:
-        """Close all underlying client sessions."""
+        """Close the client sessions opened on the running event loop."""
 
-        for client in self._clients.values():
+        entry = self._clients_by_loop.pop(asyncio.get_running_loop(), None)
+        if entry is None:
+            return
+        for client in entry[0].values():
             await client.close()
-        self._clients.clear()
+
+    def _models_cache_path(self, name: str) -> Path:
+        return self._models_cache_dir / f"models-{name}.json"
+
+    def _cached_models(self, name: str) -> Optional[Tuple[float, List[str]]]:
+        cached = self._models_cache.get(name)
+        if cached is not None:
+            return cached
+        try:
+            data = json.loads(self._models_cache_path(name).read_text(encoding="utf-8"))
+            cached = (float(data["last_sync"]), [str(model) for model in data["models"]])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        self._models_cache[name] = cached
+        return cached
+
+    def _store_models(self, name: str, models: List[str]) -> None:
+        synced_at = time.time()
+        self._models_cache[name] = (synced_at, list(models))
+        path = self._models_cache_path(name)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps({"last_sync": synced_at, "models": models}), encoding="utf-8")
+        except OSError as exc:
+            logger.debug("Could not persist model list for provider '%s': %s", name, exc)
 
     def _provider_sequence(self, preferred: Optional[str] = None) -> Sequence[ProviderConfig]:
         if preferred:
-            for cfg in [self._config.primary, *self._config.fallbacks]:
-                if cfg.name == preferred:
-                    return [cfg]
-            raise KeyError(f"Provider '{preferred}' is not configured")
-        return [self._config.primary, *self._config.fallbacks]
+            provider_config = self._providers_by_name.get(preferred)
+            if provider_config is None:
+                raise KeyError(f"Provider '{preferred}' is not configured")
+            return (provider_config,)
+        return self._provider_order
 
     def _select_provider(self, provider: Optional[str]) -> ProviderConfig:
         return self._provider_sequence(provider)[0]
 
     async def _get_or_create_client(self, provider_config: ProviderConfig) -> LLMClient:
-        async with self._lock:
-            if provider_config.name not in self._clients:
-                self._clients[provider_config.name] = self._create_client(provider_config)
-            return self._clients[provider_config.name]
+        # Fast path without the lock once the client exists; the lock only
+        # serializes first creation
+        clients, lock = self._loop_clients()
+        client = clients.get(provider_config.name)
+        if client is not None:
+            return client
+        async with lock:
+            client = clients.get(provider_config.name)
+            if client is None:
+                client = self._create_client(provider_config)
+                clients[provider_config.name] = client
+            return client
+
+    def _loop_clients(self) -> _LoopClients:
+        loop = asyncio.get_running_loop()
+        entry = self._clients_by_loop.get(loop)
+        if entry is None:
+            entry = ({}, asyncio.Lock())
+            self._clients_by_loop[loop] = entry
+        return entry
+
     def _create_client(self, provider_config: ProviderConfig) -> LLMClient:
         name = provider_config.name.lower()
 
@@ -165,6 +497,7 @@ class LLMService:
                 provider_label=provider_config.provider_label or name,
                 api_key_header=provider_config.api_key_header,
                 extra_headers=extra_headers,
+                prompt_caching=self._resolve_prompt_caching(provider_config, name),
             )
 
         raise NotImplementedError(f"Provider '{provider_config.name}' is not supported yet.")
@@ -182,6 +515,13 @@ class LLMService:
             return os.getenv("LM_PROXY_BASE_URL", _DEFAULT_LM_PROXY_BASE_URL)
         return os.getenv("SCRAI_LLM_BASE_URL", "https://openrouter.ai/api/v1")
 
+    def _resolve_prompt_caching(self, provider_config: ProviderConfig, name: str) -> bool:
+        # OpenRouter forwards cache_control content parts to providers that
+        # support prompt caching; local servers may reject structured content.
+        if provider_config.prompt_caching is not None:
+            return provider_config.prompt_caching
+        return name == "openrouter"
+
     def _resolve_api_key(self, name: str) -> Optional[str]:
         if name == "openrouter":
             return os.getenv("OPENROUTER_API_KEY")
@@ -182,6 +182,16 @@ class Action(BaseModel):
         """Create action from dictionary."""
         return cls(**data)
     
+    @classmethod
+    def from_firestore(cls, document_id: str, data: Dict[str, Any]) -> 'Action':
+        """Create action from stored document data; the document ID wins over any stored ``id``."""
+        if "id" not in data:
+            # ``id`` is required, so only a document stored without one is copied
+            return cls.from_dict({**data, "id": document_id})
+        action = cls.model_validate(data)
+        action.id = document_id
+        return action
+    
     def __str__(self) -> str:
         return f"Action({self.intent[:50]}{'...' if len(self.intent) > 50 else ''}, {self.status.value})"
     
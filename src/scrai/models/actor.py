@@ -11,6 +11,9 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 from enum import Enum
 
+_now = datetime.utcnow
+_MISSING = object()
+
 
 class ActorType(str, Enum):
     """Types of actors in the simulation."""
@@ -70,26 +73,36 @@ class Actor(BaseModel):
     )
     
     def update_attributes(self, updates: Dict[str, Any]) -> None:
-        """Update actor attributes."""
-        self.attributes.update(updates)
-        self.updated_at = datetime.utcnow()
+        """Update actor attributes; no-op updates leave updated_at untouched."""
+        attributes = self.attributes
+        if all(attributes.get(key, _MISSING) == value for key, value in updates.items()):
+            return
+        attributes.update(updates)
+        self.updated_at = _now()
     
     def set_location(self, location: Dict[str, Any]) -> None:
-        """Update actor location."""
+        """Update actor location; setting the current location is a no-op."""
+        if location == self.location:
+            return
         self.location = location
-        self.updated_at = datetime.utcnow()
+        self.updated_at = _now()
     
     def add_relationship(self, actor_id: str, relationship: str, strength: float = 1.0) -> None:
         """Add or update a relationship with another actor."""
         if "relationships" not in self.relationships:
             self.relationships["relationships"] = {}
         
+        existing = self.relationships["relationships"].get(actor_id)
+        if existing and existing.get("type") == relationship and existing.get("strength") == strength:
+            return
+        
+        now = _now()
         self.relationships["relationships"][actor_id] = {
             "type": relationship,
             "strength": strength,
-            "established": datetime.utcnow().isoformat()
+            "established": now.isoformat()
         }
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert actor to dictionary for storage."""
@@ -100,6 +113,16 @@ class Actor(BaseModel):
         """Create actor from dictionary."""
         return cls(**data)
     
+    @classmethod
+    def from_firestore(cls, document_id: str, data: Dict[str, Any]) -> 'Actor':
+        """Create actor from stored document data; the document ID wins over any stored ``id``."""
+        if "id" not in data:
+            # ``id`` is required, so only a document stored without one is copied
+            return cls.from_dict({**data, "id": document_id})
+        actor = cls.model_validate(data)
+        actor.id = document_id
+        return actor
+    
     def __str__(self) -> str:
         return f"Actor({self.name}, {self.type.value})"
     
@@ -96,7 +96,9 @@ class Event(BaseModel):
             self.approved_by = approved_by
     
     def resolve(self) -> None:
-        """Mark event as resolved."""
+        """Mark event as resolved; an already resolved event keeps its resolved_at."""
+        if self.status == EventStatus.RESOLVED:
+            return
         self.status = EventStatus.RESOLVED
         self.resolved_at = datetime.utcnow()
     
@@ -112,7 +114,9 @@ class Event(BaseModel):
             self.affected_actors.append(actor_id)
     
     def add_modification(self, field: str, old_value: Any, new_value: Any, modified_by: str) -> None:
-        """Record a modification made by a researcher."""
+        """Record a modification made by a researcher; unchanged values are not recorded."""
+        if old_value == new_value:
+            return
         modification = {
             "field": field,
             "old_value": old_value,
@@ -131,6 +135,16 @@ class Event(BaseModel):
         """Create event from dictionary."""
         return cls(**data)
     
+    @classmethod
+    def from_firestore(cls, document_id: str, data: Dict[str, Any]) -> 'Event':
+        """Create event from stored document data; the document ID wins over any stored ``id``."""
+        if "id" not in data:
+            # ``id`` is required, so only a document stored without one is copied
+            return cls.from_dict({**data, "id": document_id})
+        event = cls.model_validate(data)
+        event.id = document_id
+        return event
+    
     def __str__(self) -> str:
         return f"Event({self.title}, {self.type.value}, {self.status.value})"
     
@@ -5,9 +5,10 @@ This model tracks the current state of the entire simulation including
 phase information, global parameters, and metadata.
 """
 
-from typing import Dict, Any, Optional, List
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Any, FrozenSet, Iterable, Iterator, Mapping, Optional, List, Set, Tuple
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from enum import Enum
 
 
@@ -32,6 +33,17 @@ class SimulationStatus(str, Enum):
     ERROR = "error"
 
 
+# Placeholder for "field not set yet" when comparing old and new values
+_UNSET: Any = object()
+
+# ID list fields and the private set that indexes each for O(1) membership
+_ID_INDICES: Dict[str, str] = {
+    "active_actor_ids": "_active_actor_set",
+    "pending_event_ids": "_pending_event_set",
+    "pending_action_ids": "_pending_action_set",
+}
+
+
 class SimulationState(BaseModel):
     """
     Represents the overall state of a simulation.
@@ -73,17 +85,21 @@ class SimulationState(BaseModel):
         description="Environmental parameters and state"
     )
     
-    # Active collections
-    active_actor_ids: List[str] = Field(
-        default_factory=list,
+    # Active collections. These are read-only tuples rather than lists, so they
+    # only change through add_*/remove_* or reassignment, both of which keep
+    # the indices and dirty set in step; in-place list edits such as
+    # ``.append`` are not supported. Lists are accepted on construction and
+    # assignment, and the fields are still stored as JSON arrays.
+    active_actor_ids: Tuple[str, ...] = Field(
+        default_factory=tuple,
         description="IDs of currently active actors"
     )
-    pending_event_ids: List[str] = Field(
-        default_factory=list,
+    pending_event_ids: Tuple[str, ...] = Field(
+        default_factory=tuple,
         description="IDs of pending events"
     )
-    pending_action_ids: List[str] = Field(
-        default_factory=list,
+    pending_action_ids: Tuple[str, ...] = Field(
+        default_factory=tuple,
         description="IDs of pending actions"
     )
     
@@ -112,31 +128,101 @@ class SimulationState(BaseModel):
         description="Additional simulation metadata"
     )
     
+    # Top-level fields changed since load or the last persisted patch
+    _dirty: Set[str] = PrivateAttr(default_factory=set)
+    
+    # Membership indices mirroring the ID tuples above (never serialized)
+    _active_actor_set: Set[str] = PrivateAttr(default_factory=set)
+    _pending_event_set: Set[str] = PrivateAttr(default_factory=set)
+    _pending_action_set: Set[str] = PrivateAttr(default_factory=set)
+    
+    # Open ``bulk_update`` blocks and whether a mutation inside them needs a timestamp
+    _bulk_depth: int = PrivateAttr(default=0)
+    _touch_pending: bool = PrivateAttr(default=False)
+    
+    # Rendered __str__/__repr__, dropped whenever a field they show is assigned
+    _str_cache: Optional[str] = PrivateAttr(default=None)
+    _repr_cache: Optional[str] = PrivateAttr(default=None)
+    
+    if TYPE_CHECKING:
+        # Always populated here, since the model declares private attributes
+        __pydantic_private__: Dict[str, Any] = Field(init=False)
+    
+    def model_post_init(self, __context: Any) -> None:
+        # Runs for both validated construction and ``model_construct``
+        self._sync_id_indices()
+    
+    def __copy__(self) -> 'SimulationState':
+        # BaseModel.__copy__ shares the private sets; give the copy its own
+        copied = super().__copy__()
+        copied._dirty = set(self._dirty)
+        copied._sync_id_indices()
+        return copied
+    
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> 'SimulationState':
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            # ``update`` is written straight into __dict__, past __setattr__
+            copied._sync_id_indices()
+        return copied
+    
+    def _sync_id_indices(self) -> None:
+        values = self.__dict__
+        private = self.__pydantic_private__
+        for field_name, index_name in _ID_INDICES.items():
+            ids = tuple(values[field_name])
+            values[field_name] = ids
+            private[index_name] = set(ids)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in _FIELD_NAMES:
+            super().__setattr__(name, value)
+            return
+        index_name = _ID_INDICES.get(name)
+        if index_name is not None:
+            value = tuple(value)
+        previous = self.__dict__.get(name, _UNSET)
+        super().__setattr__(name, value)
+        # Re-assigning an equal value (e.g. the same current_phase every step)
+        # is not a change; a dict or list may have been mutated in place
+        # before being assigned back, so those always count
+        if isinstance(value, (dict, list)) or previous != value:
+            # Every field assignment lands here, so read private state straight
+            # from __pydantic_private__; BaseModel.__getattr__ is ~30x slower
+            private = self.__pydantic_private__
+            private["_dirty"].add(name)
+            if index_name is not None:
+                private[index_name] = set(value)
+            elif name in _DISPLAY_FIELDS:
+                private["_str_cache"] = private["_repr_cache"] = None
+    
     def start(self) -> None:
         """Start the simulation."""
+        now = datetime.utcnow()
         self.status = SimulationStatus.RUNNING
-        self.started_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.started_at = now
+        self.updated_at = now
     
     def pause(self) -> None:
         """Pause the simulation."""
         self.status = SimulationStatus.PAUSED
         self.current_phase = SimulationPhase.PAUSED
-        self.updated_at = datetime.utcnow()
+        self._touch()
     
     def resume(self) -> None:
         """Resume a paused simulation."""
         if self.status == SimulationStatus.PAUSED:
             self.status = SimulationStatus.RUNNING
             # Resume from the phase we were in before pausing
-            self.updated_at = datetime.utcnow()
+            self._touch()
     
     def complete(self) -> None:
         """Mark the simulation as completed."""
         self.status = SimulationStatus.COMPLETED
         self.current_phase = SimulationPhase.COMPLETED
-        self.completed_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        now = datetime.utcnow()
+        self.completed_at = now
+        self.updated_at = now
     
     def advance_phase(self, next_phase: SimulationPhase) -> None:
         """Advance to the next phase."""
@@ -144,7 +230,7 @@ class SimulationState(BaseModel):
             self.phase_number += 1
         
         self.current_phase = next_phase
-        self.updated_at = datetime.utcnow()
+        self._touch()
         
         # Check if we've reached max phases
         if self.phase_number >= self.max_phases:
@@ -155,81 +241,186 @@ class SimulationState(BaseModel):
         self.last_error = error_message
         self.error_count += 1
         self.status = SimulationStatus.ERROR
-        self.updated_at = datetime.utcnow()
+        self._touch()
     
     def clear_error(self) -> None:
         """Clear the error state."""
         if self.status == SimulationStatus.ERROR:
             self.last_error = None
             self.status = SimulationStatus.RUNNING
-            self.updated_at = datetime.utcnow()
+            self._touch()
     
     def add_actor(self, actor_id: str) -> None:
         """Add an actor to the simulation."""
-        if actor_id not in self.active_actor_ids:
-            self.active_actor_ids.append(actor_id)
-            self.updated_at = datetime.utcnow()
+        if actor_id not in self._active_actor_set:
+            self._active_actor_set.add(actor_id)
+            self._store_ids("active_actor_ids", self.active_actor_ids + (actor_id,))
     
     def remove_actor(self, actor_id: str) -> None:
         """Remove an actor from the simulation."""
-        if actor_id in self.active_actor_ids:
-            self.active_actor_ids.remove(actor_id)
-            self.updated_at = datetime.utcnow()
+        if actor_id in self._active_actor_set:
+            self._active_actor_set.discard(actor_id)
+            self._store_ids("active_actor_ids", tuple(item for item in self.active_actor_ids if item != actor_id))
     
     def add_pending_event(self, event_id: str) -> None:
         """Add a pending event."""
-        if event_id not in self.pending_event_ids:
-            self.pending_event_ids.append(event_id)
-            self.updated_at = datetime.utcnow()
+        if event_id not in self._pending_event_set:
+            self._pending_event_set.add(event_id)
+            self._store_ids("pending_event_ids", self.pending_event_ids + (event_id,))
     
     def remove_pending_event(self, event_id: str) -> None:
         """Remove a pending event."""
-        if event_id in self.pending_event_ids:
-            self.pending_event_ids.remove(event_id)
-            self.updated_at = datetime.utcnow()
+        if event_id in self._pending_event_set:
+            self._pending_event_set.discard(event_id)
+            self._store_ids("pending_event_ids", tuple(item for item in self.pending_event_ids if item != event_id))
     
     def add_pending_action(self, action_id: str) -> None:
         """Add a pending action."""
-        if action_id not in self.pending_action_ids:
-            self.pending_action_ids.append(action_id)
-            self.updated_at = datetime.utcnow()
+        if action_id not in self._pending_action_set:
+            self._pending_action_set.add(action_id)
+            self._store_ids("pending_action_ids", self.pending_action_ids + (action_id,))
     
     def remove_pending_action(self, action_id: str) -> None:
         """Remove a pending action."""
-        if action_id in self.pending_action_ids:
-            self.pending_action_ids.remove(action_id)
-            self.updated_at = datetime.utcnow()
+        if action_id in self._pending_action_set:
+            self._pending_action_set.discard(action_id)
+            self._store_ids("pending_action_ids", tuple(item for item in self.pending_action_ids if item != action_id))
+    
+    def add_actors(self, actor_ids: Iterable[str]) -> None:
+        """Add several actors, skipping ones already in the simulation."""
+        self._extend_unique("active_actor_ids", actor_ids)
+    
+    def add_pending_events(self, event_ids: Iterable[str]) -> None:
+        """Add several pending events, skipping ones already pending."""
+        self._extend_unique("pending_event_ids", event_ids)
+    
+    def add_pending_actions(self, action_ids: Iterable[str]) -> None:
+        """Add several pending actions, skipping ones already pending."""
+        self._extend_unique("pending_action_ids", action_ids)
+    
+    def _extend_unique(self, field_name: str, ids: Iterable[str]) -> None:
+        seen: Set[str] = getattr(self, _ID_INDICES[field_name])
+        added: List[str] = []
+        for item_id in ids:
+            if item_id not in seen:
+                seen.add(item_id)
+                added.append(item_id)
+        if added:
+            self._store_ids(field_name, getattr(self, field_name) + tuple(added))
+    
+    def _store_ids(self, field_name: str, ids: Tuple[str, ...]) -> None:
+        # The caller has already updated the index, so skip the rebuild in __setattr__
+        super().__setattr__(field_name, ids)
+        self._dirty.add(field_name)
+        self._touch()
     
     def record_snapshot(self) -> None:
         """Record that a snapshot was taken."""
         self.snapshot_count += 1
-        self.last_snapshot_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        now = datetime.utcnow()
+        self.last_snapshot_at = now
+        self.updated_at = now
     
     def update_world_state(self, updates: Dict[str, Any]) -> None:
         """Update the world state."""
         self.world_state.update(updates)
-        self.updated_at = datetime.utcnow()
+        self._dirty.add("world_state")
+        self._touch()
     
     def update_phase_statistics(self, phase: str, stats: Dict[str, Any]) -> None:
         """Update statistics for a phase."""
-        if phase not in self.phase_statistics:
-            self.phase_statistics[phase] = {}
+        self.phase_statistics.setdefault(phase, {}).update(stats)
+        self._dirty.add("phase_statistics")
+        self._touch()
+    
+    @contextmanager
+    def bulk_update(self) -> Iterator['SimulationState']:
+        """
+        Group several mutations so ``updated_at`` is written once on exit.
         
-        self.phase_statistics[phase].update(stats)
-        self.updated_at = datetime.utcnow()
+        Blocks may be nested; the timestamp is bumped when the outermost one
+        exits, and only if something inside actually changed the state.
+        """
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if not self._bulk_depth and self._touch_pending:
+                self._touch_pending = False
+                self.updated_at = datetime.utcnow()
+    
+    def _touch(self) -> None:
+        private = self.__pydantic_private__
+        if private["_bulk_depth"]:
+            private["_touch_pending"] = True
+        else:
+            self.updated_at = datetime.utcnow()
+    
+    def mark_dirty(self, *fields: str) -> None:
+        """Flag fields that were mutated in place (nested dict/list changes)."""
+        self._dirty.update(fields)
+    
+    @property
+    def dirty_fields(self) -> FrozenSet[str]:
+        """Top-level fields changed since load or the last ``clear_dirty``."""
+        return frozenset(self._dirty)
+    
+    def clear_dirty(self) -> None:
+        """Reset change tracking after the state has been persisted."""
+        self._dirty.clear()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert simulation state to dictionary for storage."""
         return self.model_dump(mode='json')
     
+    def to_patch(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Serialize only the given fields (default: dirty fields) for a partial write."""
+        include = set(self._dirty if fields is None else fields)
+        return self.model_dump(mode='json', include=include)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SimulationState':
         """Create simulation state from dictionary."""
-        return cls(**data)
+        # model_validate hands the mapping straight to the compiled validator
+        # instead of unpacking it into keyword arguments first
+        return cls.model_validate(data)
+    
+    @classmethod
+    def from_firestore(cls, document_id: str, data: Dict[str, Any]) -> 'SimulationState':
+        """
+        Create simulation state from stored document data.
+        
+        The document ID is authoritative over any stored ``id`` field. Stored
+        data goes through normal validation: pydantic-core's compiled validator
+        is faster than ``model_construct`` plus coercing enums and timestamps
+        in Python. The mapping is validated as-is rather than copied to inject
+        the ID; only a document stored without ``id`` needs the copy.
+        """
+        if "id" not in data:
+            return cls.from_dict({**data, "id": document_id})
+        simulation = cls.from_dict(data)
+        if simulation.id != document_id:
+            simulation.id = document_id
+            simulation.clear_dirty()
+        return simulation
     
     def __str__(self) -> str:
-        return f"SimulationState({self.name}, {self.status.value}, Phase {self.phase_number})"
+        private = self.__pydantic_private__
+        text: Optional[str] = private["_str_cache"]
+        if text is None:
+            text = f"SimulationState({self.name}, {self.status.value}, Phase {self.phase_number})"
+            private["_str_cache"] = text
+        return text
     
     def __repr__(self) -> str:
-        return f"SimulationState(id='{self.id}', name='{self.name}', status='{self.status.value}', phase='{self.current_phase.value}')"
\ No newline at end of file
+        private = self.__pydantic_private__
+        text: Optional[str] = private["_repr_cache"]
+        if text is None:
+            text = f"SimulationState(id='{self.id}', name='{self.name}', status='{self.status.value}', phase='{self.current_phase.value}')"
+            private["_repr_cache"] = text
+        return text
+
+
+_FIELD_NAMES: FrozenSet[str] = frozenset(SimulationState.model_fields)
+_DISPLAY_FIELDS: FrozenSet[str] = frozenset({"id", "name", "status", "current_phase", "phase_number"})
\ No newline at end of file
@@ -2,11 +2,16 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Iterable, List, Sequence
 
 from ..models import Action, Actor, Event, SimulationState
 
 
+def _utc_now() -> datetime:
+    return datetime.now(tz=timezone.utc)
+
+
 @dataclass(slots=True)
 class ScenarioContext:
     """Carries the mutable state for a running scenario."""
@@ -15,6 +20,8 @@ class ScenarioContext:
     actors: List[Actor] = field(default_factory=list)
     events: List[Event] = field(default_factory=list)
     actions: List[Action] = field(default_factory=list)
+    # Reference time for seeded entities, stamped once by whoever builds the context
+    now: datetime = field(default_factory=_utc_now)
 
     def extend(
         self,
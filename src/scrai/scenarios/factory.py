@@ -1,55 +1,168 @@
 from __future__ import annotations
 
 import importlib
-import inspect
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Type
+from types import ModuleType
+from typing import Callable, Iterator, Mapping, Type
 
 from .base import Scenario
 from .registry import ScenarioRegistry
 from .service import ScenarioService
 
 
-def discover_scenarios() -> dict[str, Type[Scenario]]:
-    """Automatically discover all scenario classes in the scenes directory."""
-    scenarios = {}
-    scenes_dir = Path(__file__).parent / "scenes"
-    
-    if not scenes_dir.exists():
-        return scenarios
+_SCENES_DIR = Path(__file__).parent / "scenes"
+_MANIFEST_MODULE = "scrai.scenarios.scenes._manifest"
+_MANIFEST_PATH = _SCENES_DIR / "_manifest.py"
+_MAX_IMPORT_WORKERS = 8
+_MANIFEST_HEADER = '''"""Scenario manifest generated by ``scrai gen-scenario-manifest``; do not edit by hand."""
+
+'''
+
+
+class _ManifestScenarios(Mapping[str, Type[Scenario]]):
+    """Scenario classes listed in the manifest, each imported on first access."""
+
+    def __init__(self, entries: Mapping[str, tuple[str, str]]) -> None:
+        self._entries = dict(entries)
+
+    def __getitem__(self, name: str) -> Type[Scenario]:
+        module_name, class_name = self._entries[name]
+        scenario_class: Type[Scenario] = getattr(importlib.import_module(module_name), class_name)
+        return scenario_class
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def discover_scenarios() -> Mapping[str, Type[Scenario]]:
+    """Return the available scenario classes keyed by scenario name.
+
+    Scenarios listed in the generated ``scenes/_manifest.py`` are imported
+    lazily, by module and class name, when first looked up. Without a
+    manifest, or when a scene file is missing from it, this falls back to
+    scanning the scenes directory (see ``scan_scenarios``).
+    """
+    try:
+        manifest = importlib.import_module(_MANIFEST_MODULE)
+    except ImportError:
+        return scan_scenarios()
+    listed = {module_name for module_name, _ in manifest.SCENARIOS.values()}
+    unlisted = sorted(set(_scene_module_names()) - listed)
+    if unlisted:
+        print(
+            f"Warning: Scenario manifest is missing {', '.join(unlisted)}; "
+            "scanning scenes instead (run `scrai gen-scenario-manifest`)"
+        )
+        return scan_scenarios()
+    return _ManifestScenarios(manifest.SCENARIOS)
+
+
+def _scene_module_names() -> list[str]:
+    return [
+        f"scrai.scenarios.scenes.{file_path.stem}"
+        for file_path in sorted(_SCENES_DIR.glob("*.py"))
+        if not file_path.stem.startswith("_")
+    ]
+
 
-    for file_path in scenes_dir.glob("*.py"):
-        if file_path.stem.startswith("_"):
-            continue
+def scan_scenarios() -> dict[str, Type[Scenario]]:
+    """Discover scenario classes by importing every module in the scenes directory.
 
-        module_name = f"scrai.scenarios.scenes.{file_path.stem}"
+    The result is memoized for the life of the process: scene modules are
+    imported once and never reloaded, so scenes added or edited afterwards are
+    picked up only after a restart.
+    """
+    return dict(_scan())
+
+
+@lru_cache(maxsize=1)
+def _scan() -> dict[str, Type[Scenario]]:
+    if not _SCENES_DIR.exists():
+        return {}
+
+    scenarios = {}
+    module_names = _scene_module_names()
+    modules = _import_modules(module_names)
+    for module_name, module in zip(module_names, modules):
         try:
-            module = importlib.import_module(module_name)
+            if isinstance(module, Exception):
+                raise module
             
-            # Find all Scenario subclasses in the module
-            for name, obj in inspect.getmembers(module, inspect.isclass):
+            # Find Scenario subclasses defined in (not imported into) the module
+            for obj in vars(module).values():
                 if (
-                    issubclass(obj, Scenario)
-                    and obj is not Scenario
+                    isinstance(obj, type)
+                    and obj.__module__ == module_name
+                    and issubclass(obj, Scenario)
                     and hasattr(obj, "name")
                 ):
                     scenarios[obj.name] = obj
         except Exception as e:
             # Log but don't fail if a scenario module has issues
-            print(f"Warning: Failed to load scenario from {file_path}: {e}")
+            print(f"Warning: Failed to load scenario from {module_name}: {e}")
     
     return scenarios
 
 
+def _import_modules(module_names: list[str]) -> list[ModuleType | Exception]:
+    """Import modules, concurrently when there are several.
+
+    Import failures are returned in place of the module so one broken scene
+    does not stop the others loading.
+    """
+
+    def load(module_name: str) -> ModuleType | Exception:
+        try:
+            return importlib.import_module(module_name)
+        except Exception as exc:
+            return exc
+
+    if len(module_names) < 2:
+        return [load(module_name) for module_name in module_names]
+    with ThreadPoolExecutor(max_workers=min(_MAX_IMPORT_WORKERS, len(module_names))) as pool:
+        return list(pool.map(load, module_names))
+
+
+def write_scenario_manifest(path: Path | None = None) -> dict[str, tuple[str, str]]:
+    """Scan the scenes directory and write the manifest ``discover_scenarios`` reads."""
+    entries = {
+        name: (scenario_class.__module__, scenario_class.__qualname__)
+        for name, scenario_class in sorted(scan_scenarios().items())
+    }
+    lines = [_MANIFEST_HEADER, "SCENARIOS: dict[str, tuple[str, str]] = {\n"]
+    lines.extend(
+        f"    {json.dumps(name)}: ({json.dumps(module)}, {json.dumps(cls)}),\n"
+        for name, (module, cls) in entries.items()
+    )
+    lines.append("}\n")
+    (path or _MANIFEST_PATH).write_text("".join(lines), encoding="utf-8")
+    return entries
+
+
+def _scenario_factory(scenario_classes: Mapping[str, Type[Scenario]], name: str) -> Callable[[], Scenario]:
+    return lambda: scenario_classes[name]()
+
+
 def create_default_scenario_service() -> ScenarioService:
     registry = ScenarioRegistry()
     
-    # Auto-discover and register all scenarios
+    # Auto-discover all scenarios; each is imported and created on first lookup
     discovered = discover_scenarios()
-    for name, scenario_class in discovered.items():
-        registry.register(name, scenario_class())
+    for name in discovered:
+        registry.register_factory(name, _scenario_factory(discovered, name))
     
     return ScenarioService(registry=registry)
 
 
-__all__ = ["create_default_scenario_service", "discover_scenarios"]
+__all__ = [
+    "create_default_scenario_service",
+    "discover_scenarios",
+    "scan_scenarios",
+    "write_scenario_manifest",
+]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, Optional, Type
+from typing import Callable, Dict, Optional, Tuple, Type
 
 from .base import Scenario
 
@@ -16,46 +16,99 @@ class ScenarioRegistry:
     """Registry for available scenarios."""
 
     def __init__(self) -> None:
-        self._scenarios: Dict[str, ScenarioMetadata] = {}
+        self._scenarios: Dict[str, Scenario] = {}
+        # Scenarios registered by factory, created on first lookup
+        self._factories: Dict[str, Callable[[], Scenario]] = {}
+        # Read-mostly views, rebuilt only when the registry changes
+        self._scenarios_tuple: Tuple[Scenario, ...] = ()
+        self._list_all_cache: Optional[Tuple[Dict[str, str], ...]] = None
 
     def register(self, key: str, scenario: Scenario) -> None:
-        normalized = key.strip().lower()
-        if normalized in self._scenarios:
-            raise ValueError(f"Scenario '{key}' is already registered")
-        self._scenarios[normalized] = ScenarioMetadata(key=normalized, scenario=scenario)
+        normalized = self._check_new_key(key)
+        self._scenarios[normalized] = scenario
+        self._invalidate()
+
+    def register_factory(self, key: str, factory: Callable[[], Scenario]) -> None:
+        """Register a scenario that ``factory`` creates the first time it is needed."""
+        self._factories[self._check_new_key(key)] = factory
 
     def unregister(self, key: str) -> None:
         normalized = key.strip().lower()
-        self._scenarios.pop(normalized, None)
+        self._factories.pop(normalized, None)
+        if self._scenarios.pop(normalized, None) is not None:
+            self._invalidate()
 
     def get(self, key: str) -> Optional[Scenario]:
+        # Registered keys are already normalized, so try the key as given first
+        scenario = self._scenarios.get(key)
+        if scenario is None:
+            normalized = key.strip().lower()
+            scenario = self._scenarios.get(normalized)
+            if scenario is None:
+                scenario = self._load(normalized)
+        return scenario
+
+    def metadata(self, key: str) -> Optional[ScenarioMetadata]:
         normalized = key.strip().lower()
-        metadata = self._scenarios.get(normalized)
-        return metadata.scenario if metadata else None
+        scenario = self.get(normalized)
+        return ScenarioMetadata(key=normalized, scenario=scenario) if scenario else None
 
-    def items(self) -> Iterable[Scenario]:
-        for metadata in self._scenarios.values():
-            yield metadata.scenario
+    def items(self) -> Tuple[Scenario, ...]:
+        self._load_all()
+        return self._scenarios_tuple
 
     def list_all(self) -> list[dict[str, str]]:
         """List all registered scenarios with metadata."""
-        scenarios = []
-        for key, metadata in sorted(self._scenarios.items()):
-            scenario = metadata.scenario
-            # Get description from docstring or use a default
-            description = (
-                scenario.__class__.__doc__.strip().split("\n")[0]
-                if scenario.__class__.__doc__
-                else f"{scenario.__class__.__name__} scenario"
+        self._load_all()
+        if self._list_all_cache is None:
+            self._list_all_cache = tuple(
+                self._describe(key, scenario)
+                for key, scenario in sorted(self._scenarios.items())
             )
-            
-            scenarios.append({
-                "name": key,
-                "display_name": scenario.__class__.__name__.replace("Scenario", "").replace("_", " ").title(),
-                "description": description,
-            })
-        
-        return scenarios
+        # Fresh dicts so callers can't mutate the cached entries
+        return [dict(entry) for entry in self._list_all_cache]
+
+    def _check_new_key(self, key: str) -> str:
+        normalized = key.strip().lower()
+        if normalized in self._scenarios or normalized in self._factories:
+            raise ValueError(f"Scenario '{key}' is already registered")
+        return normalized
+
+    def _load(self, normalized: str) -> Optional[Scenario]:
+        factory = self._factories.pop(normalized, None)
+        if factory is None:
+            return None
+        try:
+            scenario = factory()
+        except Exception as e:
+            # Log but don't fail if a scenario module has issues
+            print(f"Warning: Failed to load scenario {normalized!r}: {e}")
+            return None
+        self._scenarios[normalized] = scenario
+        self._invalidate()
+        return scenario
+
+    def _load_all(self) -> None:
+        for normalized in list(self._factories):
+            self._load(normalized)
+
+    def _invalidate(self) -> None:
+        self._scenarios_tuple = tuple(self._scenarios.values())
+        self._list_all_cache = None
+
+    @staticmethod
+    def _describe(key: str, scenario: Scenario) -> Dict[str, str]:
+        # Get description from docstring or use a default
+        description = (
+            scenario.__class__.__doc__.strip().split("\n")[0]
+            if scenario.__class__.__doc__
+            else f"{scenario.__class__.__name__} scenario"
+        )
+        return {
+            "name": key,
+            "display_name": scenario.__class__.__name__.replace("Scenario", "").replace("_", " ").title(),
+            "description": description,
+        }
 
 
 __all__ = ["ScenarioRegistry", "ScenarioMetadata"]
@@ -0,0 +1,5 @@
+"""Scenario manifest generated by ``scrai gen-scenario-manifest``; do not edit by hand."""
+
+SCENARIOS: dict[str, tuple[str, str]] = {
+    "simple_town": ("scrai.scenarios.scenes.simple_town", "SimpleTownScenario"),
+}
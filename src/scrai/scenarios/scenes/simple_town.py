@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 
 from ...models import Action, Actor, Event
 from ...models.action import ActionPriority, ActionType
@@ -9,18 +9,35 @@ from ...models.event import EventType
 from ..base import Scenario, ScenarioContext
 
 
+# Entity IDs, shared between definitions and cross-references in the seed
+_MAYOR_ID = "actor-mayor"
+_DOCTOR_ID = "actor-doctor"
+_CARETAKER_ID = "actor-caretaker"
+_TEACHER_ID = "actor-teacher"
+_SHOPKEEPER_ID = "actor-shopkeeper"
+_FIREFIGHTER_ID = "actor-firefighter"
+_RESIDENT_ID = "actor-resident"
+_MORNING_BRIEFING_ID = "event-briefing"
+_FARMERS_MARKET_ID = "event-market"
+_SCIENCE_FAIR_ID = "event-science-fair"
+_POWER_OUTAGE_ID = "event-outage"
+
+
 class SimpleTownScenario(Scenario):
     """A vibrant small town scenario showcasing diverse actors, locations, events, and interactions."""
 
     name = "simple_town"
 
     def seed(self, context: ScenarioContext) -> None:
-        now = datetime.now(tz=timezone.utc)
+        now = context.now
+        actors: list[Actor] = []
+        events: list[Event] = []
+        actions: list[Action] = []
         
         # === ACTORS ===
         # Town leadership
-        mayor = Actor(
-            id="actor-mayor",
+        actors.append(Actor(
+            id=_MAYOR_ID,
             name="Mayor Alex Chen",
             type=ActorType.NPC,
             attributes={
@@ -33,11 +50,11 @@ class SimpleTownScenario(Scenario):
             },
             location={"name": "Town Hall", "lat": 40.7128, "lng": -74.0060},
             metadata={"role": "mayor", "experience_years": 8},
-        )
+        ))
         
         # Healthcare
-        doctor = Actor(
-            id="actor-doctor",
+        actors.append(Actor(
+            id=_DOCTOR_ID,
             name="Dr. Sofia Rivera",
             type=ActorType.NPC,
             attributes={
@@ -50,11 +67,11 @@ class SimpleTownScenario(Scenario):
             },
             location={"name": "Community Clinic", "lat": 40.7135, "lng": -74.0050},
             metadata={"role": "doctor", "specialization": "general_practice"},
-        )
+        ))
         
         # Community services
-        caretaker = Actor(
-            id="actor-caretaker",
+        actors.append(Actor(
+            id=_CARETAKER_ID,
             name="Sam Lee",
             type=ActorType.NPC,
             attributes={
@@ -67,11 +84,11 @@ class SimpleTownScenario(Scenario):
             },
             location={"name": "Community Center", "lat": 40.7140, "lng": -74.0070},
             metadata={"role": "operations_manager"},
-        )
+        ))
         
         # Education
-        teacher = Actor(
-            id="actor-teacher",
+        actors.append(Actor(
+            id=_TEACHER_ID,
             name="Ms. Jordan Park",
             type=ActorType.NPC,
             attributes={
@@ -84,11 +101,11 @@ class SimpleTownScenario(Scenario):
             },
             location={"name": "Town School", "lat": 40.7125, "lng": -74.0080},
             metadata={"role": "teacher", "subject": "science"},
-        )
+        ))
         
         # Local business
-        shopkeeper = Actor(
-            id="actor-shopkeeper",
+        actors.append(Actor(
+            id=_SHOPKEEPER_ID,
             name="Marcus Thompson",
             type=ActorType.NPC,
             attributes={
@@ -101,11 +118,11 @@ class SimpleTownScenario(Scenario):
             },
             location={"name": "General Store", "lat": 40.7130, "lng": -74.0065},
             metadata={"role": "shopkeeper", "business": "general_goods"},
-        )
+        ))
         
         # Emergency services
-        firefighter = Actor(
-            id="actor-firefighter",
+        actors.append(Actor(
+            id=_FIREFIGHTER_ID,
             name="Captain Jamie Rodriguez",
             type=ActorType.NPC,
             attributes={
@@ -118,11 +135,11 @@ class SimpleTownScenario(Scenario):
             },
             location={"name": "Fire Station", "lat": 40.7138, "lng": -74.0055},
             metadata={"role": "fire_captain", "years_service": 12},
-        )
+        ))
         
         # Community resident (player character type)
-        resident = Actor(
-            id="actor-resident",
+        actors.append(Actor(
+            id=_RESIDENT_ID,
             name="Taylor Morgan",
             type=ActorType.PLAYER,
             attributes={
@@ -135,74 +152,74 @@ class SimpleTownScenario(Scenario):
             },
             location={"name": "Main Street", "lat": 40.7132, "lng": -74.0062},
             metadata={"role": "resident", "new_to_town": True},
-        )
+        ))
         
         # === EVENTS ===
         # Daily governance
-        morning_briefing = Event(
-            id="event-briefing",
+        events.append(Event(
+            id=_MORNING_BRIEFING_ID,
             title="Morning Town Briefing",
             description="Daily coordination meeting for town leadership to sync on priorities, incidents, and resource allocation.",
             type=EventType.SYSTEM,
             scheduled_for=now,
-            affected_actors=[mayor.id, doctor.id, caretaker.id, firefighter.id],
+            affected_actors=[_MAYOR_ID, _DOCTOR_ID, _CARETAKER_ID, _FIREFIGHTER_ID],
             metadata={
                 "location": "Town Hall",
                 "recurring": "daily",
                 "duration_minutes": 30
             },
-        )
+        ))
         
         # Community engagement
-        farmers_market = Event(
-            id="event-market",
+        events.append(Event(
+            id=_FARMERS_MARKET_ID,
             title="Weekly Farmers Market",
             description="Community market featuring local produce, crafts, and social gathering.",
             type=EventType.SOCIAL,
             scheduled_for=now + timedelta(hours=4),
-            affected_actors=[shopkeeper.id, caretaker.id, resident.id],
+            affected_actors=[_SHOPKEEPER_ID, _CARETAKER_ID, _RESIDENT_ID],
             metadata={
                 "location": "Town Square",
                 "recurring": "weekly",
                 "duration_hours": 3
             },
-        )
+        ))
         
         # Educational activity
-        science_fair = Event(
-            id="event-science-fair",
+        events.append(Event(
+            id=_SCIENCE_FAIR_ID,
             title="School Science Fair",
             description="Annual science fair where students showcase their projects to the community.",
             type=EventType.SOCIAL,
             scheduled_for=now + timedelta(days=2),
-            affected_actors=[teacher.id, mayor.id, resident.id],
+            affected_actors=[_TEACHER_ID, _MAYOR_ID, _RESIDENT_ID],
             metadata={
                 "location": "Town School",
                 "participants_expected": 45,
                 "judges_needed": 3
             },
-        )
+        ))
         
         # Emergency scenario
-        power_outage = Event(
-            id="event-outage",
+        events.append(Event(
+            id=_POWER_OUTAGE_ID,
             title="Partial Power Outage",
             description="Storm damage has caused power loss in the eastern district. Emergency services coordinating response.",
             type=EventType.ENVIRONMENTAL,
             scheduled_for=now + timedelta(hours=1),
-            affected_actors=[firefighter.id, mayor.id, shopkeeper.id],
+            affected_actors=[_FIREFIGHTER_ID, _MAYOR_ID, _SHOPKEEPER_ID],
             metadata={
                 "location": "Eastern District",
                 "severity": "moderate",
                 "estimated_duration_hours": 3
             },
-        )
+        ))
         
         # === ACTIONS ===
         # Briefing actions
-        briefing_start = Action(
+        actions.append(Action(
             id="action-briefing-start",
-            actor_id=mayor.id,
+            actor_id=_MAYOR_ID,
             type=ActionType.COMMUNICATION,
             intent="Open the morning briefing with an overview of town priorities and agenda",
             description="Mayor welcomes attendees and outlines the discussion topics for today's coordination meeting.",
@@ -213,15 +230,15 @@ class SimpleTownScenario(Scenario):
                     "community_events",
                     "emergency_preparedness"
                 ],
-                "attendees": [doctor.id, caretaker.id, firefighter.id]
+                "attendees": [_DOCTOR_ID, _CARETAKER_ID, _FIREFIGHTER_ID]
             },
             priority=ActionPriority.NORMAL,
-            metadata={"related_event": morning_briefing.id, "phase": "opening"},
-        )
+            metadata={"related_event": _MORNING_BRIEFING_ID, "phase": "opening"},
+        ))
         
-        health_report = Action(
+        actions.append(Action(
             id="action-health-report",
-            actor_id=doctor.id,
+            actor_id=_DOCTOR_ID,
             type=ActionType.COMMUNICATION,
             intent="Provide health status update to town leadership",
             description="Dr. Rivera shares current health trends, vaccination rates, and clinic capacity.",
@@ -230,13 +247,13 @@ class SimpleTownScenario(Scenario):
                 "recommendations": ["increase_outreach", "prepare_winter_supplies"]
             },
             priority=ActionPriority.NORMAL,
-            metadata={"related_event": morning_briefing.id, "phase": "reports"},
-        )
+            metadata={"related_event": _MORNING_BRIEFING_ID, "phase": "reports"},
+        ))
         
         # Market preparation
-        market_setup = Action(
+        actions.append(Action(
             id="action-market-setup",
-            actor_id=caretaker.id,
+            actor_id=_CARETAKER_ID,
             type=ActionType.SOCIAL,
             intent="Coordinate setup logistics for the weekly farmers market",
             description="Sam organizes vendor assignments, ensures permits are in order, and arranges volunteer support.",
@@ -246,13 +263,13 @@ class SimpleTownScenario(Scenario):
                 "equipment": ["tables", "canopies", "signage"]
             },
             priority=ActionPriority.HIGH,
-            metadata={"related_event": farmers_market.id, "deadline": "4_hours"},
-        )
+            metadata={"related_event": _FARMERS_MARKET_ID, "deadline": "4_hours"},
+        ))
         
         # Educational engagement
-        science_fair_judging = Action(
+        actions.append(Action(
             id="action-science-judging",
-            actor_id=teacher.id,
+            actor_id=_TEACHER_ID,
             type=ActionType.SOCIAL,
             intent="Recruit judges and finalize science fair logistics",
             description="Ms. Park contacts community leaders to serve as judges and prepares evaluation criteria.",
@@ -262,13 +279,13 @@ class SimpleTownScenario(Scenario):
                 "categories": ["biology", "physics", "engineering"]
             },
             priority=ActionPriority.NORMAL,
-            metadata={"related_event": science_fair.id},
-        )
+            metadata={"related_event": _SCIENCE_FAIR_ID},
+        ))
         
         # Emergency preparation
-        emergency_drill = Action(
+        actions.append(Action(
             id="action-emergency-drill",
-            actor_id=firefighter.id,
+            actor_id=_FIREFIGHTER_ID,
             type=ActionType.CUSTOM,
             intent="Review emergency protocols and prepare response equipment",
             description="Captain Rodriguez conducts equipment checks and reviews storm response procedures with the team.",
@@ -277,13 +294,13 @@ class SimpleTownScenario(Scenario):
                 "protocols": ["power_outage", "storm_response", "evacuation_routes"]
             },
             priority=ActionPriority.HIGH,
-            metadata={"proactive": True, "related_event": power_outage.id},
-        )
+            metadata={"proactive": True, "related_event": _POWER_OUTAGE_ID},
+        ))
         
         # Community interaction
-        welcome_resident = Action(
+        actions.append(Action(
             id="action-welcome-resident",
-            actor_id=shopkeeper.id,
+            actor_id=_SHOPKEEPER_ID,
             type=ActionType.COMMUNICATION,
             intent="Welcome the new resident and offer local insights",
             description="Marcus greets Taylor at the store and shares information about upcoming community events.",
@@ -293,11 +310,11 @@ class SimpleTownScenario(Scenario):
             },
             priority=ActionPriority.LOW,
             metadata={"relationship_building": True},
-        )
+        ))
         
-        explore_town = Action(
+        actions.append(Action(
             id="action-explore-town",
-            actor_id=resident.id,
+            actor_id=_RESIDENT_ID,
             type=ActionType.MOVEMENT,
             intent="Explore the town and meet community members",
             description="Taylor walks through town to familiarize themselves with local landmarks and introduce themselves to neighbors.",
@@ -307,21 +324,9 @@ class SimpleTownScenario(Scenario):
             },
             priority=ActionPriority.NORMAL,
             metadata={"first_day": True},
-        )
+        ))
 
-        context.extend(
-            actors=[mayor, doctor, caretaker, teacher, shopkeeper, firefighter, resident],
-            events=[morning_briefing, farmers_market, science_fair, power_outage],
-            actions=[
-                briefing_start,
-                health_report,
-                market_setup,
-                science_fair_judging,
-                emergency_drill,
-                welcome_resident,
-                explore_town,
-            ],
-        )
+        context.extend(actors=actors, events=events, actions=actions)
 
 
 __all__ = ["SimpleTownScenario"]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Iterable, Optional
 
 from ..models import Action, Actor, Event, SimulationState
@@ -15,22 +16,29 @@ class ScenarioService:
     def select(self, key: str) -> Optional[Scenario]:
         return self.registry.get(key)
 
-    def seed_scenario(self, key: str, state: SimulationState) -> ScenarioContext:
+    def seed_scenario(
+        self, key: str, state: SimulationState, *, now: Optional[datetime] = None
+    ) -> ScenarioContext:
         scenario = self.registry.get(key)
         if scenario is None:
             raise ValueError(f"Scenario '{key}' is not registered")
 
         context = ScenarioContext(state=state)
+        if now is not None:
+            context.now = now
         scenario.seed(context)
         return context
 
-    def before_phase(self, scenario: Scenario, context: ScenarioContext) -> None:
+    @staticmethod
+    def before_phase(scenario: Scenario, context: ScenarioContext) -> None:
         scenario.before_phase(context)
 
-    def after_phase(self, scenario: Scenario, context: ScenarioContext) -> None:
+    @staticmethod
+    def after_phase(scenario: Scenario, context: ScenarioContext) -> None:
         scenario.after_phase(context)
 
-    def on_snapshot(self, scenario: Scenario, context: ScenarioContext) -> None:
+    @staticmethod
+    def on_snapshot(scenario: Scenario, context: ScenarioContext) -> None:
         scenario.on_snapshot(context)
 
 
@@ -0,0 +1,33 @@
+"""
+Shared fixtures for scenario tests.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from scrai.models import SimulationState
+from scrai.models.simulation_state import SimulationPhase, SimulationStatus
+from scrai.scenarios import ScenarioContext
+from scrai.scenarios.scenes.simple_town import SimpleTownScenario
+
+# Fixed timestamp so seeded fixture state is deterministic
+_FIXED_NOW = datetime(2024, 1, 1, 0, 0, 0)
+
+
+@pytest.fixture(scope="session")
+def seeded_town_context():
+    """Simple town scenario seeded once per session; treat it as read-only."""
+    state = SimulationState(
+        id="sim-test",
+        name="Scenario Test",
+        description="Testing simple town scenario seeding.",
+        status=SimulationStatus.CREATED,
+        current_phase=SimulationPhase.INITIALIZE,
+        phase_number=0,
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
+    )
+    context = ScenarioContext(state=state)
+    SimpleTownScenario().seed(context)
+    return context
@@ -0,0 +1,53 @@
+import importlib
+from pathlib import Path
+
+import pytest
+
+from scrai.scenarios import factory
+from scrai.scenarios.factory import (
+    create_default_scenario_service,
+    discover_scenarios,
+    scan_scenarios,
+    write_scenario_manifest,
+)
+from scrai.scenarios.scenes.simple_town import SimpleTownScenario
+
+_manifest = importlib.import_module("scrai.scenarios.scenes._manifest")
+
+
+def test_checked_in_manifest_matches_scan() -> None:
+    scanned = {
+        name: (scenario_class.__module__, scenario_class.__qualname__)
+        for name, scenario_class in scan_scenarios().items()
+    }
+
+    assert _manifest.SCENARIOS == scanned, "stale scenes manifest; run `scrai gen-scenario-manifest`"
+
+
+def test_write_scenario_manifest_round_trips(tmp_path: Path) -> None:
+    path = tmp_path / "_manifest.py"
+
+    entries = write_scenario_manifest(path)
+
+    namespace: dict = {}
+    exec(compile(path.read_text(encoding="utf-8"), str(path), "exec"), namespace)
+    assert namespace["SCENARIOS"] == entries
+    assert entries["simple_town"] == ("scrai.scenarios.scenes.simple_town", "SimpleTownScenario")
+    assert path.read_text(encoding="utf-8") == factory._MANIFEST_PATH.read_text(encoding="utf-8")
+
+
+def test_scene_missing_from_manifest_is_still_discovered(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_manifest, "SCENARIOS", {})
+
+    assert dict(discover_scenarios()) == {"simple_town": SimpleTownScenario}
+
+
+def test_manifest_scenarios_are_imported_on_first_lookup(monkeypatch: pytest.MonkeyPatch) -> None:
+    broken = ("scrai.scenarios.scenes.does_not_exist", "GhostScenario")
+    monkeypatch.setattr(_manifest, "SCENARIOS", {**_manifest.SCENARIOS, "ghost": broken})
+
+    service = create_default_scenario_service()
+
+    assert isinstance(service.select("simple_town"), SimpleTownScenario)
+    assert service.select("ghost") is None
+    assert [entry["name"] for entry in service.registry.list_all()] == ["simple_town"]
@@ -0,0 +1,43 @@
+from operator import attrgetter
+from typing import Any, Callable
+
+import pytest
+
+from scrai.scenarios import ScenarioContext
+
+_EXPECTED_ACTOR_IDS = frozenset(
+    {
+        "actor-mayor",
+        "actor-doctor",
+        "actor-caretaker",
+        "actor-teacher",
+        "actor-shopkeeper",
+        "actor-firefighter",
+        "actor-resident",
+    }
+)
+_get_id = attrgetter("id")
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    ("getter", "expected"),
+    [
+        pytest.param(lambda c: len(c.actors), 7, id="actor-count"),
+        pytest.param(lambda c: set(map(_get_id, c.actors)), _EXPECTED_ACTOR_IDS, id="actor-ids"),
+        pytest.param(lambda c: len(c.events), 4, id="event-count"),
+        pytest.param(lambda c: c.events[0].id, "event-briefing", id="first-event"),
+        pytest.param(lambda c: len(c.actions), 7, id="action-count"),
+        pytest.param(
+            lambda c: c.actions[0].metadata["related_event"],
+            "event-briefing",
+            id="first-action-event",
+        ),
+    ],
+)
+def test_simple_town_scenario_seed_populates_context(
+    seeded_town_context: ScenarioContext,
+    getter: Callable[[ScenarioContext], Any],
+    expected: Any,
+) -> None:
+    assert getter(seeded_town_context) == expected
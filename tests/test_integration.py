@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """Integration test suite for Phase 2 Milestone 1-2.
 
-This script boots the FastAPI server in-process, exercises the public HTTP
+This script serves the FastAPI app in-process through a test client, exercises the public HTTP
 endpoints, and performs a CLI parity check to guarantee the in-memory runtime
 behaves identically across surfaces.
 """
@@ -9,105 +9,49 @@ behaves identically across surfaces.
 from __future__ import annotations
 
 import json
-import os
-import signal
-import subprocess
-import sys
-import time
 import asyncio
 import uuid
-from datetime import datetime
-from pathlib import Path
-from typing import Optional
-
-import requests
-
-
-REPO_ROOT = Path(__file__).resolve().parents[1]
-API_HOST = "http://127.0.0.1:8008"
-API_ROOT = f"{API_HOST}/api"
-SERVER_START_TIMEOUT_SEC = 40
-SERVER_SHUTDOWN_TIMEOUT_SEC = 5
-
-
-class ApiServerManager:
-    """Manage the lifecycle of a local FastAPI dev server for tests."""
-
-    def __init__(self) -> None:
-        self._process: Optional[subprocess.Popen[bytes]] = None
-
-    def start(self) -> None:
-        if self._process and self._process.poll() is None:
-            return
-
-        command = [
-            sys.executable,
-            "-m",
-            "uvicorn",
-            "scrai.api.app:app",
-            "--host",
-            "127.0.0.1",
-            "--port",
-            "8008",
-        ]
-
-        env = os.environ.copy()
-        env.setdefault("PYTHONUNBUFFERED", "1")
-
-        self._process = subprocess.Popen(  # noqa: S603
-            command,
-            cwd=REPO_ROOT,
-            env=env,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
+from typing import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
 
-        deadline = time.time() + SERVER_START_TIMEOUT_SEC
-        while time.time() < deadline:
-            try:
-                response = requests.get(f"{API_HOST}/health", timeout=2)
-                if response.status_code == 200:
-                    return
-            except requests.RequestException:
-                time.sleep(0.5)
 
-        self.stop()
-        raise RuntimeError("Timed out waiting for API server to start")
+API_ROOT = "/api"
 
-    def stop(self) -> None:
-        if not self._process:
-            return
 
-        if self._process.poll() is None:
-            self._process.send_signal(signal.SIGTERM)
-            try:
-                self._process.wait(timeout=SERVER_SHUTDOWN_TIMEOUT_SEC)
-            except subprocess.TimeoutExpired:
-                self._process.kill()
+@pytest.fixture(scope="module")
+def client() -> Iterator[TestClient]:
+    """Serve the FastAPI app in-process for the duration of the module."""
 
-        self._process = None
+    from scrai.api.app import app
 
+    with TestClient(app) as test_client:
+        yield test_client
 
-api_server = ApiServerManager()
 
+@pytest.fixture(scope="module")
+def sim_id(client: TestClient) -> str:
+    return test_api_create_simulation(client)
 
-def test_api_health():
+
+def test_api_health(client):
     """Test API is responding"""
     print("🔍 Testing API health...")
-    resp = requests.get(f"{API_HOST}/health", timeout=5)
+    resp = client.get("/health")
     assert resp.status_code == 200
     assert resp.json() == {"status": "ok"}
     print("✅ API health check passed")
 
 
-def test_api_create_simulation():
+def test_api_create_simulation(client):
     """Test creating simulation via API"""
     print("\n🔍 Testing API simulation creation...")
     payload = {
         "name": "Integration Test Sim",
         "scenario": "simple_village",
     }
-    resp = requests.post(f"{API_ROOT}/simulations", json=payload, timeout=5)
+    resp = client.post(f"{API_ROOT}/simulations", json=payload)
     assert resp.status_code == 201, f"Unexpected status {resp.status_code}: {resp.text}"
     data = resp.json()
     sim_id = data["id"]
@@ -119,10 +63,10 @@ def test_api_create_simulation():
     return sim_id
 
 
-def test_api_list_simulations():
+def test_api_list_simulations(client):
     """Test listing simulations"""
     print("\n🔍 Testing API simulation list...")
-    resp = requests.get(f"{API_ROOT}/simulations", timeout=5)
+    resp = client.get(f"{API_ROOT}/simulations")
     assert resp.status_code == 200
     sims = resp.json()
     assert isinstance(sims, list)
@@ -130,10 +74,10 @@ def test_api_list_simulations():
     return sims
 
 
-def test_api_get_simulation(sim_id):
+def test_api_get_simulation(client, sim_id):
     """Test getting specific simulation"""
     print(f"\n🔍 Testing API get simulation {sim_id}...")
-    resp = requests.get(f"{API_ROOT}/simulations/{sim_id}", timeout=5)
+    resp = client.get(f"{API_ROOT}/simulations/{sim_id}")
     assert resp.status_code == 200
     data = resp.json()
     assert data["id"] == sim_id
@@ -145,10 +89,10 @@ def test_api_get_simulation(sim_id):
     return data
 
 
-def test_api_start_simulation(sim_id):
+def test_api_start_simulation(client, sim_id):
     """Test starting simulation"""
     print(f"\n🔍 Testing API start simulation {sim_id}...")
-    resp = requests.post(f"{API_ROOT}/simulations/{sim_id}/start", timeout=5)
+    resp = client.post(f"{API_ROOT}/simulations/{sim_id}/start")
     assert resp.status_code == 200
     data = resp.json()
     assert data["status"] == "running"
@@ -156,7 +100,7 @@ def test_api_start_simulation(sim_id):
     return data
 
 
-def test_api_inject_action(sim_id):
+def test_api_inject_action(client, sim_id):
     """Test injecting an action via API"""
 
     print(f"\n🔍 Testing API action injection for {sim_id}...")
@@ -165,54 +109,56 @@ def test_api_inject_action(sim_id):
         "intent": "Collect field samples",
         "metadata": {"channel": "integration-test"},
     }
-    resp = requests.post(
+    resp = client.post(
         f"{API_ROOT}/simulations/{sim_id}/actions",
         json=payload,
-        timeout=5,
     )
     assert resp.status_code == 201, f"Unexpected status {resp.status_code}: {resp.text}"
     data = resp.json()
-    intents = [action["intent"] for action in data["pending_actions"]]
-    assert payload["intent"] in intents, "New action not present in pending list"
-    actor_ids = [actor["id"] for actor in data["actors"]]
-    assert payload["actor_id"] in actor_ids, "Actor not surfaced in simulation detail"
+    assert any(
+        action["intent"] == payload["intent"] for action in data["pending_actions"]
+    ), "New action not present in pending list"
+    assert any(
+        actor["id"] == payload["actor_id"] for actor in data["actors"]
+    ), "Actor not surfaced in simulation detail"
     print("✅ Action injection surfaced in pending actions")
     return data
 
 
-def test_api_stream_snapshot(sim_id):
+def test_api_stream_snapshot(client, sim_id):
     """Test SSE stream emits initial snapshot for a simulation."""
 
     print(f"\n🔍 Testing SSE stream for simulation {sim_id}...")
-    url = f"{API_ROOT}/streams/simulations/{sim_id}"
-
-    with requests.get(url, stream=True, timeout=10) as resp:
-        assert resp.status_code == 200, f"Unexpected status {resp.status_code}"
-
-        for line in resp.iter_lines(decode_unicode=True):
-            if not line:
-                continue
-            if not line.startswith("data:"):
-                continue
-
-            payload = json.loads(line[5:].strip())
-            assert payload["simulation_id"] == sim_id
-            assert payload["event"] in {
-                "simulation.snapshot",
-                "simulation.created",
-                "simulation.started",
-            }
-            print(
-                "✅ Received SSE snapshot event:",
-                payload.get("event"),
-                payload.get("summary", {}).get("status"),
-            )
-            break
-        else:
-            raise AssertionError("Did not receive SSE data event from stream")
-
-
-def test_api_advance_simulation(sim_id, expected_phases=6):
+    from scrai.api.routes.streams import stream_simulation
+
+    # The test client buffers whole response bodies and the stream never ends,
+    # so call the endpoint on the app's loop and pull the first frame directly.
+    resp = client.portal.call(stream_simulation, sim_id)
+    assert resp.status_code == 200, f"Unexpected status {resp.status_code}"
+
+    frames = resp.body_iterator
+    try:
+        frame = client.portal.call(frames.__anext__)
+    except StopAsyncIteration:
+        raise AssertionError("Did not receive SSE data event from stream")
+    finally:
+        client.portal.call(frames.aclose)
+
+    payload = json.loads(frame["data"])
+    assert payload["simulation_id"] == sim_id
+    assert payload["event"] in {
+        "simulation.snapshot",
+        "simulation.created",
+        "simulation.started",
+    }
+    print(
+        "✅ Received SSE snapshot event:",
+        payload.get("event"),
+        payload.get("summary", {}).get("status"),
+    )
+
+
+def test_api_advance_simulation(client, sim_id, expected_phases=6):
     """Test advancing simulation through full cycle"""
     print(f"\n🔍 Testing API advance simulation {sim_id}...")
     
@@ -220,7 +166,7 @@ def test_api_advance_simulation(sim_id, expected_phases=6):
     phase_numbers = []
 
     # Capture initial state before advancing
-    initial = requests.get(f"{API_ROOT}/simulations/{sim_id}", timeout=5)
+    initial = client.get(f"{API_ROOT}/simulations/{sim_id}")
     assert initial.status_code == 200, (
         f"Failed to fetch initial state: {initial.status_code}"
     )
@@ -233,9 +179,8 @@ def test_api_advance_simulation(sim_id, expected_phases=6):
     )
     
     for i in range(expected_phases):
-        resp = requests.post(
+        resp = client.post(
             f"{API_ROOT}/simulations/{sim_id}/advance",
-            timeout=5,
         )
         assert resp.status_code == 200
         data = resp.json()
@@ -246,7 +191,7 @@ def test_api_advance_simulation(sim_id, expected_phases=6):
         print(f"  Step {i+1}: phase={data['current_phase']}, cycle={data['phase_number']}")
     
     # Verify phase cycle
-    expected_cycle = [
+    expected_cycle = (
         "initialize",
         "event_generation",
         "action_collection",
@@ -254,9 +199,11 @@ def test_api_advance_simulation(sim_id, expected_phases=6):
         "world_update",
         "snapshot",
         "event_generation",
-    ]
+    )
 
-    assert phases_seen[:7] == expected_cycle, f"Phase cycle mismatch: {phases_seen[:7]}"
+    assert len(phases_seen) >= len(expected_cycle), f"Only saw phases: {phases_seen}"
+    for idx, (got, want) in enumerate(zip(phases_seen, expected_cycle)):
+        assert got == want, f"Phase {idx}: got {got} want {want}"
     assert phase_numbers[0] == 0, "Should start at cycle 0"
     assert phase_numbers[6] == 1, "Should increment to cycle 1 after SNAPSHOT"
     
@@ -307,11 +254,11 @@ def test_cli_parity():
     print("✅ CLI parity verified")
 
 
-def test_api_llm_check():
+def test_api_llm_check(client):
     """Test LLM readiness endpoint returns structured status."""
 
     print("\n🔍 Testing API LLM check...")
-    resp = requests.post(f"{API_ROOT}/llm/check", timeout=5)
+    resp = client.post(f"{API_ROOT}/llm/check")
     assert resp.status_code == 200
     data = resp.json()
     assert "available" in data
@@ -329,19 +276,20 @@ def run_all_tests():
     print("Phase 2 Milestone 1-2 Integration Tests")
     print("=" * 60)
     
-    api_server.start()
+    from scrai.api.app import app
 
     try:
-        # API Tests
-        test_api_health()
-        sim_id = test_api_create_simulation()
-        test_api_list_simulations()
-        test_api_get_simulation(sim_id)
-        test_api_start_simulation(sim_id)
-        test_api_inject_action(sim_id)
-        test_api_stream_snapshot(sim_id)
-        test_api_advance_simulation(sim_id)
-        test_api_llm_check()
+        with TestClient(app) as client:
+            # API Tests
+            test_api_health(client)
+            sim_id = test_api_create_simulation(client)
+            test_api_list_simulations(client)
+            test_api_get_simulation(client, sim_id)
+            test_api_start_simulation(client, sim_id)
+            test_api_inject_action(client, sim_id)
+            test_api_stream_snapshot(client, sim_id)
+            test_api_advance_simulation(client, sim_id)
+            test_api_llm_check(client)
         
         # CLI Parity
         test_cli_parity()
@@ -363,8 +311,6 @@ def run_all_tests():
     except Exception as e:
         print(f"\n❌ ERROR: {e}")
         raise
-    finally:
-        api_server.stop()
 
 
 if __name__ == "__main__":
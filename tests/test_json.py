@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from scrai import _json
+
+_VALUE = {"b": [1, "é"], "a": {"at": datetime(2024, 1, 1, 2, 3)}}
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    if request.param and not _json.ORJSON_AVAILABLE:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(_json, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
+
+def test_compact_output_matches_across_backends(backend: bool) -> None:
+    assert _json.dumps(_VALUE) == '{"b":[1,"é"],"a":{"at":"2024-01-01T02:03:00"}}'.encode()
+    assert _json.dumps_text([1]) == "[1]"
+
+
+def test_pretty_output_is_indented_and_sorted(backend: bool) -> None:
+    assert _json.dumps({"b": 1, "a": 2}, pretty=True) == b'{\n  "a": 2,\n  "b": 1\n}'
+
+
+def test_round_trip(backend: bool) -> None:
+    assert _json.loads(_json.dumps({"x": [1, 2]})) == {"x": [1, 2]}
+    assert _json.loads('{"x": 1}') == {"x": 1}
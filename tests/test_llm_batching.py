@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List, Sequence
+
+import pytest
+
+from scrai.llm import BatchingLLMService, LLMClientError, LLMMessage, LLMResponse
+from scrai.llm.service import LLMServiceConfig, ProviderConfig
+
+
+class _FakeClient:
+    """Answers each prompt after the delay (in seconds) given as its content.
+
+    A marshalled request waits for its slowest prompt and is rejected as
+    unusable when any prompt is ``"boom"``, which fails on its own.
+    """
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.request_sizes: List[int] = []
+
+    async def generate_response(self, messages: List[LLMMessage], **kwargs: Any) -> LLMResponse:
+        content = messages[-1].content
+        if content == "boom":
+            raise ValueError("provider failed")
+        await self._send(1, float(content))
+        return LLMResponse(content=content, model="fake", provider="fake")
+
+    async def generate_batched_response(
+        self, message_groups: Sequence[List[LLMMessage]], **kwargs: Any
+    ) -> List[LLMResponse]:
+        contents = [messages[-1].content for messages in message_groups]
+        if "boom" in contents:
+            raise LLMClientError("unusable marshalled reply", provider="fake")
+        await self._send(len(contents), max(float(content) for content in contents))
+        return [LLMResponse(content=content, model="fake", provider="fake") for content in contents]
+
+    async def _send(self, size: int, delay: float) -> None:
+        self.request_sizes.append(size)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.in_flight -= 1
+
+
+class _FakeBatchingService(BatchingLLMService):
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(LLMServiceConfig(primary=ProviderConfig(name="openrouter")), **kwargs)
+        self.client = _FakeClient()
+
+    async def _get_or_create_client(self, provider_config: ProviderConfig) -> Any:
+        return self.client
+
+
+def _prompt(content: str) -> List[Dict[str, str]]:
+    return [{"role": "user", "content": content}]
+
+
+def test_slow_completion_does_not_block_later_batches() -> None:
+    async def scenario() -> Dict[str, float]:
+        service = _FakeBatchingService(max_batch=2, flush_ms=10)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        finished: Dict[str, float] = {}
+
+        async def call(name: str, delay: str) -> None:
+            await service.complete(_prompt(delay), request_id=name)
+            finished[name] = loop.time() - started
+
+        slow = asyncio.create_task(call("a", "0.5"))
+        await asyncio.sleep(0.03)  # let "a" go out in a batch of its own
+        await asyncio.gather(call("b", "0.01"), call("c", "0.02"))
+        await slow
+        await service.close()
+        return finished
+
+    finished = asyncio.run(scenario())
+    assert finished["b"] < 0.25
+    assert finished["c"] < 0.25
+    assert finished["a"] >= 0.5
+
+
+def test_full_batch_dispatches_before_flush_window() -> None:
+    async def scenario() -> float:
+        service = _FakeBatchingService(max_batch=3, flush_ms=1000)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        responses = await asyncio.gather(*(service.complete(_prompt(f"0.0{i}")) for i in range(3)))
+        elapsed = loop.time() - started
+        await service.close()
+        assert [response.content for response in responses] == ["0.00", "0.01", "0.02"]
+        return elapsed
+
+    assert asyncio.run(scenario()) < 0.5
+
+
+def test_batch_sharing_options_is_one_marshalled_request() -> None:
+    async def scenario() -> List[int]:
+        service = _FakeBatchingService(max_batch=8, flush_ms=20)
+        responses = await asyncio.gather(
+            *(service.complete(_prompt("0"), temperature=0.2) for _ in range(3)),
+            service.complete(_prompt("0"), temperature=0.9),
+        )
+        await service.close()
+        assert len(responses) == 4
+        return sorted(service.client.request_sizes)
+
+    assert asyncio.run(scenario()) == [1, 3]
+
+
+def test_partial_batch_flushes_after_window() -> None:
+    async def scenario() -> float:
+        service = _FakeBatchingService(max_batch=8, flush_ms=20)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        response = await service.complete(_prompt("0"))
+        elapsed = loop.time() - started
+        await service.close()
+        assert response.content == "0"
+        return elapsed
+
+    assert 0.015 <= asyncio.run(scenario()) < 0.5
+
+
+def test_max_concurrency_bounds_in_flight_requests() -> None:
+    async def scenario() -> int:
+        service = _FakeBatchingService(max_batch=2, flush_ms=1, max_concurrency=3)
+        await asyncio.gather(*(service.complete(_prompt("0.02"), n=i) for i in range(10)))
+        await service.close()
+        return service.client.peak_in_flight
+
+    assert asyncio.run(scenario()) == 3
+
+
+def test_provider_error_reaches_only_its_caller() -> None:
+    async def scenario() -> None:
+        service = _FakeBatchingService(max_batch=2, flush_ms=10)
+        ok, failed = await asyncio.gather(
+            service.complete(_prompt("0")),
+            service.complete(_prompt("boom")),
+            return_exceptions=True,
+        )
+        await service.close()
+        assert isinstance(ok, LLMResponse)
+        assert isinstance(failed, ValueError)
+
+    asyncio.run(scenario())
+
+
+def test_close_fails_in_flight_and_queued_requests() -> None:
+    async def scenario() -> None:
+        service = _FakeBatchingService(max_batch=1, flush_ms=0, max_concurrency=1)
+        in_flight = asyncio.create_task(service.complete(_prompt("5")))
+        queued = asyncio.create_task(service.complete(_prompt("5"), n=2))
+        await asyncio.sleep(0.05)
+        await service.close()
+        for task in (in_flight, queued):
+            with pytest.raises(RuntimeError, match="closed"):
+                await asyncio.wait_for(task, 1)
+
+    asyncio.run(scenario())
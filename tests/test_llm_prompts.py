@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator, List, Sequence
+
+import pytest
+
+from scrai.engine import llm_prompts
+from scrai.engine.llm_prompts import iter_json_array_items
+
+
+def _collect(chunks: Sequence[str]) -> List[Any]:
+    async def stream() -> AsyncIterator[str]:
+        for chunk in chunks:
+            yield chunk
+
+    async def scenario() -> List[Any]:
+        return [item async for item in iter_json_array_items(stream())]
+
+    return asyncio.run(scenario())
+
+
+def _split_everywhere(text: str) -> List[List[str]]:
+    """Every way of cutting ``text`` into two chunks, plus one chunk per character."""
+    return [[text[:cut], text[cut:]] for cut in range(len(text) + 1)] + [list(text)]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '[{"title": "a, b [c] {d}"}, {"title": "quote \\" and \\\\ slash"}]',
+        '[{"title": "unicode \\u00e9", "affected_actors": ["x", "y"]}]',
+    ],
+)
+def test_chunk_boundaries_inside_strings_and_escapes(text: str) -> None:
+    expected = _collect([text])
+    assert len(expected) == len(text.split('"title"')) - 1
+    for chunks in _split_everywhere(text):
+        assert _collect(chunks) == expected
+
+
+def test_nested_arrays_and_objects_are_yielded_whole() -> None:
+    text = '[{"a": {"b": [1, {"c": []}]}}, [1, [2, 3]], [], 4, "s"]'
+
+    assert _collect([text]) == [{"a": {"b": [1, {"c": []}]}}, [1, [2, 3]], [], 4, "s"]
+
+
+def test_prose_and_code_fence_before_array_are_ignored() -> None:
+    chunks = ["Sure! Here are the events:\n```json\n", '[{"title": "Flood"}]', "\n```\nDone."]
+
+    assert _collect(chunks) == [{"title": "Flood"}]
+
+
+def test_text_after_closing_bracket_is_ignored() -> None:
+    assert _collect(['[1, 2] and then [3]', ", [4]"]) == [1, 2]
+
+
+def test_truncated_tail_element_is_salvaged() -> None:
+    chunks = ['[{"title": "Flood"}, {"title": "Fi', "re"]
+
+    assert _collect(chunks) == [{"title": "Flood"}, {"title": "Fire"}]
+
+
+def test_unparseable_element_is_skipped() -> None:
+    assert _collect(['[{"a": 1}, {nonsense: :}, {"b": 2}]']) == [{"a": 1}, {"b": 2}]
+
+
+def test_stream_without_array_yields_nothing() -> None:
+    assert _collect(["I could not produce any events."]) == []
+
+
+@pytest.fixture
+def without_json_repair(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(llm_prompts, "JSON_REPAIR_AVAILABLE", False)
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        pytest.param('[{"a": 1,}, {"b": [1, 2,],},]', [{"a": 1}, {"b": [1, 2]}], id="trailing-commas"),
+        pytest.param('[{"ok": True, "no": False, "x": None}]', [{"ok": True, "no": False, "x": None}], id="python-literals"),
+        pytest.param('[{"a": [1, {"b": 2', [{"a": [1, {"b": 2}]}], id="unclosed-brackets"),
+        pytest.param('[{"title": "cut o', [{"title": "cut o"}], id="unclosed-string"),
+        pytest.param('```json\n[{"a": 1,}]\n```', [{"a": 1}], id="fenced"),
+        pytest.param('["True, None,", "a,]"]', ["True, None,", "a,]"], id="string-contents-untouched"),
+    ],
+)
+def test_fallback_repair_fixes_documented_slips(without_json_repair: None, content: str, expected: Any) -> None:
+    assert llm_prompts.parse_llm_json_response(content) == expected
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param("[{'a': 1}]", id="single-quotes"),
+        pytest.param('Here you go: [{"a": 1}]', id="prose-prefix"),
+        pytest.param('[{"a": 1}] Hope this helps!', id="trailing-text"),
+    ],
+)
+def test_fallback_repair_documented_limits(
+    without_json_repair: None, content: str, caplog: pytest.LogCaptureFixture
+) -> None:
+    assert llm_prompts.parse_llm_json_response(content) == []
+    assert "Failed to parse LLM JSON response" in caplog.text
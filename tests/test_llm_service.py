@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from scrai.llm import LLMMessage, LLMRateLimitError, LLMResponse, LLMService
+from scrai.llm.providers.openai_compatible_client import _rate_limit_retries_deferred
+from scrai.llm.service import LLMServiceConfig, ProviderConfig
+
+
+class _Abort(BaseException):
+    pass
+
+
+class _FakeService(LLMService):
+    """Answers each prompt with its own content after the delay encoded in it.
+
+    Content ``"<delay>"`` sleeps that long; ``"limited:<n>"`` is rate limited
+    for its first ``n`` attempts; ``"abort"`` raises a non-``Exception`` error.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(LLMServiceConfig(primary=ProviderConfig(name="openrouter")))
+        self.attempts: Dict[str, int] = {}
+
+    async def _complete(self, normalized: List[LLMMessage], provider: Any, kwargs: Dict[str, Any]) -> LLMResponse:
+        content = normalized[-1].content
+        attempt = self.attempts[content] = self.attempts.get(content, 0) + 1
+        if content == "abort":
+            raise _Abort()
+        if content.startswith("limited:"):
+            if attempt <= int(content.split(":")[1]):
+                raise LLMRateLimitError("slow down")
+        else:
+            await asyncio.sleep(float(content))
+        return LLMResponse(content=content, model="fake", provider="fake")
+
+
+def _prompts(*contents: str) -> List[List[LLMMessage]]:
+    return [[LLMMessage(role="user", content=content)] for content in contents]
+
+
+@pytest.fixture
+def backoff_delays(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    """Record the backoff ceilings and skip the actual waiting."""
+
+    delays: List[float] = []
+
+    def uniform(low: float, high: float) -> float:
+        delays.append(high)
+        return 0.0
+
+    monkeypatch.setattr("scrai.llm.service.random.uniform", uniform)
+    return delays
+
+
+def test_results_keep_input_order() -> None:
+    service = _FakeService()
+
+    results = asyncio.run(service.batch_complete(_prompts("0.03", "0", "0.01"), max_concurrency=3))
+
+    assert [result.content for result in results] == ["0.03", "0", "0.01"]  # type: ignore[union-attr]
+
+
+def test_rate_limited_prompts_retry_with_growing_backoff(backoff_delays: List[float]) -> None:
+    service = _FakeService()
+
+    results = asyncio.run(service.batch_complete(_prompts("limited:2", "0")))
+
+    assert [result.content for result in results] == ["limited:2", "0"]  # type: ignore[union-attr]
+    assert service.attempts["limited:2"] == 3
+    assert backoff_delays == [1.0, 2.0]
+
+
+def test_exhausted_retries_fail_only_that_prompt(backoff_delays: List[float]) -> None:
+    service = _FakeService()
+
+    limited, ok = asyncio.run(
+        service.batch_complete(_prompts("limited:5", "0"), max_rate_limit_retries=1)
+    )
+
+    assert isinstance(limited, LLMRateLimitError)
+    assert isinstance(ok, LLMResponse)
+    assert service.attempts["limited:5"] == 2
+
+
+def test_progress_callback_counts_every_prompt(backoff_delays: List[float]) -> None:
+    service = _FakeService()
+    progress: List[Tuple[int, int]] = []
+
+    asyncio.run(
+        service.batch_complete(
+            _prompts("0", "limited:9", "0.01"),
+            max_rate_limit_retries=0,
+            progress_cb=lambda done, total: progress.append((done, total)),
+        )
+    )
+
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+
+
+def test_non_exception_failures_are_raised() -> None:
+    service = _FakeService()
+
+    with pytest.raises(_Abort):
+        asyncio.run(service.batch_complete(_prompts("0", "abort")))
+
+
+class _DownClient:
+    def __init__(self) -> None:
+        self.probes = 0
+
+    async def validate_connection(self) -> bool:
+        self.probes += 1
+        return False
+
+
+def test_validate_probes_despite_fresh_model_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "models-openrouter.json").write_text(
+        json.dumps({"last_sync": time.time(), "models": ["cached/model"]}), encoding="utf-8"
+    )
+    service = LLMService(LLMServiceConfig(primary=ProviderConfig(name="openrouter")), models_cache_dir=tmp_path)
+    client = _DownClient()
+
+    async def get_client(provider_config: ProviderConfig) -> _DownClient:
+        return client
+
+    monkeypatch.setattr(service, "_get_or_create_client", get_client)
+
+    async def scenario() -> Tuple[List[str], bool]:
+        return await service.list_models(), await service.validate()
+
+    assert asyncio.run(scenario()) == (["cached/model"], False)
+    assert client.probes == 1
+
+
+class _CountingService(LLMService):
+    def __init__(self, *, coalesce_identical: bool) -> None:
+        super().__init__(
+            LLMServiceConfig(primary=ProviderConfig(name="openrouter")), coalesce_identical=coalesce_identical
+        )
+        self.requests = 0
+
+    async def _complete(self, normalized: Any, provider: Any, kwargs: Dict[str, Any]) -> LLMResponse:
+        self.requests += 1
+        sample = self.requests
+        await asyncio.sleep(0.01)
+        return LLMResponse(content=f"sample {sample}", model="fake", provider="fake")
+
+
+@pytest.mark.parametrize(("coalesce_identical", "requests"), [(False, 2), (True, 1)])
+def test_identical_completions_coalesce_only_when_enabled(coalesce_identical: bool, requests: int) -> None:
+    service = _CountingService(coalesce_identical=coalesce_identical)
+
+    async def scenario() -> List[LLMResponse]:
+        prompt = _prompts("same")[0]
+        return list(await asyncio.gather(service.complete(prompt), service.complete(prompt)))
+
+    responses = asyncio.run(scenario())
+
+    assert service.requests == requests
+    assert len({response.content for response in responses}) == requests
+
+
+def test_batch_complete_defers_client_rate_limit_retries() -> None:
+    deferred: List[bool] = []
+
+    class _Service(_FakeService):
+        async def _complete(self, normalized: List[LLMMessage], provider: Any, kwargs: Dict[str, Any]) -> LLMResponse:
+            deferred.append(_rate_limit_retries_deferred.get())
+            return await super()._complete(normalized, provider, kwargs)
+
+    asyncio.run(_Service().batch_complete(_prompts("0", "0")))
+
+    assert deferred == [True, True]
+    assert _rate_limit_retries_deferred.get() is False
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Dict, List
+
+import httpx
+import pytest
+
+from scrai.llm import LLMClientError, LLMRateLimitError
+from scrai.llm.providers import OpenAICompatibleClient
+from scrai.llm.providers.openai_compatible_client import defer_rate_limit_retries
+
+_BASE_URL = "http://localhost:1234/v1"
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("scrai.llm.providers.openai_compatible_client._backoff_delay", lambda attempt: 0.0)
+
+
+def _scripted(*responses: httpx.Response) -> Handler:
+    """Serve the given responses in order, one per request."""
+
+    remaining = list(responses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return remaining.pop(0)
+
+    return handler
+
+
+def _request(handler: Handler, *, max_retries: int = 3) -> Dict[str, Any]:
+    async def scenario() -> Dict[str, Any]:
+        client = OpenAICompatibleClient(base_url=_BASE_URL, max_retries=max_retries)
+        await client.close()
+        client._client = httpx.AsyncClient(base_url=_BASE_URL, transport=httpx.MockTransport(handler))
+        try:
+            return await client._request("GET", client.MODELS_ENDPOINT)
+        finally:
+            await client.close()
+
+    return asyncio.run(scenario())
+
+
+def _counting(handler: Handler, calls: List[int]) -> Handler:
+    def counted(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return handler(request)
+
+    return counted
+
+
+@pytest.mark.parametrize("status", [429, 500, 503])
+def test_transient_statuses_are_retried(status: int) -> None:
+    calls: List[int] = []
+    handler = _scripted(httpx.Response(status), httpx.Response(200, json={"data": []}))
+
+    assert _request(_counting(handler, calls)) == {"data": []}
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("status", [400, 401, 404])
+def test_other_client_errors_fail_immediately(status: int) -> None:
+    calls: List[int] = []
+
+    with pytest.raises(LLMClientError, match=str(status)):
+        _request(_counting(lambda request: httpx.Response(status, text="nope"), calls))
+    assert len(calls) == 1
+
+
+def test_non_json_body_raises_client_error() -> None:
+    with pytest.raises(LLMClientError, match="not valid JSON"):
+        _request(lambda request: httpx.Response(200, text="<html>"))
+
+
+def test_last_failure_is_raised_after_retries() -> None:
+    calls: List[int] = []
+    handler = _scripted(httpx.Response(500), httpx.Response(429))
+
+    with pytest.raises(LLMRateLimitError):
+        _request(_counting(handler, calls), max_retries=2)
+    assert len(calls) == 2
+
+
+def test_transport_errors_are_retried_then_wrapped() -> None:
+    calls: List[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        raise httpx.ConnectError("refused", request=request)
+
+    with pytest.raises(LLMClientError, match="after 2 attempts"):
+        _request(handler, max_retries=2)
+    assert len(calls) == 2
+
+
+def test_deferred_rate_limits_are_raised_without_retrying() -> None:
+    calls: List[int] = []
+    handler = _scripted(httpx.Response(429), httpx.Response(200, json={"data": []}))
+
+    with defer_rate_limit_retries():
+        with pytest.raises(LLMRateLimitError):
+            _request(_counting(handler, calls))
+    assert len(calls) == 1
+
+
+def test_deferred_rate_limits_still_retry_server_errors() -> None:
+    calls: List[int] = []
+    handler = _scripted(httpx.Response(503), httpx.Response(200, json={"data": []}))
+
+    with defer_rate_limit_retries():
+        assert _request(_counting(handler, calls)) == {"data": []}
+    assert len(calls) == 2
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from scrai.cli.memory import (
+    MemoryActionRepository,
+    MemoryActorRepository,
+    MemoryEventRepository,
+    MemorySimulationRepository,
+)
+from scrai.cli.store import LocalStateStore
+from scrai.engine import PhaseContext, PhaseEngine, PhaseEngineError, PhaseResult
+from scrai.engine.phase_handlers import BasePhaseHandler
+from scrai.models import SimulationState
+from scrai.models.simulation_state import SimulationPhase, SimulationStatus
+
+
+class _CountingSimulationRepository(MemorySimulationRepository):
+    def __init__(self, store: LocalStateStore) -> None:
+        super().__init__(store)
+        self.updates: List[frozenset] = []
+
+    async def update(self, entity_id: str, updates: Dict[str, Any]) -> bool:
+        self.updates.append(frozenset(updates))
+        return await super().update(entity_id, updates)
+
+
+class _StaticPhaseHandler(BasePhaseHandler):
+    """Runs the action collection phase, moving on to ``next_phase`` without other changes."""
+
+    phase = SimulationPhase.ACTION_COLLECTION
+
+    def __init__(self, next_phase: SimulationPhase, *, delete_simulation: bool = False) -> None:
+        super().__init__()
+        self.next_phase = next_phase
+        self.delete_simulation = delete_simulation
+
+    async def run(self, context: PhaseContext) -> PhaseResult:
+        if self.delete_simulation:
+            # Simulates the simulation being deleted while the phase runs
+            await context.simulation_repository.delete(context.simulation.id)
+        return PhaseResult(
+            simulation=context.simulation,
+            executed_phase=self.phase,
+            next_phase=self.next_phase,
+        )
+
+
+def _step_once(
+    tmp_path: Path, next_phase: SimulationPhase, *, delete_simulation: bool = False
+) -> List[frozenset]:
+    store = LocalStateStore(tmp_path / "state.json")
+    simulations = _CountingSimulationRepository(store)
+    engine = PhaseEngine(
+        simulation_repository=simulations,
+        actor_repository=MemoryActorRepository(store),
+        event_repository=MemoryEventRepository(store),
+        action_repository=MemoryActionRepository(store),
+        handlers=[_StaticPhaseHandler(next_phase, delete_simulation=delete_simulation)],
+    )
+    simulation = SimulationState(
+        id="sim-engine",
+        name="Engine Test",
+        status=SimulationStatus.RUNNING,
+        current_phase=SimulationPhase.ACTION_COLLECTION,
+    )
+
+    async def scenario() -> None:
+        await simulations.create(simulation)
+        await engine.step(simulation.id)
+
+    asyncio.run(scenario())
+    return simulations.updates
+
+
+def test_no_op_phase_skips_simulation_write(tmp_path: Path) -> None:
+    assert _step_once(tmp_path, SimulationPhase.ACTION_COLLECTION) == []
+
+
+def test_phase_change_writes_only_changed_fields(tmp_path: Path) -> None:
+    updates = _step_once(tmp_path, SimulationPhase.ACTION_RESOLUTION)
+    assert updates == [frozenset({"current_phase", "updated_at"})]
+
+
+def test_simulation_deleted_mid_step_is_not_recreated(tmp_path: Path) -> None:
+    with pytest.raises(PhaseEngineError):
+        _step_once(tmp_path, SimulationPhase.ACTION_RESOLUTION, delete_simulation=True)
+
+    store = LocalStateStore(tmp_path / "state.json")
+    assert asyncio.run(MemorySimulationRepository(store).get("sim-engine")) is None
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Sequence, Set
+
+import pytest
+
+from scrai.cli.memory import (
+    MemoryActionRepository,
+    MemoryActorRepository,
+    MemoryEventRepository,
+    MemorySimulationRepository,
+)
+from scrai.cli.store import LocalStateStore
+from scrai.engine import PhaseContext, phase_handlers
+from scrai.engine.phase_handlers import (
+    ActionResolutionPhaseHandler,
+    EventGenerationPhaseHandler,
+    WorldUpdatePhaseHandler,
+)
+from scrai.llm import LLMResponse
+from scrai.models import Action, Actor, Event, SimulationState
+from scrai.models.action import ActionType
+from scrai.models.actor import ActorType
+from scrai.models.event import EventType
+from scrai.models.simulation_state import SimulationStatus
+from scrai.scenarios import create_default_scenario_service
+
+
+class _CountingReads:
+    get_many_calls: int = 0
+
+    async def get_many(self, entity_ids: Sequence[str]) -> List[Any]:
+        self.get_many_calls += 1
+        return await super().get_many(entity_ids)  # type: ignore[misc]
+
+
+class _Actors(_CountingReads, MemoryActorRepository):
+    pass
+
+
+class _Events(_CountingReads, MemoryEventRepository):
+    pass
+
+
+class _Actions(_CountingReads, MemoryActionRepository):
+    pass
+
+
+class _WriteTrackingEvents(MemoryEventRepository):
+    def __init__(self, store: LocalStateStore, *, fail_first_create: bool = False) -> None:
+        super().__init__(store)
+        self.exists_checked: List[List[str]] = []
+        self.created: List[str] = []
+        self._fail_next_create = fail_first_create
+
+    async def exists_many(self, entity_ids: Sequence[str]) -> Set[str]:
+        self.exists_checked.append(list(entity_ids))
+        return await super().exists_many(entity_ids)
+
+    async def create(self, entity: Event) -> str:
+        self.created.append(entity.id)
+        if self._fail_next_create:
+            self._fail_next_create = False
+            raise ConnectionError("write dropped")
+        return await super().create(entity)
+
+
+class _ScriptedLLM:
+    """Stands in for LLMService, answering every prompt with one fixed reply."""
+
+    def __init__(self, reply: Any) -> None:
+        self.reply = json.dumps(reply)
+
+    async def complete(self, messages: Any, **kwargs: Any) -> LLMResponse:
+        return LLMResponse(content=self.reply, model="scripted", provider="scripted")
+
+    async def stream(self, messages: Any, **kwargs: Any) -> AsyncIterator[str]:
+        yield self.reply
+
+
+def _context(tmp_path: Path, reply: Any) -> PhaseContext:
+    store = LocalStateStore(tmp_path / "state.json")
+    actors, events, actions = _Actors(store), _Events(store), _Actions(store)
+    simulation = SimulationState(id="sim-handlers", name="Handlers", status=SimulationStatus.RUNNING)
+
+    async def seed() -> None:
+        await actors.create(Actor(id="actor-1", name="Ada", type=ActorType.NPC))
+        await events.create(Event(id="event-1", title="Storm", description="", type=EventType.ENVIRONMENTAL))
+        await actions.create(
+            Action(id="action-1", actor_id="actor-1", type=ActionType.CUSTOM, intent="Shelter", description="")
+        )
+
+    asyncio.run(seed())
+    simulation.add_actor("actor-1")
+    simulation.add_pending_event("event-1")
+    simulation.add_pending_action("action-1")
+    return PhaseContext(
+        simulation=simulation,
+        simulation_repository=MemorySimulationRepository(store),
+        actor_repository=actors,
+        event_repository=events,
+        action_repository=actions,
+        llm_service=_ScriptedLLM(reply),  # type: ignore[arg-type]
+    )
+
+
+def _read_counts(context: PhaseContext) -> Dict[str, int]:
+    return {
+        "actors": context.actor_repository.get_many_calls,  # type: ignore[attr-defined]
+        "events": context.event_repository.get_many_calls,  # type: ignore[attr-defined]
+        "actions": context.action_repository.get_many_calls,  # type: ignore[attr-defined]
+    }
+
+
+def test_action_resolution_loads_state_once(tmp_path: Path) -> None:
+    context = _context(
+        tmp_path,
+        [
+            {
+                "action_id": "action-1",
+                "status": "completed",
+                "outcome_description": "Found shelter",
+                "actor_effects": {"attribute_changes": {"mood": "calm"}},
+                "generated_events": [],
+            }
+        ],
+    )
+
+    asyncio.run(ActionResolutionPhaseHandler().run(context))
+
+    assert _read_counts(context) == {"actors": 1, "events": 1, "actions": 1}
+    actor = asyncio.run(context.actor_repository.get("actor-1"))
+    assert actor is not None and actor.attributes["mood"] == "calm"
+
+
+def test_world_update_loads_state_once(tmp_path: Path) -> None:
+    context = _context(
+        tmp_path,
+        {"actor_updates": [{"actor_id": "actor-1", "attribute_changes": {"wet": True}}], "world_state_changes": {}},
+    )
+
+    asyncio.run(WorldUpdatePhaseHandler().run(context))
+
+    assert _read_counts(context) == {"actors": 1, "events": 1, "actions": 0}
+    actor = asyncio.run(context.actor_repository.get("actor-1"))
+    assert actor is not None and actor.attributes["wet"] is True
+
+
+_GENERATED_EVENTS = [
+    {"title": "Flood", "description": "", "type": "environmental", "affected_actors": ["actor-1"]},
+    {"title": "Fair", "description": "", "type": "social", "affected_actors": []},
+]
+
+
+def _event_generation_context(tmp_path: Path, events: _WriteTrackingEvents) -> PhaseContext:
+    context = _context(tmp_path, _GENERATED_EVENTS)
+    context.event_repository = events
+    context.scenario_service = create_default_scenario_service()
+    context.simulation.scenario_module = "simple_town"
+    context.simulation.metadata["scenario"] = {"seeded": True}
+    return context
+
+
+def test_streamed_events_are_not_rechecked_after_early_writes(tmp_path: Path) -> None:
+    events = _WriteTrackingEvents(LocalStateStore(tmp_path / "state.json"))
+    context = _event_generation_context(tmp_path, events)
+
+    result = asyncio.run(EventGenerationPhaseHandler().run(context))
+
+    assert len(result.generated_event_ids) == 2
+    assert events.exists_checked == []
+    assert sorted(events.created) == sorted(result.generated_event_ids)
+
+
+def test_only_failed_early_writes_are_retried(tmp_path: Path) -> None:
+    events = _WriteTrackingEvents(LocalStateStore(tmp_path / "state.json"), fail_first_create=True)
+    context = _event_generation_context(tmp_path, events)
+
+    result = asyncio.run(EventGenerationPhaseHandler().run(context))
+
+    failed_id = events.created[0]
+    assert events.exists_checked == [[failed_id]]
+    assert events.created.count(failed_id) == 2
+    stored = asyncio.run(events.get_many(result.generated_event_ids))
+    assert len(stored) == 2
+
+
+def test_one_bad_event_does_not_drop_later_events(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def event_rejecting_flood(**fields: Any) -> Event:
+        if fields["title"] == "Flood":
+            raise ValueError("rejected")
+        return Event(**fields)
+
+    monkeypatch.setattr(phase_handlers, "Event", event_rejecting_flood)
+    events = _WriteTrackingEvents(LocalStateStore(tmp_path / "state.json"))
+    context = _event_generation_context(tmp_path, events)
+
+    result = asyncio.run(EventGenerationPhaseHandler().run(context))
+
+    stored = asyncio.run(events.get_many(result.generated_event_ids))
+    assert [event.title for event in stored] == ["Fair"]
+
+
+class _BrokenStreamLLM(_ScriptedLLM):
+    """Streams the first reply item, then fails as a dropped connection would."""
+
+    async def stream(self, messages: Any, **kwargs: Any) -> AsyncIterator[str]:
+        yield self.reply[: self.reply.index("}, {") + 1]
+        raise ConnectionError("stream dropped")
+
+
+def test_events_before_a_stream_failure_are_kept(tmp_path: Path) -> None:
+    events = _WriteTrackingEvents(LocalStateStore(tmp_path / "state.json"))
+    context = _event_generation_context(tmp_path, events)
+    context.llm_service = _BrokenStreamLLM(_GENERATED_EVENTS)  # type: ignore[assignment]
+
+    result = asyncio.run(EventGenerationPhaseHandler().run(context))
+
+    stored = asyncio.run(events.get_many(result.generated_event_ids))
+    assert [event.title for event in stored] == ["Flood"]
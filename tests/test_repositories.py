@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+import pytest
+
+from scrai.cli.memory import MemorySimulationRepository
+from scrai.cli.store import LocalStateStore
+from scrai.data.repository import RepositoryError
+from scrai.data.simulation_repository import SimulationRepository
+from scrai.models import SimulationState
+
+
+class _RecordingFirestoreClient:
+    """Stands in for FirestoreClient, recording writes to the given existing documents."""
+
+    def __init__(self, existing: Set[str]) -> None:
+        self.existing = existing
+        self.upserts: List[Tuple[str, str, Dict[str, Any]]] = []
+        self.updates: List[Tuple[str, str, Dict[str, Any]]] = []
+
+    async def upsert_document(self, collection: str, document_id: str, data: Dict[str, Any]) -> None:
+        self.upserts.append((collection, document_id, data))
+        self.existing.add(document_id)
+
+    async def update_document(self, collection: str, document_id: str, updates: Dict[str, Any]) -> bool:
+        if document_id not in self.existing:
+            return False
+        self.updates.append((collection, document_id, updates))
+        return True
+
+
+def _changed_simulation() -> SimulationState:
+    simulation = SimulationState(id="sim-repo", name="Before", world_state={"day": 1})
+    simulation.clear_dirty()
+    simulation.update_world_state({"day": 2})
+    return simulation
+
+
+def test_firestore_upsert_with_fields_updates_only_the_patch() -> None:
+    client = _RecordingFirestoreClient({"sim-repo"})
+    repository = SimulationRepository(client)  # type: ignore[arg-type]
+    simulation = _changed_simulation()
+
+    asyncio.run(repository.upsert(simulation, fields=simulation.dirty_fields))
+
+    assert client.upserts == []
+    [(collection, document_id, data)] = client.updates
+    assert (collection, document_id) == ("simulations", "sim-repo")
+    assert set(data) == {"world_state", "updated_at"}
+    assert data["world_state"] == {"day": 2}
+
+
+def test_firestore_upsert_with_fields_does_not_create_missing_document() -> None:
+    client = _RecordingFirestoreClient(set())
+    repository = SimulationRepository(client)  # type: ignore[arg-type]
+    simulation = _changed_simulation()
+
+    with pytest.raises(RepositoryError, match="not found"):
+        asyncio.run(repository.upsert(simulation, fields=simulation.dirty_fields))
+    assert client.upserts == []
+
+
+def test_firestore_upsert_without_fields_writes_the_whole_document() -> None:
+    client = _RecordingFirestoreClient(set())
+    repository = SimulationRepository(client)  # type: ignore[arg-type]
+    simulation = _changed_simulation()
+
+    asyncio.run(repository.upsert(simulation))
+
+    assert client.upserts[0][2] == simulation.to_dict()
+
+
+def test_memory_upsert_with_fields_keeps_other_stored_fields(tmp_path: Path) -> None:
+    repository = MemorySimulationRepository(LocalStateStore(tmp_path / "state.json"))
+    simulation = _changed_simulation()
+    asyncio.run(repository.create(simulation))
+    simulation.name = "After"
+    simulation.world_state = {"day": 3}
+
+    asyncio.run(repository.upsert(simulation, fields=["world_state"]))
+
+    stored = asyncio.run(repository.get("sim-repo"))
+    assert stored is not None
+    assert stored.world_state == {"day": 3}
+    assert stored.name == "Before"
+
+
+def test_memory_upsert_with_fields_does_not_create_missing_entity(tmp_path: Path) -> None:
+    repository = MemorySimulationRepository(LocalStateStore(tmp_path / "state.json"))
+    simulation = _changed_simulation()
+
+    with pytest.raises(RepositoryError, match="not found"):
+        asyncio.run(repository.upsert(simulation, fields=["world_state"]))
+    assert asyncio.run(repository.get("sim-repo")) is None
+
+    asyncio.run(repository.upsert(simulation))
+    assert asyncio.run(repository.get("sim-repo")) is not None
+
+
+def test_name_index_is_invalidated_by_simulation_id() -> None:
+    client = _RecordingFirestoreClient({"sim-repo", "sim-other"})
+    repository = SimulationRepository(client)  # type: ignore[arg-type]
+    repository._remember_name("Before", "sim-repo")
+    repository._remember_name("Other", "sim-other")
+
+    repository._remember_name("After", "sim-repo")
+    assert repository._cached_name_lookup("Before") is None
+    assert repository._cached_name_lookup("After") == "sim-repo"
+
+    asyncio.run(repository.update("sim-repo", {"world_state": {"day": 3}}))
+    assert repository._cached_name_lookup("After") is None
+    assert repository._cached_name_lookup("Other") == "sim-other"
+    assert repository._name_by_id == {"sim-other": "Other"}
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from scrai.models import SimulationState
+
+
+def _simulation() -> SimulationState:
+    simulation = SimulationState(id="sim-state", name="State", active_actor_ids=["a1", "a2"])
+    simulation.clear_dirty()
+    return simulation
+
+
+def test_id_lists_are_read_only() -> None:
+    simulation = _simulation()
+
+    assert simulation.active_actor_ids == ("a1", "a2")
+    with pytest.raises(AttributeError):
+        simulation.active_actor_ids.append("a3")  # type: ignore[attr-defined]
+
+
+def test_add_and_remove_keep_index_in_sync() -> None:
+    simulation = _simulation()
+
+    simulation.add_actor("a3")
+    simulation.add_actor("a3")
+    simulation.add_actors(["a1", "a4", "a4"])
+    simulation.remove_actor("a2")
+
+    assert simulation.active_actor_ids == ("a1", "a3", "a4")
+    simulation.add_actor("a2")
+    assert simulation.active_actor_ids == ("a1", "a3", "a4", "a2")
+    assert simulation.dirty_fields == {"active_actor_ids", "updated_at"}
+
+
+def test_assignment_resyncs_index_and_marks_dirty() -> None:
+    simulation = _simulation()
+
+    simulation.active_actor_ids = ["a9"]  # type: ignore[assignment]
+
+    assert simulation.active_actor_ids == ("a9",)
+    assert simulation.dirty_fields == {"active_actor_ids"}
+    simulation.add_actor("a1")
+    assert simulation.active_actor_ids == ("a9", "a1")
+
+
+def test_assigning_equal_ids_is_not_a_change() -> None:
+    simulation = _simulation()
+
+    simulation.active_actor_ids = ["a1", "a2"]  # type: ignore[assignment]
+
+    assert simulation.dirty_fields == frozenset()
+
+
+@pytest.mark.parametrize("make_copy", [SimulationState.model_copy, copy.copy, copy.deepcopy])
+def test_copies_do_not_share_indices_or_dirty_set(make_copy) -> None:
+    simulation = _simulation()
+    copied = make_copy(simulation)
+
+    copied.add_actor("a3")
+    copied.remove_actor("a1")
+
+    assert simulation.active_actor_ids == ("a1", "a2")
+    assert simulation.dirty_fields == frozenset()
+    simulation.add_actor("a3")
+    assert simulation.active_actor_ids == ("a1", "a2", "a3")
+
+
+def test_model_copy_update_resyncs_index() -> None:
+    copied = _simulation().model_copy(update={"active_actor_ids": ["b1"]})
+
+    assert copied.active_actor_ids == ("b1",)
+    copied.add_actor("a1")
+    assert copied.active_actor_ids == ("b1", "a1")
+
+
+def test_from_firestore_prefers_document_id_without_marking_dirty() -> None:
+    stored = _simulation().to_dict()
+    stored["id"] = "stale-id"
+
+    simulation = SimulationState.from_firestore("sim-doc", stored)
+
+    assert simulation.id == "sim-doc"
+    assert stored["id"] == "stale-id"
+    assert simulation.dirty_fields == frozenset()
+    del stored["id"]
+    assert SimulationState.from_firestore("sim-doc", stored).id == "sim-doc"
+
+
+def test_to_patch_serializes_only_dirty_fields() -> None:
+    simulation = _simulation()
+    simulation.add_actor("a3")
+    simulation.update_world_state({"weather": "rain"})
+
+    patch = simulation.to_patch()
+
+    assert set(patch) == {"active_actor_ids", "world_state", "updated_at"}
+    assert patch["active_actor_ids"] == ["a1", "a2", "a3"]
+    assert patch["world_state"] == {"weather": "rain"}
+    assert simulation.to_patch(["name"]) == {"name": "State"}